@@ -0,0 +1,139 @@
+"""
+Batch project summary generation with bounded fan-out and 429 retries
+"""
+
+import asyncio
+import random
+from typing import AsyncIterator, Dict, List, Optional
+from uuid import UUID
+
+from openai import RateLimitError
+from sqlalchemy import Text, column, func, select, update, values
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+
+from app.ai.service import AIService
+from app.ai.config import (
+    AI_BATCH_CONCURRENCY,
+    AI_BATCH_MAX_RETRIES,
+    AI_BATCH_MAX_RETRY_DELAY_SECONDS,
+    AI_BATCH_RETRY_BASE_SECONDS,
+)
+from app.ai.schemas import ProjectSummaryBatchItem, ProjectSummaryBatchRequest
+from app.database import AsyncSessionLocal
+from app.projects.models import Project
+
+def _retry_delay(error: RateLimitError, attempt: int) -> float:
+    """
+    Honour Retry-After when the API sends it, else exponential backoff with jitter
+    
+    Either way the wait is capped at AI_BATCH_MAX_RETRY_DELAY_SECONDS, so one
+    large Retry-After can't hold a batch request (and its connection) open.
+    """
+    retry_after = error.response.headers.get("retry-after") if error.response is not None else None
+    try:
+        delay = max(float(retry_after), 0)
+    except (TypeError, ValueError):
+        delay = AI_BATCH_RETRY_BASE_SECONDS * (2 ** attempt) * (1 + random.random() / 2)
+    return min(delay, AI_BATCH_MAX_RETRY_DELAY_SECONDS)
+
+async def summarize_with_retry(project_info: dict, bypass_cache: bool = False) -> str:
+    """
+    Generate one project summary, retrying with backoff on rate limits
+    
+    The client's own retries are turned off for these calls, so an item
+    makes at most AI_BATCH_MAX_RETRIES + 1 upstream requests.
+    
+    Raises:
+        Exception: The last error once retries are exhausted
+    """
+    for attempt in range(AI_BATCH_MAX_RETRIES + 1):
+        try:
+            return await AIService.complete_project_summary(project_info, bypass_cache, max_retries=0)
+        except RateLimitError as e:
+            if attempt == AI_BATCH_MAX_RETRIES:
+                raise
+            await asyncio.sleep(_retry_delay(e, attempt))
+
+async def _load_projects(project_ids: List[UUID]) -> Dict[UUID, dict]:
+    """Load the fields used in the prompt for many projects in one query"""
+    if not project_ids:
+        return {}
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            select(Project.id, Project.title, Project.description, Project.tech_stack)
+            .where(Project.id.in_(project_ids))
+        )
+        return {
+            row.id: {"title": row.title, "description": row.description, "tech_stack": row.tech_stack or []}
+            for row in result
+        }
+
+async def write_back_summaries(summaries: Dict[UUID, str]) -> int:
+    """
+    Save many project summaries with a single UPDATE ... FROM (VALUES ...)
+    
+    Returns:
+        Number of projects updated
+    """
+    if not summaries:
+        return 0
+    
+    rows = values(column("id", PG_UUID(as_uuid=True)), column("summary", Text), name="new_summaries").data(
+        list(summaries.items())
+    )
+    statement = (
+        update(Project.__table__)
+        .where(Project.__table__.c.id == rows.c.id)
+        .values(summary=rows.c.summary, updated_at=func.now())
+    )
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(statement)
+        await db.commit()
+        return result.rowcount
+
+async def run_batch(request: ProjectSummaryBatchRequest) -> AsyncIterator[ProjectSummaryBatchItem]:
+    """
+    Generate summaries for every item in a batch, yielding results as they finish
+    
+    Items are `request.items` followed by `request.project_ids`. An inline
+    item's own `bypass_cache` is honoured as well as the request's. At most
+    AI_BATCH_CONCURRENCY of them are in flight at once (on top of the
+    service-wide semaphore).
+    """
+    projects = await _load_projects(request.project_ids)
+    # An inline item skips the cache if it or the whole batch asks to
+    jobs: List[tuple] = [
+        (i, None, item.model_dump(exclude={"bypass_cache"}), request.bypass_cache or item.bypass_cache)
+        for i, item in enumerate(request.items)
+    ]
+    offset = len(jobs)
+    jobs += [
+        (offset + i, project_id, projects.get(project_id), request.bypass_cache)
+        for i, project_id in enumerate(request.project_ids)
+    ]
+    
+    limit = asyncio.Semaphore(AI_BATCH_CONCURRENCY)
+    
+    async def run(
+        index: int,
+        project_id: Optional[UUID],
+        project_info: Optional[dict],
+        bypass_cache: bool
+    ) -> ProjectSummaryBatchItem:
+        if project_info is None:
+            return ProjectSummaryBatchItem(index=index, project_id=project_id, success=False, error="Project not found")
+        async with limit:
+            try:
+                content = await summarize_with_retry(project_info, bypass_cache)
+                return ProjectSummaryBatchItem(index=index, project_id=project_id, content=content, success=True)
+            except Exception as e:
+                return ProjectSummaryBatchItem(index=index, project_id=project_id, success=False, error=str(e))
+    
+    tasks = [asyncio.ensure_future(run(*job)) for job in jobs]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        # Stop outstanding work if the consumer went away
+        for task in tasks:
+            task.cancel()
@@ -0,0 +1,189 @@
+"""
+Content-addressed cache for AI generations
+"""
+
+import asyncio
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+from app.ai.config import AI_CACHE_BACKEND, AI_CACHE_PATH, AI_CACHE_MAX_ENTRIES, AI_CACHE_TTL_SECONDS
+from app.utils.metrics import Counter
+
+_WHITESPACE = re.compile(r"\s+")
+
+def cache_key(model: str, temperature: float, max_tokens: int, messages: List[Dict[str, str]]) -> str:
+    """
+    Hash a completion request into a cache key
+    
+    Message text is whitespace-normalized so formatting-only differences in
+    a prompt map to the same entry.
+    """
+    normalized = {
+        "model": model,
+        "temperature": temperature,
+        "max_tokens": max_tokens,
+        "messages": [
+            {"role": m["role"], "content": _WHITESPACE.sub(" ", m["content"]).strip()}
+            for m in messages
+        ],
+    }
+    raw = json.dumps(normalized, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+class AICache:
+    """Base class for cache backends (subclasses implement _get/_set)"""
+    
+    backend = "none"
+    
+    def __init__(self, max_entries: int = AI_CACHE_MAX_ENTRIES, ttl_seconds: float = AI_CACHE_TTL_SECONDS):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.hits = Counter("ai_cache_hits_total", "AI generations served from cache")
+        self.misses = Counter("ai_cache_misses_total", "AI generations that went upstream")
+    
+    async def get(self, key: str) -> Optional[str]:
+        value = await self._get(key)
+        (self.hits if value is not None else self.misses).inc()
+        return value
+    
+    async def set(self, key: str, value: str):
+        await self._set(key, value)
+    
+    async def peek(self, key: str) -> Optional[str]:
+        """Look up a key without counting it as a hit or miss"""
+        return await self._get(key)
+    
+    async def _get(self, key: str) -> Optional[str]:
+        return None
+    
+    async def _set(self, key: str, value: str):
+        pass
+    
+    async def size(self) -> int:
+        return 0
+    
+    async def stats(self) -> Dict[str, object]:
+        """Get backend, size and hit-rate counters"""
+        hits, misses = self.hits.snapshot(), self.misses.snapshot()
+        total = hits + misses
+        return {
+            "backend": self.backend,
+            "entries": await self.size(),
+            "max_entries": self.max_entries,
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / total, 4) if total else 0.0,
+        }
+
+class MemoryAICache(AICache):
+    """In-process LRU + TTL cache (one per worker)"""
+    
+    backend = "memory"
+    
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    async def _get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+    
+    async def _set(self, key: str, value: str):
+        with self._lock:
+            self._entries[key] = (time.time() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    async def size(self) -> int:
+        return len(self._entries)
+
+class SQLiteAICache(AICache):
+    """
+    SQLite-file cache shared by every worker on the host
+    
+    Entries are evicted by TTL and, past `max_entries`, least recently used
+    first. Queries run in a thread so the event loop never waits on disk.
+    """
+    
+    backend = "sqlite"
+    
+    def __init__(self, path: str = AI_CACHE_PATH, **kwargs):
+        super().__init__(**kwargs)
+        self.path = path
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS ai_cache ("
+                " key TEXT PRIMARY KEY, value TEXT NOT NULL,"
+                " expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS ix_ai_cache_accessed_at ON ai_cache (accessed_at)")
+    
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+        try:
+            yield conn
+        finally:
+            conn.close()
+    
+    def _get_sync(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT value FROM ai_cache WHERE key = ? AND expires_at > ?", (key, now)
+            ).fetchone()
+            if row is not None:
+                conn.execute("UPDATE ai_cache SET accessed_at = ? WHERE key = ?", (now, key))
+        return row[0] if row else None
+    
+    def _set_sync(self, key: str, value: str):
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO ai_cache (key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, value, now + self.ttl_seconds, now)
+            )
+            conn.execute("DELETE FROM ai_cache WHERE expires_at <= ?", (now,))
+            conn.execute(
+                "DELETE FROM ai_cache WHERE key IN ("
+                " SELECT key FROM ai_cache ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,)
+            )
+    
+    async def _get(self, key: str) -> Optional[str]:
+        return await asyncio.to_thread(self._get_sync, key)
+    
+    async def _set(self, key: str, value: str):
+        await asyncio.to_thread(self._set_sync, key, value)
+    
+    def _size_sync(self) -> int:
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM ai_cache").fetchone()[0]
+    
+    async def size(self) -> int:
+        return await asyncio.to_thread(self._size_sync)
+
+def create_cache(backend: str = AI_CACHE_BACKEND) -> AICache:
+    """Create the cache backend named by AI_CACHE_BACKEND (memory, sqlite or none)"""
+    if backend == "memory":
+        return MemoryAICache()
+    if backend == "sqlite":
+        return SQLiteAICache()
+    return AICache()
@@ -11,7 +11,44 @@ load_dotenv("env.local")
 # OpenAI Configuration
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-3.5-turbo")
+OPENAI_BASE_URL = os.getenv("OPENAI_BASE_URL")  # Optional: proxy or OpenAI-compatible server
 
 # AI Settings
-MAX_TOKENS = 500  # Maximum length of AI response
+MAX_TOKENS = int(os.getenv("AI_MAX_TOKENS", "500"))  # Upper bound for every task's answer length
 TEMPERATURE = 0.7  # Controls creativity (0.0 = very focused, 1.0 = very creative)
+
+# Per-task answer caps (bios and summaries are 1-3 sentences)
+AI_MAX_TOKENS_BIO = int(os.getenv("AI_MAX_TOKENS_BIO", "150"))
+AI_MAX_TOKENS_PROJECT_SUMMARY = int(os.getenv("AI_MAX_TOKENS_PROJECT_SUMMARY", "150"))
+AI_MAX_TOKENS_BLOG_SUMMARY = int(os.getenv("AI_MAX_TOKENS_BLOG_SUMMARY", "100"))
+
+# Prompt input budgets: longer free text is truncated before sending
+AI_DESCRIPTION_TOKEN_BUDGET = int(os.getenv("AI_DESCRIPTION_TOKEN_BUDGET", "400"))
+AI_BLOG_CONTENT_TOKEN_BUDGET = int(os.getenv("AI_BLOG_CONTENT_TOKEN_BUDGET", "1500"))
+
+# Pricing for cost estimates, in USD per million tokens (defaults to the
+# built-in price list for the model; set both to price other models)
+AI_PRICE_INPUT_PER_MILLION = os.getenv("AI_PRICE_INPUT_PER_MILLION")
+AI_PRICE_OUTPUT_PER_MILLION = os.getenv("AI_PRICE_OUTPUT_PER_MILLION")
+
+# Client settings
+OPENAI_TIMEOUT_SECONDS = float(os.getenv("OPENAI_TIMEOUT_SECONDS", "30"))  # Per-call timeout
+OPENAI_MAX_RETRIES = int(os.getenv("OPENAI_MAX_RETRIES", "2"))
+OPENAI_MAX_CONNECTIONS = int(os.getenv("OPENAI_MAX_CONNECTIONS", "20"))  # Shared connection pool size
+AI_MAX_CONCURRENCY = int(os.getenv("AI_MAX_CONCURRENCY", "10"))  # In-flight generations per worker
+
+# Generation cache settings
+AI_CACHE_BACKEND = os.getenv("AI_CACHE_BACKEND", "memory")  # memory, sqlite (shared across workers) or none
+AI_CACHE_PATH = os.getenv("AI_CACHE_PATH", "ai_cache.sqlite3")  # Used by the sqlite backend
+AI_CACHE_MAX_ENTRIES = int(os.getenv("AI_CACHE_MAX_ENTRIES", "1000"))
+AI_CACHE_TTL_SECONDS = float(os.getenv("AI_CACHE_TTL_SECONDS", "86400"))
+
+# Request coalescing: how long a worker may hold the cross-worker lock for one prompt
+AI_LOCK_TTL_SECONDS = float(os.getenv("AI_LOCK_TTL_SECONDS", "120"))
+
+# Batch generation settings
+AI_BATCH_MAX_ITEMS = int(os.getenv("AI_BATCH_MAX_ITEMS", "100"))  # Items per batch request
+AI_BATCH_CONCURRENCY = int(os.getenv("AI_BATCH_CONCURRENCY", "5"))  # In-flight items per batch
+AI_BATCH_MAX_RETRIES = int(os.getenv("AI_BATCH_MAX_RETRIES", "3"))  # Retries per item on 429
+AI_BATCH_RETRY_BASE_SECONDS = float(os.getenv("AI_BATCH_RETRY_BASE_SECONDS", "1"))  # Backoff base
+AI_BATCH_MAX_RETRY_DELAY_SECONDS = float(os.getenv("AI_BATCH_MAX_RETRY_DELAY_SECONDS", "30"))  # Cap on Retry-After
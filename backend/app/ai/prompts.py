@@ -0,0 +1,205 @@
+"""
+Prompt builder for AI generation tasks
+
+Templates are compacted once at import (no indentation or blank lines),
+long free-text inputs are truncated to a token budget, and each task has
+its own max_tokens sized to the answer it asks for. Tokens are counted
+with tiktoken when it is installed and its encoding loads, otherwise
+estimated at ~4 characters per token.
+"""
+
+import math
+from typing import List, NamedTuple, Optional
+
+from app.ai.config import (
+    OPENAI_MODEL,
+    MAX_TOKENS,
+    AI_MAX_TOKENS_BIO,
+    AI_MAX_TOKENS_PROJECT_SUMMARY,
+    AI_MAX_TOKENS_BLOG_SUMMARY,
+    AI_DESCRIPTION_TOKEN_BUDGET,
+    AI_BLOG_CONTENT_TOKEN_BUDGET,
+)
+
+try:
+    import tiktoken
+except ImportError:  # Optional: fall back to a character-based estimate
+    tiktoken = None
+
+# System messages describing the writer's role for each task
+BIO_SYSTEM_PROMPT = "You are a professional bio writer specializing in developer portfolios."
+PROJECT_SUMMARY_SYSTEM_PROMPT = "You are a technical writer specializing in project descriptions for developer portfolios."
+BLOG_SUMMARY_SYSTEM_PROMPT = "You are an editor writing short teasers for developer blog posts."
+
+# Rough characters per token for English text when tiktoken is unavailable
+CHARS_PER_TOKEN = 4
+
+def _compact(template: str) -> str:
+    """Strip indentation and blank lines from a template"""
+    return "\n".join(line.strip() for line in template.strip().splitlines() if line.strip())
+
+BIO_TEMPLATE = _compact("""
+    Write a {tone} portfolio bio for {name}.
+    Current role: {current_role}
+    Skills: {skills}
+    Requirements:
+    - {tone_instructions}
+    - Highlight their role and key skills
+    - Include passion for technology and development
+    - 2-3 sentences, suitable for a portfolio website
+""")
+
+PROJECT_SUMMARY_TEMPLATE = _compact("""
+    Write a compelling portfolio summary of this project.
+    Title: {title}
+    Description: {description}
+    Tech stack: {tech_stack}
+    Requirements:
+    - Highlight key features and technologies
+    - Explain the problem it solves and its impact
+    - 2-3 sentences, professional and engaging
+""")
+
+BLOG_SUMMARY_TEMPLATE = _compact("""
+    Summarize this blog post in 1-2 engaging sentences that capture its main takeaway and invite readers to continue.
+    Title: {title}
+    Post:
+    {content}
+""")
+
+TONE_INSTRUCTIONS = {
+    "professional": "Professional and formal tone, suitable for corporate environments",
+    "friendly": "Warm and approachable tone, making connections with readers",
+    "funny": "Light-hearted and humorous tone, showing personality while staying professional",
+    "casual": "Relaxed and conversational tone, like talking to a colleague",
+}
+
+class Prompt(NamedTuple):
+    """A ready-to-send prompt for one generation task"""
+    task: str  # Telemetry label (bio, project_summary, blog_summary)
+    system: str
+    user: str
+    max_tokens: int
+
+    @property
+    def messages(self) -> List[dict]:
+        return [
+            {"role": "system", "content": self.system},
+            {"role": "user", "content": self.user}
+        ]
+
+_encoding = None
+_encoding_loaded = False
+
+def load_encoding():
+    """
+    Load the tiktoken encoding for OPENAI_MODEL, once
+    
+    tiktoken may download the BPE file over blocking HTTP, so the API
+    calls this in a thread at startup. If tiktoken is missing or the load
+    fails for any reason, token counts fall back to the character estimate
+    and the load is not retried.
+    """
+    global _encoding, _encoding_loaded
+    if _encoding_loaded:
+        return _encoding
+    _encoding_loaded = True
+    if tiktoken is None:
+        return None
+    try:
+        try:
+            _encoding = tiktoken.encoding_for_model(OPENAI_MODEL)
+        except KeyError:
+            _encoding = tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        print(f"⚠️ tiktoken unavailable, estimating tokens from characters: {e}")
+        _encoding = None
+    return _encoding
+
+def _get_encoding():
+    return load_encoding()
+
+def count_tokens(text: str) -> int:
+    """Count (or estimate) the tokens in a piece of text"""
+    encoding = _get_encoding()
+    if encoding is not None:
+        return len(encoding.encode(text))
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+def count_message_tokens(messages: List[dict]) -> int:
+    """Count (or estimate) the prompt tokens of a chat request"""
+    # Each message carries a few tokens of role/formatting overhead
+    return sum(count_tokens(message["content"]) + 4 for message in messages) + 3
+
+def truncate_to_tokens(text: str, budget: int) -> str:
+    """
+    Shorten text to at most `budget` tokens, cutting at a word boundary
+
+    Returns:
+        The original text if it fits, else the cut text followed by "…"
+    """
+    if count_tokens(text) <= budget:
+        return text
+    encoding = _get_encoding()
+    if encoding is not None:
+        cut = encoding.decode(encoding.encode(text)[:budget])
+    else:
+        cut = text[:budget * CHARS_PER_TOKEN]
+    # Drop the partial last word
+    if " " in cut:
+        cut = cut.rsplit(" ", 1)[0]
+    return cut.rstrip(" ,;:-") + "…"
+
+def _task_max_tokens(task_cap: int) -> int:
+    """Per-task answer cap, never above the global AI_MAX_TOKENS"""
+    return min(task_cap, MAX_TOKENS)
+
+def _join(values: Optional[list], default: str) -> str:
+    return ", ".join(str(value) for value in values) if values else default
+
+def bio_prompt(user_info: dict) -> Prompt:
+    """
+    Build the bio prompt
+
+    Args:
+        user_info: name, current_role, skills and tone_preference
+    """
+    tone = (user_info.get("tone_preference") or "professional").lower()
+    user = BIO_TEMPLATE.format(
+        tone=tone,
+        name=user_info.get("name") or "Developer",
+        current_role=user_info.get("current_role") or "Developer",
+        skills=_join(user_info.get("skills"), "Not specified"),
+        tone_instructions=TONE_INSTRUCTIONS.get(tone, "Professional and engaging tone"),
+    )
+    return Prompt("bio", BIO_SYSTEM_PROMPT, user, _task_max_tokens(AI_MAX_TOKENS_BIO))
+
+def project_summary_prompt(project_info: dict) -> Prompt:
+    """
+    Build the project summary prompt
+
+    Args:
+        project_info: title, description and tech_stack
+    """
+    description = project_info.get("description") or "No description provided"
+    user = PROJECT_SUMMARY_TEMPLATE.format(
+        title=project_info.get("title") or "Project",
+        description=truncate_to_tokens(description, AI_DESCRIPTION_TOKEN_BUDGET),
+        tech_stack=_join(project_info.get("tech_stack"), "Not specified"),
+    )
+    return Prompt(
+        "project_summary", PROJECT_SUMMARY_SYSTEM_PROMPT, user, _task_max_tokens(AI_MAX_TOKENS_PROJECT_SUMMARY)
+    )
+
+def blog_summary_prompt(blog_info: dict) -> Prompt:
+    """
+    Build the blog summary prompt
+
+    Args:
+        blog_info: title and content
+    """
+    user = BLOG_SUMMARY_TEMPLATE.format(
+        title=blog_info.get("title") or "Blog post",
+        content=truncate_to_tokens(blog_info.get("content") or "", AI_BLOG_CONTENT_TOKEN_BUDGET),
+    )
+    return Prompt("blog_summary", BLOG_SUMMARY_SYSTEM_PROMPT, user, _task_max_tokens(AI_MAX_TOKENS_BLOG_SUMMARY))
@@ -2,13 +2,49 @@
 AI router - handles AI-powered content generation endpoints
 """
 
+import json
+from typing import AsyncIterator
+
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from app.ai.service import AIService
-from app.ai.schemas import BioGenerationRequest, ProjectSummaryRequest, AIResponse
+from app.ai.schemas import (
+    BioGenerationRequest,
+    ProjectSummaryRequest,
+    AIResponse,
+    ProjectSummaryBatchRequest,
+    ProjectSummaryBatchResponse,
+)
+from app.ai.batch import run_batch, write_back_summaries
+from app.ai.config import AI_BATCH_MAX_ITEMS
 
 # Create router
 router = APIRouter()
 
+async def _sse_events(chunks: AsyncIterator[str]) -> AsyncIterator[str]:
+    """
+    Encode text deltas as Server-Sent Events
+    
+    Each delta is sent as `data: {"content": ...}`, followed by a final
+    `done` event (or an `error` event). If the client disconnects, Starlette
+    cancels this generator and closing `chunks` aborts the upstream call.
+    """
+    try:
+        async for chunk in chunks:
+            yield f"data: {json.dumps({'content': chunk})}\n\n"
+        yield "event: done\ndata: {}\n\n"
+    except Exception as e:
+        yield f"event: error\ndata: {json.dumps({'detail': str(e)})}\n\n"
+    finally:
+        await chunks.aclose()
+
+def _sse_response(chunks: AsyncIterator[str]) -> StreamingResponse:
+    return StreamingResponse(
+        _sse_events(chunks),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 @router.post("/generate-bio", response_model=AIResponse)
 async def generate_bio(request: BioGenerationRequest):
     """
@@ -27,7 +63,7 @@ async def generate_bio(request: BioGenerationRequest):
         }
         
         # Generate bio using AI
-        generated_bio = await AIService.generate_bio(user_info)
+        generated_bio = await AIService.generate_bio(user_info, bypass_cache=request.bypass_cache)
         
         # Return the response
         return AIResponse(
@@ -60,7 +96,9 @@ async def generate_project_summary(request: ProjectSummaryRequest):
         }
         
         # Generate project summary using AI
-        generated_summary = await AIService.generate_project_summary(project_info)
+        generated_summary = await AIService.generate_project_summary(
+            project_info, bypass_cache=request.bypass_cache
+        )
         
         # Return the response
         return AIResponse(
@@ -75,3 +113,77 @@ async def generate_project_summary(request: ProjectSummaryRequest):
             status_code=500,
             detail=f"Error generating project summary: {str(e)}"
         )
+
+@router.post("/generate-bio/stream")
+async def stream_bio(request: BioGenerationRequest):
+    """
+    Stream a generated bio as Server-Sent Events
+    
+    Tokens are forwarded as soon as the model produces them, so the first
+    words arrive after the model's first-token latency.
+    """
+    user_info = {
+        "name": request.name,
+        "current_role": request.current_role,
+        "skills": request.skills or [],
+        "tone_preference": request.tone_preference,
+    }
+    return _sse_response(AIService.stream_bio(user_info, bypass_cache=request.bypass_cache))
+
+@router.post("/generate-project-summary/stream")
+async def stream_project_summary(request: ProjectSummaryRequest):
+    """
+    Stream a generated project summary as Server-Sent Events
+    """
+    project_info = {
+        "title": request.title,
+        "description": request.description,
+        "tech_stack": request.tech_stack or [],
+    }
+    return _sse_response(AIService.stream_project_summary(project_info, bypass_cache=request.bypass_cache))
+
+@router.post("/generate-project-summaries", response_model=ProjectSummaryBatchResponse)
+async def generate_project_summaries(request: ProjectSummaryBatchRequest, stream: bool = False):
+    """
+    Generate summaries for many projects in one request
+    
+    Items are generated concurrently (bounded) and retried with backoff on
+    rate limits. With `write_back`, summaries for `project_ids` are saved to
+    Project.summary in a single UPDATE. With `stream=true`, results are sent
+    as NDJSON lines in completion order, followed by a totals line.
+    """
+    total = len(request.items) + len(request.project_ids)
+    if total == 0:
+        raise HTTPException(status_code=400, detail="Provide items or project_ids")
+    if total > AI_BATCH_MAX_ITEMS:
+        raise HTTPException(status_code=400, detail=f"Batch too large (max {AI_BATCH_MAX_ITEMS} items)")
+    
+    async def collect_and_save(results):
+        summaries = {
+            item.project_id: item.content
+            for item in results
+            if item.success and item.project_id is not None
+        }
+        return await write_back_summaries(summaries) if request.write_back else 0
+    
+    if stream:
+        async def ndjson_lines():
+            results = []
+            async for item in run_batch(request):
+                results.append(item)
+                yield item.model_dump_json() + "\n"
+            written = await collect_and_save(results)
+            succeeded = sum(item.success for item in results)
+            yield json.dumps({"succeeded": succeeded, "failed": len(results) - succeeded, "written": written}) + "\n"
+        
+        return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
+    
+    results = sorted([item async for item in run_batch(request)], key=lambda item: item.index)
+    written = await collect_and_save(results)
+    succeeded = sum(item.success for item in results)
+    return ProjectSummaryBatchResponse(
+        results=results,
+        succeeded=succeeded,
+        failed=len(results) - succeeded,
+        written=written
+    )
@@ -3,6 +3,7 @@ AI schemas for request/response validation
 """
 
 from pydantic import BaseModel
+from uuid import UUID
 from typing import Optional, List
 
 # Bio generation request
@@ -12,6 +13,7 @@ class BioGenerationRequest(BaseModel):
     current_role: Optional[str] = None  # e.g., "Junior Frontend Developer"
     skills: Optional[List[str]] = None  # e.g., ["React", "Python", "AWS"]
     tone_preference: Optional[str] = "professional"  # professional, friendly, funny, etc.
+    bypass_cache: bool = False  # True to skip cached results and get a fresh variant
     
 
 # Project summary generation request
@@ -20,7 +22,33 @@ class ProjectSummaryRequest(BaseModel):
     title: str  # Required: project title
     description: Optional[str] = None  # Optional: project description
     tech_stack: Optional[List[str]] = None  # Optional: technologies used
+    bypass_cache: bool = False  # True to skip cached results and get a fresh variant
     
+# Batch project summary generation request
+class ProjectSummaryBatchRequest(BaseModel):
+    """Request schema for generating many project summaries at once"""
+    items: List[ProjectSummaryRequest] = []  # Inline project information
+    project_ids: List[UUID] = []  # Existing projects to summarize
+    write_back: bool = False  # Save summaries to Project.summary (project_ids only)
+    bypass_cache: bool = False  # True to skip cached results for every item (inline items may also set their own)
+
+# Result for one item of a batch
+class ProjectSummaryBatchItem(BaseModel):
+    """Per-item result of a batch generation"""
+    index: int  # Position in items followed by project_ids
+    project_id: Optional[UUID] = None  # Set for project_ids items
+    content: Optional[str] = None  # The AI-generated summary
+    success: bool
+    error: Optional[str] = None
+
+# Batch response
+class ProjectSummaryBatchResponse(BaseModel):
+    """Response schema for batch project summary generation"""
+    results: List[ProjectSummaryBatchItem]
+    succeeded: int
+    failed: int
+    written: int = 0  # Projects whose summary was saved
+
 # AI response
 class AIResponse(BaseModel):
     """Response schema for AI-generated content"""
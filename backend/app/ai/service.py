@@ -2,20 +2,156 @@
 AI Service for generating content using OpenAI
 """
 
-from openai import OpenAI
-from typing import Optional
-from app.ai.config import OPENAI_API_KEY, OPENAI_MODEL, MAX_TOKENS, TEMPERATURE
+import asyncio
+import time
+import httpx
+from openai import AsyncOpenAI
+from typing import AsyncIterator, Optional
+from app.ai.config import (
+    OPENAI_API_KEY,
+    OPENAI_MODEL,
+    OPENAI_BASE_URL,
+    TEMPERATURE,
+    OPENAI_TIMEOUT_SECONDS,
+    OPENAI_MAX_RETRIES,
+    OPENAI_MAX_CONNECTIONS,
+    AI_MAX_CONCURRENCY,
+)
+from app.ai import telemetry
+from app.ai.prompts import Prompt, bio_prompt, project_summary_prompt, blog_summary_prompt
+from app.ai.cache import AICache, cache_key, create_cache
+from app.ai.singleflight import SingleFlight, SQLiteLockStore
 
-# Configure OpenAI client
-client = None
-if OPENAI_API_KEY:
-    client = OpenAI(api_key=OPENAI_API_KEY)
+# Shared async OpenAI client and concurrency limit (created lazily, one per worker)
+_client: Optional[AsyncOpenAI] = None
+_semaphore: Optional[asyncio.Semaphore] = None
+_cache: Optional[AICache] = None
+_singleflight: Optional[SingleFlight] = None
+
+def get_client() -> AsyncOpenAI:
+    """
+    Get the shared async OpenAI client, creating it on first use
+    
+    The client keeps a pooled httpx connection so generations reuse
+    keep-alive connections instead of opening a new one per call.
+    """
+    global _client
+    if _client is None:
+        _client = AsyncOpenAI(
+            api_key=OPENAI_API_KEY,
+            base_url=OPENAI_BASE_URL,
+            timeout=OPENAI_TIMEOUT_SECONDS,
+            max_retries=OPENAI_MAX_RETRIES,
+            http_client=httpx.AsyncClient(
+                timeout=OPENAI_TIMEOUT_SECONDS,
+                limits=httpx.Limits(
+                    max_connections=OPENAI_MAX_CONNECTIONS,
+                    max_keepalive_connections=OPENAI_MAX_CONNECTIONS,
+                ),
+            ),
+        )
+    return _client
+
+def get_semaphore() -> asyncio.Semaphore:
+    """Get the semaphore that bounds in-flight generations on this worker"""
+    global _semaphore
+    if _semaphore is None:
+        _semaphore = asyncio.Semaphore(AI_MAX_CONCURRENCY)
+    return _semaphore
+
+def get_cache() -> AICache:
+    """Get the generation cache configured by AI_CACHE_BACKEND"""
+    global _cache
+    if _cache is None:
+        _cache = create_cache()
+    return _cache
+
+def get_singleflight() -> SingleFlight:
+    """
+    Get the request coalescer for identical in-flight prompts
+    
+    With the shared sqlite cache, coalescing also spans workers through a
+    lock table in the same file.
+    """
+    global _singleflight
+    if _singleflight is None:
+        cache = get_cache()
+        locks = SQLiteLockStore(cache.path) if cache.backend == "sqlite" else None
+        _singleflight = SingleFlight(cache, locks)
+    return _singleflight
+
+async def close_client():
+    """Close the shared OpenAI client (called on application shutdown)"""
+    global _client, _semaphore
+    if _client is not None:
+        await _client.close()
+    _client = None
+    _semaphore = None
+
+# Returned instead of calling the model when no API key is set
+NOT_CONFIGURED_MESSAGE = "AI service not configured. Please add OPENAI_API_KEY to your environment variables."
 
 class AIService:
     """Service for AI-powered content generation"""
     
     @staticmethod
-    async def generate_bio(user_info: dict) -> str:
+    async def _chat(prompt: Prompt, bypass_cache: bool = False, max_retries: Optional[int] = None) -> str:
+        """
+        Send a chat completion request without blocking the event loop
+        
+        Identical requests (same model, temperature, token cap and prompt)
+        are answered from the generation cache, and concurrent identical
+        requests share a single upstream call. With `bypass_cache` set, a
+        fresh completion is always requested and replaces the cached one.
+        
+        Args:
+            prompt: System and user messages, task name and answer cap
+            bypass_cache: Always call the model for a fresh variant
+            max_retries: Override the client's OPENAI_MAX_RETRIES (e.g. 0 for
+                callers that retry themselves)
+        
+        Returns:
+            Generated text
+        """
+        key = cache_key(OPENAI_MODEL, TEMPERATURE, prompt.max_tokens, prompt.messages)
+        
+        if bypass_cache:
+            return await AIService._complete(prompt, key, max_retries)
+        
+        cached = await get_cache().get(key)
+        telemetry.record_cache_lookup(OPENAI_MODEL, prompt.task, hit=cached is not None)
+        if cached is not None:
+            return cached
+        
+        return await get_singleflight().do(key, lambda: AIService._complete(prompt, key, max_retries))
+    
+    @staticmethod
+    async def _complete(prompt: Prompt, key: str, max_retries: Optional[int] = None) -> str:
+        """Call the model (bounded by the semaphore), record telemetry and cache the result"""
+        client = get_client() if max_retries is None else get_client().with_options(max_retries=max_retries)
+        async with get_semaphore():
+            start = time.perf_counter()
+            try:
+                response = await client.chat.completions.create(
+                    model=OPENAI_MODEL,
+                    messages=prompt.messages,
+                    max_tokens=prompt.max_tokens,
+                    temperature=TEMPERATURE,
+                    timeout=OPENAI_TIMEOUT_SECONDS
+                )
+            except Exception as e:
+                telemetry.record_error(OPENAI_MODEL, prompt.task, e)
+                raise
+            telemetry.record_completion(
+                OPENAI_MODEL, prompt.task, time.perf_counter() - start, response.usage, response.choices[0].finish_reason
+            )
+        
+        content = response.choices[0].message.content.strip()
+        await get_cache().set(key, content)
+        return content
+    
+    @staticmethod
+    async def generate_bio(user_info: dict, bypass_cache: bool = False) -> str:
         """
         Generate a compelling bio for a user based on their information
         
@@ -25,62 +161,26 @@ class AIService:
                 - current_role: Current job role
                 - skills: List of technical skills
                 - tone_preference: Desired tone (professional, friendly, funny)
+            bypass_cache: Skip the generation cache for a fresh variant
         Returns:
             Generated bio text
         """
         # Check if we have an API key
         if not OPENAI_API_KEY:
-            return "AI service not configured. Please add OPENAI_API_KEY to your environment variables."
-        
-        # Get tone preference and set appropriate instructions
-        tone = user_info.get('tone_preference', 'professional').lower()
-        tone_instructions = {
-            'professional': 'Professional and formal tone, suitable for corporate environments',
-            'friendly': 'Warm and approachable tone, making connections with readers',
-            'funny': 'Light-hearted and humorous tone, showing personality while staying professional',
-            'casual': 'Relaxed and conversational tone, like talking to a colleague'
-        }.get(tone, 'Professional and engaging tone')
+            return NOT_CONFIGURED_MESSAGE
         
         # Create a prompt (instructions) for the AI
-        prompt = f"""
-        Write a {tone} portfolio bio for {user_info.get('name', 'Developer')}.
-        
-        User Information:
-        - Name: {user_info.get('name', 'Developer')}
-        - Current Role: {user_info.get('current_role', 'Developer')}
-        - Skills: {', '.join(user_info.get('skills', []))}
-        
-        
-        Requirements:
-        - {tone_instructions}
-        - Highlight their role and key skills
-        - Include passion for technology and development
-        - Keep it concise (2-3 sentences)
-        - Make it suitable for a portfolio website
-        
-        Generate the bio:
-        """
+        prompt = bio_prompt(user_info)
         
         try:
-            # Send request to OpenAI using new API
-            response = client.chat.completions.create(
-                model=OPENAI_MODEL,
-                messages=[
-                    {"role": "system", "content": "You are a professional bio writer specializing in developer portfolios."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=MAX_TOKENS,
-                temperature=TEMPERATURE
-            )
-            
-            # Return the AI's response
-            return response.choices[0].message.content.strip()
+            # Send request to OpenAI and return the AI's response
+            return await AIService._chat(prompt, bypass_cache=bypass_cache)
             
         except Exception as e:
             return f"Error generating bio: {str(e)}"
     
     @staticmethod
-    async def generate_project_summary(project_info: dict) -> str:
+    async def generate_project_summary(project_info: dict, bypass_cache: bool = False) -> str:
         """
         Generate a compelling project summary based on project information
         
@@ -91,49 +191,184 @@ class AIService:
                 - tech_stack: List of technologies used
                 - github_link: GitHub repository link
                 - demo_link: Demo link (optional)
+            bypass_cache: Skip the generation cache for a fresh variant
         
         Returns:
             Generated project summary
         """
         # Check if we have an API key
         if not OPENAI_API_KEY:
-            return "AI service not configured. Please add OPENAI_API_KEY to your environment variables."
+            return NOT_CONFIGURED_MESSAGE
         
         # Create a prompt for project summary
-        prompt = f"""
-        Generate a compelling project summary for: {project_info.get('title', 'Project')}
+        prompt = project_summary_prompt(project_info)
+        
+        try:
+            # Send request to OpenAI and return the AI's response
+            return await AIService._chat(prompt, bypass_cache=bypass_cache)
+            
+        except Exception as e:
+            return f"Error generating project summary: {str(e)}"
+    
+    @staticmethod
+    async def complete_bio(user_info: dict, bypass_cache: bool = False) -> str:
+        """
+        Generate a bio, raising on failure
+        
+        Raises:
+            RuntimeError: If no API key is configured
+            openai.OpenAIError: If the upstream call fails
+        """
+        if not OPENAI_API_KEY:
+            raise RuntimeError(NOT_CONFIGURED_MESSAGE)
+        return await AIService._chat(bio_prompt(user_info), bypass_cache=bypass_cache)
+    
+    @staticmethod
+    async def complete_project_summary(
+        project_info: dict,
+        bypass_cache: bool = False,
+        max_retries: Optional[int] = None
+    ) -> str:
+        """
+        Generate a project summary, raising on failure
+        
+        Unlike generate_project_summary, errors (including rate limits) are
+        raised instead of returned as text, so callers can retry them.
+        Pass `max_retries=0` to turn off the client's own retries when the
+        caller retries.
+        
+        Raises:
+            RuntimeError: If no API key is configured
+            openai.OpenAIError: If the upstream call fails
+        """
+        if not OPENAI_API_KEY:
+            raise RuntimeError(NOT_CONFIGURED_MESSAGE)
+        return await AIService._chat(
+            project_summary_prompt(project_info), bypass_cache=bypass_cache, max_retries=max_retries
+        )
+    
+    @staticmethod
+    async def complete_blog_summary(blog_info: dict, bypass_cache: bool = False) -> str:
+        """
+        Generate a blog post summary, raising on failure
+        
+        Raises:
+            RuntimeError: If no API key is configured
+            openai.OpenAIError: If the upstream call fails
+        """
+        if not OPENAI_API_KEY:
+            raise RuntimeError(NOT_CONFIGURED_MESSAGE)
+        return await AIService._chat(blog_summary_prompt(blog_info), bypass_cache=bypass_cache)
+    
+    @staticmethod
+    async def _stream_chat(prompt: Prompt, bypass_cache: bool = False) -> AsyncIterator[str]:
+        """
+        Stream a chat completion, yielding text deltas as they arrive
         
-        Project Information:
-        - Title: {project_info.get('title', 'Project')}
-        - Description: {project_info.get('description', 'No description provided')}
-        - Tech Stack: {project_info.get('tech_stack', [])}
-       
+        A cached completion is yielded as a single chunk. Upstream chunks are
+        read by a separate task (see `_read_stream`), so the concurrency slot
+        is freed as soon as the model finishes, however slowly the client
+        reads. If the consumer stops early (e.g. the client disconnected),
+        that task is cancelled and the upstream stream closed, so the
+        remaining tokens are neither generated nor paid for. Only complete
+        generations are cached.
         
-        Requirements:
-        - Highlight key features and technologies
-        - Explain the problem it solves
-        - Mention the impact or results
-        - Keep it concise (2-3 sentences)
-        - Professional and engaging tone
-        - Suitable for a portfolio
+        Args:
+            prompt: System and user messages, task name and answer cap
+            bypass_cache: Always call the model for a fresh variant
         
-        Generate the project summary:
+        Yields:
+            Generated text deltas
         """
+        if not OPENAI_API_KEY:
+            yield NOT_CONFIGURED_MESSAGE
+            return
+        
+        key = cache_key(OPENAI_MODEL, TEMPERATURE, prompt.max_tokens, prompt.messages)
         
+        if not bypass_cache:
+            cached = await get_cache().get(key)
+            telemetry.record_cache_lookup(OPENAI_MODEL, prompt.task, hit=cached is not None)
+            if cached is not None:
+                yield cached
+                return
+        
+        deltas: asyncio.Queue = asyncio.Queue()
+        reader = asyncio.create_task(AIService._read_stream(prompt, key, deltas))
         try:
-            # Send request to OpenAI using new API
-            response = client.chat.completions.create(
-                model=OPENAI_MODEL,
-                messages=[
-                    {"role": "system", "content": "You are a technical writer specializing in project descriptions for developer portfolios."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=MAX_TOKENS,
-                temperature=TEMPERATURE
-            )
-            
-            # Return the AI's response
-            return response.choices[0].message.content.strip()
+            while True:
+                delta = await deltas.get()
+                if delta is None:
+                    break
+                if isinstance(delta, Exception):
+                    raise delta
+                yield delta
+        finally:
+            # Abort the upstream request if we stopped early
+            if not reader.done():
+                reader.cancel()
+            await asyncio.gather(reader, return_exceptions=True)
+    
+    @staticmethod
+    async def _read_stream(prompt: Prompt, key: str, deltas: asyncio.Queue):
+        """
+        Read an upstream completion stream into `deltas` (bounded by the semaphore)
+        
+        Puts each text delta, then None once the completion is cached, or the
+        exception that ended it. The queue is unbounded: it holds at most one
+        answer (`prompt.max_tokens`) for a slow reader.
+        """
+        task = prompt.task
+        parts = []
+        usage = None
+        finish_reason = None
+        try:
+            async with get_semaphore():
+                start = time.perf_counter()
+                try:
+                    stream = await get_client().chat.completions.create(
+                        model=OPENAI_MODEL,
+                        messages=prompt.messages,
+                        max_tokens=prompt.max_tokens,
+                        temperature=TEMPERATURE,
+                        timeout=OPENAI_TIMEOUT_SECONDS,
+                        stream=True,
+                        stream_options={"include_usage": True}  # Final chunk carries token counts
+                    )
+                    try:
+                        async for chunk in stream:
+                            if chunk.usage is not None:
+                                usage = chunk.usage
+                            if not chunk.choices:
+                                continue
+                            finish_reason = chunk.choices[0].finish_reason or finish_reason
+                            delta = chunk.choices[0].delta.content
+                            if delta:
+                                if not parts:
+                                    telemetry.first_token_seconds.labels(model=OPENAI_MODEL, task=task).observe(
+                                        time.perf_counter() - start
+                                    )
+                                parts.append(delta)
+                                deltas.put_nowait(delta)
+                    finally:
+                        await stream.close()
+                except Exception as e:
+                    telemetry.record_error(OPENAI_MODEL, task, e)
+                    raise
+                telemetry.record_completion(OPENAI_MODEL, task, time.perf_counter() - start, usage, finish_reason)
             
+            await get_cache().set(key, "".join(parts).strip())
         except Exception as e:
-            return f"Error generating project summary: {str(e)}"
+            deltas.put_nowait(e)
+        else:
+            deltas.put_nowait(None)
+    
+    @staticmethod
+    def stream_bio(user_info: dict, bypass_cache: bool = False) -> AsyncIterator[str]:
+        """Stream a generated bio token by token (see generate_bio for user_info)"""
+        return AIService._stream_chat(bio_prompt(user_info), bypass_cache)
+    
+    @staticmethod
+    def stream_project_summary(project_info: dict, bypass_cache: bool = False) -> AsyncIterator[str]:
+        """Stream a generated project summary (see generate_project_summary for project_info)"""
+        return AIService._stream_chat(project_summary_prompt(project_info), bypass_cache)
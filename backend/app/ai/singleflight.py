@@ -0,0 +1,130 @@
+"""
+Request coalescing (single-flight) for identical AI prompts
+"""
+
+import asyncio
+import sqlite3
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Awaitable, Callable, Dict, Iterator, Optional
+
+from app.ai.cache import AICache
+from app.ai.config import AI_LOCK_TTL_SECONDS
+
+class SQLiteLockStore:
+    """
+    Expiring per-key locks in a SQLite file shared by every worker on the host
+    
+    A lock left behind by a crashed worker expires after its TTL.
+    """
+    
+    def __init__(self, path: str):
+        self.path = path
+        self.owner = uuid.uuid4().hex
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS ai_locks ("
+                " key TEXT PRIMARY KEY, owner TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+    
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+        try:
+            yield conn
+        finally:
+            conn.close()
+    
+    def _acquire_sync(self, key: str, ttl_seconds: float) -> bool:
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute("DELETE FROM ai_locks WHERE key = ? AND expires_at <= ?", (key, now))
+            cursor = conn.execute(
+                "INSERT OR IGNORE INTO ai_locks (key, owner, expires_at) VALUES (?, ?, ?)",
+                (key, self.owner, now + ttl_seconds)
+            )
+            return cursor.rowcount == 1
+    
+    def _release_sync(self, key: str):
+        with self._connect() as conn:
+            conn.execute("DELETE FROM ai_locks WHERE key = ? AND owner = ?", (key, self.owner))
+    
+    async def acquire(self, key: str, ttl_seconds: float) -> bool:
+        """Try to take the lock for `key`; returns False if another worker holds it"""
+        return await asyncio.to_thread(self._acquire_sync, key, ttl_seconds)
+    
+    async def release(self, key: str):
+        await asyncio.to_thread(self._release_sync, key)
+
+class SingleFlight:
+    """
+    Share one upstream call between concurrent identical requests
+    
+    Within a worker, callers with the same key await the same task. Across
+    workers, the optional lock store elects one leader per key; the others
+    poll the shared cache for the leader's result and only call upstream
+    themselves if the leader gives up or the wait times out.
+    """
+    
+    def __init__(
+        self,
+        cache: AICache,
+        locks: Optional[SQLiteLockStore] = None,
+        lock_ttl_seconds: float = AI_LOCK_TTL_SECONDS,
+        poll_interval: float = 0.05
+    ):
+        self.cache = cache
+        self.locks = locks
+        self.lock_ttl_seconds = lock_ttl_seconds
+        self.poll_interval = poll_interval
+        self._inflight: Dict[str, asyncio.Task] = {}
+    
+    async def do(self, key: str, fn: Callable[[], Awaitable[str]]) -> str:
+        """
+        Run `fn` once for all concurrent callers with the same key
+        
+        `fn` must store its result in the cache so other workers can read it.
+        
+        Args:
+            key: Cache key identifying the request
+            fn: Coroutine function performing the upstream call
+        
+        Returns:
+            The shared result
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._lead(key, fn))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        
+        # Shield so one caller disconnecting does not cancel everyone's call
+        return await asyncio.shield(task)
+    
+    def _forget(self, key: str, task: asyncio.Task):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+    
+    async def _lead(self, key: str, fn: Callable[[], Awaitable[str]]) -> str:
+        if self.locks is None:
+            return await fn()
+        
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.lock_ttl_seconds
+        while True:
+            if await self.locks.acquire(key, self.lock_ttl_seconds):
+                try:
+                    # Another worker may have finished just before we got the lock
+                    value = await self.cache.peek(key)
+                    return value if value is not None else await fn()
+                finally:
+                    await self.locks.release(key)
+            
+            # Another worker is generating this prompt; wait for its result
+            value = await self.cache.peek(key)
+            if value is not None:
+                return value
+            if loop.time() > deadline:
+                return await fn()
+            await asyncio.sleep(self.poll_interval)
@@ -0,0 +1,105 @@
+"""
+Per-call AI telemetry: latency, tokens, cache hits, errors and cost
+
+Every metric is labelled by model and task (bio, project_summary,
+blog_summary), so the HTTP endpoints, batches and background jobs that
+share a task are reported together.
+"""
+
+from typing import Optional, Tuple
+
+from app.ai.config import AI_PRICE_INPUT_PER_MILLION, AI_PRICE_OUTPUT_PER_MILLION
+from app.utils.metrics import Counter, Histogram, MetricFamily
+
+# Upstream calls take seconds, not milliseconds
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 15.0, 30.0, 60.0)
+TOKEN_BUCKETS = (25, 50, 100, 200, 300, 400, 500, 750, 1000, 2000, 4000)
+
+# USD per million (input, output) tokens; longest matching prefix wins
+MODEL_PRICES = {
+    "gpt-3.5-turbo": (0.50, 1.50),
+    "gpt-4o-mini": (0.15, 0.60),
+    "gpt-4o": (2.50, 10.00),
+    "gpt-4-turbo": (10.00, 30.00),
+    "gpt-4.1-nano": (0.10, 0.40),
+    "gpt-4.1-mini": (0.40, 1.60),
+    "gpt-4.1": (2.00, 8.00),
+    "gpt-4": (30.00, 60.00),
+}
+
+LABELS = ("model", "task")
+
+request_seconds = MetricFamily(
+    Histogram, "ai_request_seconds", "Upstream completion latency", LABELS, buckets=LATENCY_BUCKETS
+)
+first_token_seconds = MetricFamily(
+    Histogram, "ai_first_token_seconds", "Time to first streamed token", LABELS, buckets=LATENCY_BUCKETS
+)
+prompt_tokens = MetricFamily(Counter, "ai_prompt_tokens_total", "Prompt tokens sent upstream", LABELS)
+completion_tokens = MetricFamily(Counter, "ai_completion_tokens_total", "Completion tokens received", LABELS)
+completion_tokens_per_call = MetricFamily(
+    Histogram, "ai_completion_tokens", "Completion tokens per call", LABELS, buckets=TOKEN_BUCKETS
+)
+truncated = MetricFamily(Counter, "ai_truncated_total", "Completions cut off by the max_tokens cap", LABELS)
+cost_usd = MetricFamily(Counter, "ai_cost_usd_total", "Estimated upstream cost in USD", LABELS)
+cache_lookups = MetricFamily(
+    Counter, "ai_cache_lookups_total", "Generation cache lookups by result (hit or miss)", LABELS + ("result",)
+)
+errors = MetricFamily(Counter, "ai_errors_total", "Failed upstream calls by exception type", LABELS + ("error",))
+
+ALL_METRICS = (
+    request_seconds,
+    first_token_seconds,
+    prompt_tokens,
+    completion_tokens,
+    completion_tokens_per_call,
+    truncated,
+    cost_usd,
+    cache_lookups,
+    errors,
+)
+
+def model_price(model: str) -> Optional[Tuple[float, float]]:
+    """Get (input, output) USD per million tokens for a model, if known"""
+    if AI_PRICE_INPUT_PER_MILLION and AI_PRICE_OUTPUT_PER_MILLION:
+        return float(AI_PRICE_INPUT_PER_MILLION), float(AI_PRICE_OUTPUT_PER_MILLION)
+    matches = [prefix for prefix in MODEL_PRICES if model.startswith(prefix)]
+    if not matches:
+        return None
+    return MODEL_PRICES[max(matches, key=len)]
+
+def estimate_cost(model: str, input_tokens: int, output_tokens: int) -> float:
+    """Estimate the USD cost of one call (0 for models without a known price)"""
+    price = model_price(model)
+    if price is None:
+        return 0.0
+    return (input_tokens * price[0] + output_tokens * price[1]) / 1_000_000
+
+def record_cache_lookup(model: str, task: str, hit: bool):
+    cache_lookups.labels(model=model, task=task, result="hit" if hit else "miss").inc()
+
+def record_error(model: str, task: str, error: Exception):
+    errors.labels(model=model, task=task, error=type(error).__name__).inc()
+
+def record_completion(model: str, task: str, seconds: float, usage, finish_reason: Optional[str] = None):
+    """
+    Record one finished upstream call
+    
+    Args:
+        model: Model name sent to the API
+        task: Generation task (bio, project_summary, blog_summary)
+        seconds: Wall time of the call
+        usage: The response's usage object (may be None)
+        finish_reason: "length" when the max_tokens cap cut the answer off
+    """
+    request_seconds.labels(model=model, task=task).observe(seconds)
+    if finish_reason == "length":
+        truncated.labels(model=model, task=task).inc()
+    if usage is None:
+        return
+    prompt_tokens.labels(model=model, task=task).inc(usage.prompt_tokens)
+    completion_tokens.labels(model=model, task=task).inc(usage.completion_tokens)
+    completion_tokens_per_call.labels(model=model, task=task).observe(usage.completion_tokens)
+    cost_usd.labels(model=model, task=task).inc(
+        estimate_cost(model, usage.prompt_tokens, usage.completion_tokens)
+    )
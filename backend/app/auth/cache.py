@@ -0,0 +1,137 @@
+"""
+In-process cache of authenticated principals keyed by bearer token
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Optional, Set, Tuple
+from uuid import UUID
+from dotenv import load_dotenv
+
+from app.utils.metrics import Counter
+
+# Load environment variables
+load_dotenv("env.local")
+
+# Cache Configuration
+AUTH_CACHE_MAX_ENTRIES = int(os.getenv("AUTH_CACHE_MAX_ENTRIES", "10000"))
+AUTH_CACHE_TTL_SECONDS = float(os.getenv("AUTH_CACHE_TTL_SECONDS", "60"))
+
+@dataclass(frozen=True)
+class UserSnapshot:
+    """Read-only copy of a user's columns, safe to share across requests"""
+    id: UUID
+    name: str
+    email: Optional[str]
+    github_id: Optional[str]
+    github_username: Optional[str]
+    bio: Optional[str]
+    profile_image: Optional[str]
+    theme_preference: str
+    created_at: datetime
+    updated_at: datetime
+    
+    @classmethod
+    def from_user(cls, user) -> "UserSnapshot":
+        """Create a snapshot from a User model instance"""
+        return cls(
+            id=user.id,
+            name=user.name,
+            email=user.email,
+            github_id=user.github_id,
+            github_username=user.github_username,
+            bio=user.bio,
+            profile_image=user.profile_image,
+            theme_preference=user.theme_preference,
+            created_at=user.created_at,
+            updated_at=user.updated_at,
+        )
+
+class PrincipalCache:
+    """
+    Bounded TTL + LRU cache of (token claims, user snapshot) per bearer token
+    
+    Entries never outlive the token's own `exp` claim. The cache is per
+    worker process, so other workers may serve a changed profile for up to
+    the TTL after `invalidate_user` runs here.
+    """
+    
+    def __init__(self, max_entries: int = AUTH_CACHE_MAX_ENTRIES, ttl_seconds: float = AUTH_CACHE_TTL_SECONDS):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any], UserSnapshot]]" = OrderedDict()
+        self._tokens_by_user: Dict[UUID, Set[str]] = {}
+        self._lock = threading.Lock()
+        self.hits = Counter("auth_cache_hits_total", "Requests authenticated from the principal cache")
+        self.misses = Counter("auth_cache_misses_total", "Requests that had to decode the token and load the user")
+    
+    def get(self, token: str) -> Optional[Tuple[Dict[str, Any], UserSnapshot]]:
+        """
+        Get cached claims and user snapshot for a token
+        
+        Returns:
+            Tuple of (claims, user snapshot) or None if missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(token)
+            if entry is not None and entry[0] > time.time():
+                self._entries.move_to_end(token)
+                self.hits.inc()
+                return entry[1], entry[2]
+            if entry is not None:
+                self._remove(token)
+        self.misses.inc()
+        return None
+    
+    def set(self, token: str, claims: Dict[str, Any], user: UserSnapshot):
+        """Cache claims and user snapshot for a token"""
+        expires_at = time.time() + self.ttl_seconds
+        if "exp" in claims:
+            expires_at = min(expires_at, float(claims["exp"]))
+        
+        with self._lock:
+            if token in self._entries:
+                self._remove(token)
+            self._entries[token] = (expires_at, claims, user)
+            self._tokens_by_user.setdefault(user.id, set()).add(token)
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+    
+    def invalidate_user(self, user_id: UUID):
+        """Drop every cached token for a user (after profile changes or deletion)"""
+        with self._lock:
+            for token in list(self._tokens_by_user.get(user_id, ())):
+                self._remove(token)
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._tokens_by_user.clear()
+    
+    def stats(self) -> Dict[str, Any]:
+        """Get cache size and hit-rate counters"""
+        hits, misses = self.hits.snapshot(), self.misses.snapshot()
+        total = hits + misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / total, 4) if total else 0.0,
+        }
+    
+    def _remove(self, token: str):
+        # Caller must hold the lock
+        _, _, user = self._entries.pop(token)
+        tokens = self._tokens_by_user.get(user.id)
+        if tokens is not None:
+            tokens.discard(token)
+            if not tokens:
+                del self._tokens_by_user[user.id]
+
+# Shared cache instance for this worker
+principal_cache = PrincipalCache()
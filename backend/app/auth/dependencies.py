@@ -2,37 +2,44 @@
 Authentication dependencies for FastAPI
 """
 
+from uuid import UUID
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
 
-from app.database import get_db
+from app.database import AsyncSessionLocal
 from app.users.models import User
 from app.auth.jwt_utils import verify_token
+from app.auth.cache import principal_cache, UserSnapshot
 
 # OAuth2 scheme for Bearer token authentication
 oauth2_scheme = HTTPBearer()
 
 async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(oauth2_scheme),
-    db: Session = Depends(get_db)
-) -> User:
+    credentials: HTTPAuthorizationCredentials = Depends(oauth2_scheme)
+) -> UserSnapshot:
     """
     Get the current authenticated user from JWT token
     
+    Hot tokens are served from the principal cache, skipping both the JWT
+    decode and the user SELECT.
+    
     Args:
         credentials: HTTP Bearer token credentials
-        db: Database session
     
     Returns:
-        Current authenticated user
+        Snapshot of the current authenticated user
     
     Raises:
         HTTPException: If token is invalid or user not found
     """
+    token = credentials.credentials
+    cached = principal_cache.get(token)
+    if cached is not None:
+        return cached[1]
+    
     try:
         # Verify and decode the JWT token
-        payload = verify_token(credentials.credentials)
+        payload = verify_token(token)
         user_id = payload.get("sub")
         
         if user_id is None:
@@ -42,7 +49,8 @@ async def get_current_user(
             )
         
         # Get user from database
-        user = db.query(User).filter(User.id == user_id).first()
+        async with AsyncSessionLocal() as db:
+            user = await db.get(User, UUID(user_id))
         
         if user is None:
             raise HTTPException(
@@ -50,7 +58,9 @@ async def get_current_user(
                 detail="User not found"
             )
         
-        return user
+        snapshot = UserSnapshot.from_user(user)
+        principal_cache.set(token, payload, snapshot)
+        return snapshot
         
     except HTTPException:
         # Re-raise HTTP exceptions
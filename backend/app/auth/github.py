@@ -0,0 +1,117 @@
+"""
+Async GitHub OAuth client
+
+One pooled httpx client is shared by every login (created in the app
+lifespan), so the callback never blocks the event loop and reuses
+keep-alive connections to GitHub.
+"""
+
+import asyncio
+import os
+from typing import Optional
+
+import httpx
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv("env.local")
+
+# GitHub endpoints (overridable for GitHub Enterprise or a local fake)
+GITHUB_OAUTH_URL = os.getenv("GITHUB_OAUTH_URL", "https://github.com")
+GITHUB_API_URL = os.getenv("GITHUB_API_URL", "https://api.github.com")
+
+# Client settings
+GITHUB_TIMEOUT_SECONDS = float(os.getenv("GITHUB_TIMEOUT_SECONDS", "10"))
+GITHUB_MAX_RETRIES = int(os.getenv("GITHUB_MAX_RETRIES", "2"))
+GITHUB_MAX_CONNECTIONS = int(os.getenv("GITHUB_MAX_CONNECTIONS", "20"))
+GITHUB_RETRY_BASE_SECONDS = 0.25
+
+# Transient statuses worth retrying for idempotent requests
+RETRY_STATUSES = {502, 503, 504}
+
+_client: Optional[httpx.AsyncClient] = None
+
+class GitHubError(Exception):
+    """GitHub returned an error or an unusable response"""
+
+def get_client() -> httpx.AsyncClient:
+    """Get the shared GitHub HTTP client, creating it on first use"""
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            timeout=GITHUB_TIMEOUT_SECONDS,
+            # Limits go on the transport: the client ignores its own once a transport is given
+            transport=httpx.AsyncHTTPTransport(
+                retries=GITHUB_MAX_RETRIES,  # Connection failures only; the request was never sent
+                limits=httpx.Limits(
+                    max_connections=GITHUB_MAX_CONNECTIONS,
+                    max_keepalive_connections=GITHUB_MAX_CONNECTIONS,
+                ),
+            ),
+        )
+    return _client
+
+async def close_client():
+    """Close the shared client (called on shutdown)"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+    _client = None
+
+async def _get_with_retry(url: str, **kwargs) -> httpx.Response:
+    """GET with backoff on timeouts and transient 5xx responses"""
+    for attempt in range(GITHUB_MAX_RETRIES + 1):
+        try:
+            response = await get_client().get(url, **kwargs)
+            if response.status_code not in RETRY_STATUSES or attempt == GITHUB_MAX_RETRIES:
+                return response
+        except httpx.TimeoutException:
+            if attempt == GITHUB_MAX_RETRIES:
+                raise
+        await asyncio.sleep(GITHUB_RETRY_BASE_SECONDS * (2 ** attempt))
+
+async def exchange_code(code: str, client_id: str, client_secret: str) -> str:
+    """
+    Exchange an OAuth authorization code for an access token
+
+    Not retried after the request is sent: codes are single-use.
+
+    Raises:
+        GitHubError: If GitHub rejects the code
+        httpx.HTTPError: If GitHub cannot be reached
+    """
+    response = await get_client().post(
+        f"{GITHUB_OAUTH_URL}/login/oauth/access_token",
+        data={
+            "client_id": client_id,
+            "client_secret": client_secret,
+            "code": code
+        },
+        headers={"Accept": "application/json"}
+    )
+    if response.status_code != 200:
+        raise GitHubError("Failed to exchange code for token")
+
+    access_token = response.json().get("access_token")
+    if not access_token:
+        raise GitHubError("Access token not received")
+    return access_token
+
+async def fetch_user(access_token: str) -> dict:
+    """
+    Get the authenticated GitHub user
+
+    Raises:
+        GitHubError: If GitHub does not return the user
+        httpx.HTTPError: If GitHub cannot be reached
+    """
+    response = await _get_with_retry(
+        f"{GITHUB_API_URL}/user",
+        headers={
+            "Authorization": f"token {access_token}",
+            "Accept": "application/vnd.github.v3+json"
+        }
+    )
+    if response.status_code != 200:
+        raise GitHubError("Failed to get user data from GitHub")
+    return response.json()
@@ -2,20 +2,25 @@
 GitHub OAuth routes for authentication
 """
 
-import requests
-from fastapi import APIRouter, Depends, HTTPException, status
+import httpx
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from fastapi.responses import RedirectResponse
-from sqlalchemy.orm import Session
+from sqlalchemy import case, func, or_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
 import os
 from dotenv import load_dotenv
 
-from app.database import get_db
+from app.database import get_async_db
 from app.users.models import User
+from app.auth import github
 from app.auth.jwt_utils import create_access_token
 from app.auth.dependencies import get_current_user
+from app.auth.cache import principal_cache, UserSnapshot
 from app.auth.schemas import TokenResponse
 from app.schemas import UserProfileResponse
-from app.utils.serialization import load_user_with_relationships, serialize_sqlalchemy_to_pydantic
+from app.utils.serialization import load_user_profile, fast_model_response
+from app.utils.etag import fetch_profile_validators, not_modified, set_validators
 
 # Load environment variables
 load_dotenv("env.local")
@@ -28,6 +33,38 @@ FRONTEND_URL = os.getenv("FRONTEND_URL")
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
+def github_user_upsert(github_user: dict):
+    """
+    Build the INSERT ... ON CONFLICT (github_id) DO UPDATE ... RETURNING for a login
+    
+    New users are inserted and returning users get their GitHub profile
+    refreshed, in one round trip and without a select-then-insert race.
+    updated_at only moves when a profile field actually changed, so
+    logging in does not invalidate profile ETags.
+    
+    Args:
+        github_user: User object from the GitHub API
+    
+    Returns:
+        Statement returning the user's id, email and github_id
+    """
+    users = User.__table__
+    profile = {
+        "name": github_user["name"] or github_user["login"],
+        "email": github_user.get("email"),  # Can be None
+        "github_username": github_user["login"],
+        "profile_image": github_user.get("avatar_url"),
+    }
+    statement = insert(users).values(github_id=str(github_user["id"]), **profile)
+    changed = or_(*[users.c[column].is_distinct_from(statement.excluded[column]) for column in profile])
+    return statement.on_conflict_do_update(
+        index_elements=[users.c.github_id],
+        set_={
+            **{column: statement.excluded[column] for column in profile},
+            "updated_at": case((changed, func.now()), else_=users.c.updated_at),
+        },
+    ).returning(users.c.id, users.c.email, users.c.github_id)
+
 @router.get("/github/login")
 async def github_login():
     """
@@ -41,7 +78,7 @@ async def github_login():
     
     # GitHub OAuth authorization URL
     github_auth_url = (
-        "https://github.com/login/oauth/authorize?"
+        f"{github.GITHUB_OAUTH_URL}/login/oauth/authorize?"
         f"client_id={GITHUB_CLIENT_ID}&"
         f"redirect_uri={GITHUB_CALLBACK_URL}&"
         "scope=user:email&"
@@ -51,7 +88,7 @@ async def github_login():
     return RedirectResponse(url=github_auth_url)
 
 @router.get("/github/callback")
-async def github_callback(code: str, state: str, db: Session = Depends(get_db)):
+async def github_callback(code: str, state: str, db: AsyncSession = Depends(get_async_db)):
     """
     Handle GitHub OAuth callback and create/update user
     """
@@ -62,71 +99,14 @@ async def github_callback(code: str, state: str, db: Session = Depends(get_db)):
         )
     
     try:
-        # Exchange authorization code for access token
-        token_response = requests.post(
-            "https://github.com/login/oauth/access_token",
-            data={
-                "client_id": GITHUB_CLIENT_ID,
-                "client_secret": GITHUB_CLIENT_SECRET,
-                "code": code
-            },
-            headers={"Accept": "application/json"}
-        )
-        
-        if token_response.status_code != 200:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Failed to exchange code for token"
-            )
-        
-        token_data = token_response.json()
-        access_token = token_data.get("access_token")
-        
-        if not access_token:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Access token not received"
-            )
-        
-        # Get user data from GitHub
-        user_response = requests.get(
-            "https://api.github.com/user",
-            headers={
-                "Authorization": f"token {access_token}",
-                "Accept": "application/vnd.github.v3+json"
-            }
-        )
+        # Exchange authorization code for access token, then get user data from GitHub
+        access_token = await github.exchange_code(code, GITHUB_CLIENT_ID, GITHUB_CLIENT_SECRET)
+        github_user = await github.fetch_user(access_token)
         
-        if user_response.status_code != 200:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Failed to get user data from GitHub"
-            )
-        
-        github_user = user_response.json()
-        
-        # Check if user exists in database
-        user = db.query(User).filter(User.github_id == str(github_user["id"])).first()
-        
-        if user:
-            # Update existing user
-            user.name = github_user["name"] or github_user["login"]
-            user.email = github_user.get("email")  # Can be None
-            user.github_username = github_user["login"]
-            user.profile_image = github_user.get("avatar_url")
-        else:
-            # Create new user
-            user = User(
-                github_id=str(github_user["id"]),
-                name=github_user["name"] or github_user["login"],
-                email=github_user.get("email"),  # Can be None
-                github_username=github_user["login"],
-                profile_image=github_user.get("avatar_url")
-            )
-            db.add(user)
-        
-        db.commit()
-        db.refresh(user)
+        # Create or update the user in one statement (safe under concurrent logins)
+        user = (await db.execute(github_user_upsert(github_user))).one()
+        await db.commit()
+        principal_cache.invalidate_user(user.id)
         
         # Create JWT token
         token_data = {
@@ -143,6 +123,16 @@ async def github_callback(code: str, state: str, db: Session = Depends(get_db)):
         
     except HTTPException:
         raise
+    except github.GitHubError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except httpx.HTTPError as e:
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail=f"GitHub request failed: {e.__class__.__name__}"
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -150,18 +140,30 @@ async def github_callback(code: str, state: str, db: Session = Depends(get_db)):
         )
 
 @router.get("/me", response_model=UserProfileResponse)
-async def get_current_user_profile(current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
+async def get_current_user_profile(
+    request: Request,
+    limit: int = Query(100, ge=1, le=500),
+    current_user: UserSnapshot = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
     """
     Get current user profile with all related data (projects, blogs, etc.)
-    """
-    # Load user with all relationships using utility function
-    user_with_relations = load_user_with_relationships(db, user_id=str(current_user.id))
     
-    if not user_with_relations:
-        raise HTTPException(status_code=404, detail="User not found")
+    Projects and blogs are the newest `limit` of each; `projects_total` and
+    `blogs_total` tell the client whether to page through the rest.
+    A matching If-None-Match returns 304 after one cheap aggregate query.
+    """
+    etag = await fetch_profile_validators(db, request, current_user.id)
+    cached = not_modified(request, etag, None, private=True)
+    if cached is not None:
+        return cached
     
-    # Clean serialization using Pydantic
-    return serialize_sqlalchemy_to_pydantic(user_with_relations, UserProfileResponse)
+    # Reload the user with both lists in a single query: the cached principal
+    # may predate a write made by another worker
+    profile = await load_user_profile(db, current_user.id, limit=limit)
+    response = fast_model_response(profile)
+    set_validators(response, etag, None, private=True)
+    return response
 
 @router.post("/logout")
 async def logout():
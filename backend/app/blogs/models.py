@@ -2,18 +2,37 @@
 Blogs model - represents the blogs table
 """
 
-from sqlalchemy import Column, String, Text, DateTime, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, Computed, String, Text, DateTime, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID
 from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import deferred, relationship
 from app.database import Base
 import uuid
 
+# Text search configuration for stemming and stop words (the search
+# endpoint must parse queries with the same one)
+SEARCH_CONFIG = "english"
+
+# Title matches rank above summary matches, which rank above body matches
+SEARCH_VECTOR_EXPRESSION = (
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(title, '')), 'A') || "
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(summary, '')), 'B') || "
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(content, '')), 'C')"
+)
+
 class Blog(Base):
     """
     Blog model - represents the blogs table
     """
     __tablename__ = "blogs"
+    __table_args__ = (
+        # Stable ordering for keyset pagination
+        Index("ix_blogs_created_at_id", "created_at", "id"),
+        # Per-user listings ordered by creation time
+        Index("ix_blogs_user_id_created_at_id", "user_id", "created_at", "id"),
+        # Full-text search
+        Index("ix_blogs_search_vector", "search_vector", postgresql_using="gin"),
+    )
     
     # Primary key - UUID for better security
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -26,6 +45,9 @@ class Blog(Base):
     content = Column(Text, nullable=False)
     summary = Column(Text)
     
+    # Full-text search document, kept up to date by Postgres (never loaded by default)
+    search_vector = deferred(Column(TSVECTOR, Computed(SEARCH_VECTOR_EXPRESSION, persisted=True)))
+    
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
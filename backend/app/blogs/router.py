@@ -2,82 +2,168 @@
 Blogs router - handles blog-related endpoints
 """
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
 from uuid import UUID
 
-from app.database import get_db
+from app.database import get_async_db
 from app.blogs.models import Blog
-from app.blogs.schemas import BlogCreate, BlogUpdate, BlogResponse
+from app.blogs.schemas import BlogCreate, BlogUpdate, BlogResponse, BlogSearchResult
+from app.blogs.search import search_statement, search_hits
+from app.schemas import BlogBulkResponse
+from app.utils.pagination import NEXT_CURSOR_HEADER, encode_rank_cursor, paginate
+from app.utils.serialization import fast_list_response, serialize_rows
+from app.utils.bulk import read_bulk_items, bulk_insert
+from app.utils.etag import entity_etag, list_response, not_modified, set_validators
+from app.utils.fieldsets import apply_fieldset
+from app.utils.mutations import FOREIGN_KEY_VIOLATION, update_returning, delete_returning
+from app.utils.export import ExportFormat, export_response
 
 # Create router
 router = APIRouter()
 
 @router.post("/", response_model=BlogResponse)
-def create_blog(blog: BlogCreate, db: Session = Depends(get_db)):
+async def create_blog(blog: BlogCreate, db: AsyncSession = Depends(get_async_db)):
     """
     Create a new blog
     """
     # Create new blog (users can have multiple blogs)
     db_blog = Blog(**blog.dict())
     db.add(db_blog)
-    db.commit()
-    db.refresh(db_blog)
+    await db.commit()
+    await db.refresh(db_blog)
     
     return db_blog
 
+@router.post(
+    "/bulk",
+    response_model=BlogBulkResponse,
+    openapi_extra={"requestBody": {"required": True, "content": {
+        "application/json": {"schema": {"type": "array", "items": {"$ref": "#/components/schemas/BlogCreate"}}},
+        "application/x-ndjson": {"schema": {"type": "string", "description": "One BlogCreate per line"}},
+    }}}
+)
+async def create_blogs_bulk(request: Request, db: AsyncSession = Depends(get_async_db)):
+    """
+    Create many blogs from a JSON array or an NDJSON stream
+    
+    Items are validated one by one and rejected items are reported in
+    `errors` by index. Valid items are inserted with chunked multi-row
+    INSERT ... RETURNING in a single transaction.
+    """
+    valid, errors = await read_bulk_items(request, db, BlogCreate)
+    created = await bulk_insert(db, Blog, [item for _, item in valid])
+    return ORJSONResponse({
+        "created": serialize_rows(created, BlogResponse),
+        "errors": [error.model_dump() for error in errors],
+    })
+
 @router.get("/", response_model=List[BlogResponse])
-def get_blogs(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+async def get_blogs(
+    request: Request,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db)
+):
     """
     Get all blogs with pagination
+    
+    Results are ordered by (created_at, id). Pass the X-Next-Cursor response
+    header back as `cursor` to fetch the next page; `skip` still works.
+    Use `fields` (e.g. `fields=title,summary`) to return only some columns.
+    """
+    query, response_model = apply_fieldset(select(Blog), Blog, BlogResponse, fields)
+    query = paginate(query, Blog, cursor=cursor, skip=skip, limit=limit)
+    result = await db.execute(query)
+    blogs = result.scalars().all()
+    return list_response(request, Blog, blogs, response_model, limit)
+
+@router.get("/export")
+async def export_blogs(
+    export_format: ExportFormat = Query("ndjson", alias="format"),
+    fields: Optional[str] = None,
+    user_id: Optional[UUID] = None
+):
+    """
+    Stream all blogs (or one user's) as NDJSON (default) or CSV
+    
+    Rows are read with a server-side cursor and written as they arrive,
+    so this works for any table size. Use `fields` to export some columns.
     """
-    blogs = db.query(Blog).offset(skip).limit(limit).all()
-    return blogs
+    criteria = [Blog.user_id == user_id] if user_id else []
+    return export_response(Blog, BlogResponse, export_format, fields, criteria)
+
+@router.get("/search", response_model=List[BlogSearchResult])
+async def search_blogs(
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
+    user_id: Optional[UUID] = None,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Full-text search over blog titles, summaries and content
+    
+    `q` uses web search syntax ("quoted phrases", `or`, `-excluded`). Hits
+    are ranked with title matches above summary and content matches, and
+    come with highlighted `title_highlight` and `snippet` fields. Pass the
+    X-Next-Cursor response header back as `cursor` for the next page.
+    """
+    result = await db.execute(search_statement(q, cursor=cursor, limit=limit, user_id=user_id))
+    hits = search_hits(result)
+    response = fast_list_response(hits, BlogSearchResult)
+    if len(hits) == limit:
+        last = hits[-1]
+        response.headers[NEXT_CURSOR_HEADER] = encode_rank_cursor(last["rank"], last["id"])
+    return response
 
 @router.get("/{blog_id}", response_model=BlogResponse)
-def get_blog(blog_id: UUID, db: Session = Depends(get_db)):
+async def get_blog(
+    blog_id: UUID,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db)
+):
     """
     Get a specific blog by ID
+    
+    Sends ETag and Last-Modified; a matching If-None-Match returns 304.
     """
-    blog = db.query(Blog).filter(Blog.id == blog_id).first()
+    blog = await db.get(Blog, blog_id)
     if blog is None:
         raise HTTPException(status_code=404, detail="Blog not found")
+    
+    etag = entity_etag(blog)
+    cached = not_modified(request, etag, blog.updated_at)
+    if cached is not None:
+        return cached
+    
+    set_validators(response, etag, blog.updated_at)
     return blog
 
 @router.put("/{blog_id}", response_model=BlogResponse)
-def update_blog(blog_id: UUID, blog: BlogUpdate, db: Session = Depends(get_db)):
+async def update_blog(blog_id: UUID, blog: BlogUpdate, db: AsyncSession = Depends(get_async_db)):
     """
     Update a specific blog by ID
     """
-    # Check if blog exists
-    db_blog = db.query(Blog).filter(Blog.id == blog_id).first()
-    if db_blog is None:
-        raise HTTPException(status_code=404, detail="Blog not found")
-    
-    # Update blog fields (only non-None values)
-    update_data = blog.dict(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_blog, field, value)
-    
-    # Save changes to database
-    db.commit()
-    db.refresh(db_blog)
-    
-    return db_blog
+    # Update only the fields that were sent, in one UPDATE ... RETURNING
+    return await update_returning(
+        db, Blog, blog_id, blog.dict(exclude_unset=True),
+        not_found="Blog not found",
+        conflicts={FOREIGN_KEY_VIOLATION: "User not found"}
+    )
 
 @router.delete("/{blog_id}")
-def delete_blog(blog_id: UUID, db: Session = Depends(get_db)):
+async def delete_blog(blog_id: UUID, db: AsyncSession = Depends(get_async_db)):
     """
     Delete a specific blog by ID
     """
-    # Check if blog exists
-    db_blog = db.query(Blog).filter(Blog.id == blog_id).first()
-    if db_blog is None:
-        raise HTTPException(status_code=404, detail="Blog not found")
-    
-    # Delete blog from database
-    db.delete(db_blog)
-    db.commit()
+    # Delete in one DELETE ... RETURNING id
+    await delete_returning(db, Blog, blog_id, not_found="Blog not found")
     
     return {"message": "Blog deleted successfully"}
@@ -36,3 +36,19 @@ class BlogResponse(BaseModel):
     
     class Config:
         from_attributes = True  # Allows conversion from SQLAlchemy model
+
+# Search result schema (for GET /search)
+class BlogSearchResult(BaseModel):
+    """Schema for a ranked blog search hit"""
+    id: UUID
+    user_id: UUID
+    title: str
+    summary: Optional[str] = None
+    title_highlight: str  # HTML-escaped title with matches wrapped in <mark>
+    snippet: str  # HTML-escaped content excerpt(s) with matches wrapped in <mark>
+    rank: float
+    created_at: datetime
+    updated_at: datetime
+    
+    class Config:
+        from_attributes = True
@@ -0,0 +1,104 @@
+"""
+Blog full-text search
+
+Matches come from the generated `search_vector` column through its GIN
+index and are ordered by `ts_rank_cd`. Pages are keyed on (rank, id), so
+deep pages cost the same as the first. Highlighting (`ts_headline`) is the
+expensive part and only runs for the rows on the page.
+"""
+
+import html
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import func, literal_column, select, tuple_
+from sqlalchemy.sql import Select
+
+from app.blogs.models import Blog, SEARCH_CONFIG
+from app.utils.pagination import decode_rank_cursor
+
+# Normalization flag for ts_rank_cd: divide by 1 + log(document length)
+# so long posts don't outrank short ones just by repeating a word
+RANK_NORMALIZATION = 1
+
+# ts_headline marks matches with control characters, which are swapped for
+# <mark> tags after the text is HTML-escaped
+_START, _STOP = "\x02", "\x03"
+SNIPPET_OPTIONS = (
+    f"StartSel={_START}, StopSel={_STOP}, MaxWords=35, MinWords=15, "
+    "MaxFragments=2, FragmentDelimiter=\" … \""
+)
+TITLE_OPTIONS = f"StartSel={_START}, StopSel={_STOP}, HighlightAll=true"
+
+def search_statement(
+    q: str,
+    cursor: Optional[str] = None,
+    limit: int = 20,
+    user_id: Optional[UUID] = None
+) -> Select:
+    """
+    Build the ranked, highlighted search query for one page
+    
+    Args:
+        q: Search text in web search syntax ("quoted phrases", OR, -excluded)
+        cursor: Cursor from a previous page
+        limit: Page size
+        user_id: Only search this user's blogs
+    
+    Returns:
+        Select yielding BlogSearchResult columns, best match first
+    
+    Raises:
+        HTTPException: If the cursor is malformed
+    """
+    config = literal_column(f"'{SEARCH_CONFIG}'::regconfig")
+    tsquery = func.websearch_to_tsquery(config, q)
+    rank = func.ts_rank_cd(Blog.search_vector, tsquery, RANK_NORMALIZATION)
+    
+    matches = (
+        select(
+            Blog.id,
+            Blog.user_id,
+            Blog.title,
+            Blog.summary,
+            Blog.content,
+            Blog.created_at,
+            Blog.updated_at,
+            rank.label("rank"),
+        )
+        .where(Blog.search_vector.op("@@")(tsquery))
+        .order_by(rank.desc(), Blog.id.desc())
+        .limit(limit)
+    )
+    if user_id:
+        matches = matches.where(Blog.user_id == user_id)
+    if cursor:
+        matches = matches.where(tuple_(rank, Blog.id) < tuple_(*decode_rank_cursor(cursor)))
+    page = matches.subquery("page")
+    
+    return select(
+        page.c.id,
+        page.c.user_id,
+        page.c.title,
+        page.c.summary,
+        page.c.created_at,
+        page.c.updated_at,
+        page.c.rank,
+        func.ts_headline(config, page.c.title, tsquery, TITLE_OPTIONS).label("title_highlight"),
+        func.ts_headline(config, page.c.content, tsquery, SNIPPET_OPTIONS).label("snippet"),
+    ).order_by(page.c.rank.desc(), page.c.id.desc())
+
+def render_highlight(text: str) -> str:
+    """HTML-escape a ts_headline result and turn its markers into <mark> tags"""
+    return html.escape(text).replace(_START, "<mark>").replace(_STOP, "</mark>")
+
+def search_hits(rows) -> list:
+    """Turn result rows into BlogSearchResult dicts with safe highlights"""
+    return [
+        {
+            **row._mapping,
+            "title_highlight": render_highlight(row.title_highlight),
+            "snippet": render_highlight(row.snippet),
+        }
+        for row in rows
+    ]
@@ -2,12 +2,20 @@
 Database configuration and connection setup
 """
 
-from sqlalchemy import create_engine
+import re
+import time
+from sqlalchemy import create_engine, event, inspect
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy.schema import CreateColumn, CreateIndex
 import os
 from dotenv import load_dotenv
 
+from app.utils.metrics import Counter, Histogram
+
 # Load environment variables from env.local
 load_dotenv("env.local")
 
@@ -16,19 +24,210 @@ DATABASE_URL = os.getenv("DATABASE_URL")
 if not DATABASE_URL:
     raise ValueError("DATABASE_URL environment variable is required. Please check your env.local file.")
 
-# Create SQLAlchemy engine
-engine = create_engine(DATABASE_URL)
+def _async_database_url(url: str):
+    """
+    Derive the asyncpg URL and connect args from a sync PostgreSQL URL
+    
+    asyncpg does not understand libpq's `sslmode` query parameter, so it is
+    moved into the `ssl` connect argument instead.
+    
+    Returns:
+        Tuple of (async URL, connect args)
+    """
+    async_url = make_url(url).set(drivername="postgresql+asyncpg")
+    connect_args = {}
+    sslmode = async_url.query.get("sslmode")
+    if sslmode:
+        async_url = async_url.difference_update_query(["sslmode"])
+        connect_args["ssl"] = sslmode
+    return async_url, connect_args
+
+# Connection pool settings (defaults match SQLAlchemy's, plus pre-ping and recycling)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))  # Seconds to wait for a free connection
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))  # Seconds before a connection is replaced
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() in ("1", "true", "yes")
+DB_STATEMENT_TIMEOUT_MS = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "0"))  # 0 disables the timeout
+
+# Run schema migrations (app.migrate) in the API's startup; set to false when deploys run them once
+DB_MIGRATE_ON_STARTUP = os.getenv("DB_MIGRATE_ON_STARTUP", "true").lower() in ("1", "true", "yes")
+
+POOL_OPTIONS = {
+    "pool_size": DB_POOL_SIZE,
+    "max_overflow": DB_MAX_OVERFLOW,
+    "pool_timeout": DB_POOL_TIMEOUT,
+    "pool_recycle": DB_POOL_RECYCLE,
+    "pool_pre_ping": DB_POOL_PRE_PING,
+}
+
+# Async database URL - derived from DATABASE_URL unless set explicitly
+ASYNC_DATABASE_URL, ASYNC_CONNECT_ARGS = _async_database_url(
+    os.getenv("ASYNC_DATABASE_URL") or DATABASE_URL
+)
+
+# Apply the statement timeout server-side (libpq options for psycopg2, server settings for asyncpg)
+SYNC_CONNECT_ARGS = {}
+if DB_STATEMENT_TIMEOUT_MS:
+    SYNC_CONNECT_ARGS["options"] = f"-c statement_timeout={DB_STATEMENT_TIMEOUT_MS}"
+    ASYNC_CONNECT_ARGS["server_settings"] = {"statement_timeout": str(DB_STATEMENT_TIMEOUT_MS)}
+
+# Create SQLAlchemy engine (schema migrations only: one connection holds the
+# migration lock while the other runs the DDL; disposed once they are done)
+engine = create_engine(
+    DATABASE_URL,
+    connect_args=SYNC_CONNECT_ARGS,
+    pool_size=2,
+    max_overflow=0,
+    pool_pre_ping=DB_POOL_PRE_PING,
+)
+
+# Pool metrics for the async engine
+pool_wait_seconds = Histogram("db_pool_wait_seconds", "Time spent waiting for a pooled connection")
+
+class TimedQueuePool(AsyncAdaptedQueuePool):
+    """
+    Async queue pool that records how long each checkout waits
+    
+    Timed here rather than in a session dependency so every session
+    (API requests, auth, exports, batch and job workers) is covered. The
+    `checkout` event can't do this: it only fires once a connection is
+    already in hand. The time includes opening a new connection and the
+    pre-ping, when those happen.
+    """
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        finally:
+            pool_wait_seconds.observe(time.perf_counter() - start)
+
+# Create async SQLAlchemy engine (used by the API routers)
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    connect_args=ASYNC_CONNECT_ARGS,
+    poolclass=TimedQueuePool,
+    **POOL_OPTIONS
+)
+
+pool_connects = Counter("db_pool_connects_total", "New database connections opened")
+pool_invalidations = Counter("db_pool_invalidations_total", "Connections discarded as stale or broken")
 
-# Create SessionLocal class
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+@event.listens_for(async_engine.sync_engine, "connect")
+def _on_connect(dbapi_connection, connection_record):
+    pool_connects.inc()
+
+@event.listens_for(async_engine.sync_engine, "invalidate")
+def _on_invalidate(dbapi_connection, connection_record, exception):
+    pool_invalidations.inc()
+
+def pool_status() -> dict:
+    """
+    Get live statistics for the async connection pool
+    
+    Returns:
+        Dictionary with pool configuration, current usage and wait times
+    """
+    pool = async_engine.pool
+    return {
+        "pool_size": pool.size(),
+        "max_overflow": DB_MAX_OVERFLOW,
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow": max(pool.overflow(), 0),
+        "connects": pool_connects.snapshot(),
+        "invalidations": pool_invalidations.snapshot(),
+        "wait_seconds": pool_wait_seconds.snapshot(),
+    }
+
+# Create AsyncSessionLocal class (objects stay usable after commit)
+AsyncSessionLocal = sessionmaker(
+    async_engine,
+    class_=AsyncSession,
+    autocommit=False,
+    autoflush=False,
+    expire_on_commit=False,
+)
 
 # Create Base class for models
 Base = declarative_base()
 
-# Dependency to get database session
-def get_db():
-    db = SessionLocal()
-    try:
+# Postgres extensions the models rely on (pg_trgm: trigram indexes for user search)
+REQUIRED_EXTENSIONS = ("pg_trgm",)
+
+def create_extensions(bind):
+    """
+    Create required Postgres extensions if they are missing
+    
+    Runs before `create_all` because indexes may use their operator classes.
+    """
+    with bind.begin() as connection:
+        for extension in REQUIRED_EXTENSIONS:
+            connection.exec_driver_sql(f"CREATE EXTENSION IF NOT EXISTS {extension}")
+
+def data_columns(table) -> list:
+    """
+    Columns of a table that API responses are built from
+    
+    Generated columns (e.g. search vectors) are left out so RETURNING and
+    JSON aggregation don't ship derived data back to the app.
+    """
+    return [column for column in table.columns if column.computed is None]
+
+def add_missing_columns(bind):
+    """
+    Add model columns that don't exist yet
+    
+    `create_all` never alters existing tables, so columns added to existing
+    models (such as generated search columns) are added here with
+    `ADD COLUMN IF NOT EXISTS`. Adding a stored generated column rewrites the
+    table under an exclusive lock, so this runs once per deploy from
+    `app.migrate`, never concurrently.
+    """
+    inspector = inspect(bind)
+    for table in Base.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        existing = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in existing:
+                continue
+            ddl = CreateColumn(column).compile(dialect=bind.dialect)
+            with bind.begin() as connection:
+                connection.exec_driver_sql(f"ALTER TABLE {table.name} ADD COLUMN IF NOT EXISTS {ddl}")
+
+def create_missing_indexes(bind):
+    """
+    Create model indexes that don't exist yet
+    
+    `create_all` only creates indexes together with new tables, so indexes
+    added to existing models are created here instead. They are built with
+    `CREATE INDEX CONCURRENTLY`, so writes to a large table carry on while
+    e.g. a GIN index builds. A concurrent build that failed leaves an
+    invalid index behind; it is dropped and built again.
+    """
+    with bind.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        invalid = set(connection.exec_driver_sql(
+            "SELECT c.relname FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid WHERE NOT i.indisvalid"
+        ).scalars())
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                if index.name in invalid:
+                    connection.exec_driver_sql(f"DROP INDEX CONCURRENTLY IF EXISTS {index.name}")
+                ddl = str(CreateIndex(index, if_not_exists=True).compile(dialect=bind.dialect))
+                connection.exec_driver_sql(re.sub(r"^CREATE (UNIQUE )?INDEX ", r"CREATE \1INDEX CONCURRENTLY ", ddl))
+
+# Indexes that models no longer declare (updated_at changes on every write, so
+# an unused index on it only costs an extra write and blocks HOT updates)
+OBSOLETE_INDEXES = ("ix_users_updated_at", "ix_projects_updated_at", "ix_blogs_updated_at")
+
+def drop_obsolete_indexes(bind):
+    """Drop indexes listed in OBSOLETE_INDEXES, without blocking writes"""
+    with bind.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        for name in OBSOLETE_INDEXES:
+            connection.exec_driver_sql(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+
+# Dependency to get async database session
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
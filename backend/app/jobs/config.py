@@ -0,0 +1,18 @@
+"""
+Background job configuration
+"""
+
+import os
+from dotenv import load_dotenv
+
+# Load environment variables from env.local file
+load_dotenv("env.local")
+
+# Worker settings
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "1"))  # In-process workers per API process (0 = none)
+JOB_POLL_INTERVAL_SECONDS = float(os.getenv("JOB_POLL_INTERVAL_SECONDS", "1"))  # Idle wait between claims
+JOB_LOCK_TIMEOUT_SECONDS = int(os.getenv("JOB_LOCK_TIMEOUT_SECONDS", "300"))  # Running jobs older than this are requeued
+
+# Retry settings
+JOB_MAX_ATTEMPTS = int(os.getenv("JOB_MAX_ATTEMPTS", "3"))
+JOB_RETRY_BASE_SECONDS = float(os.getenv("JOB_RETRY_BASE_SECONDS", "5"))  # Doubled after each failed attempt
@@ -0,0 +1,74 @@
+"""
+Jobs model - represents the jobs table
+"""
+
+from sqlalchemy import Column, String, Text, DateTime, Integer, Boolean, Index, text
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy.sql import func
+from app.database import Base
+import uuid
+
+# Job kinds and the column each one writes back to
+JOB_KINDS = ("bio", "project_summary", "blog_summary")
+
+# Job lifecycle: pending -> running -> succeeded | failed (or back to pending to retry)
+JOB_STATUSES = ("pending", "running", "succeeded", "failed")
+
+class Job(Base):
+    """
+    Job model - represents the jobs table
+    
+    Fields:
+    - id: UUID primary key (auto-generated)
+    - kind: What to generate (bio, project_summary, blog_summary)
+    - target_id: User, project or blog the result is written to
+    - payload: Extra prompt options (e.g. tone_preference)
+    - bypass_cache: Skip the AI generation cache
+    - status: pending, running, succeeded or failed
+    - attempts / max_attempts: Tries so far and the retry limit
+    - result / error: Generated text or the last error message
+    - run_after: Earliest time the job may be claimed
+    - locked_at / locked_by: When and by which worker the job was claimed
+    - created_at / updated_at / finished_at: Timestamps
+    """
+    __tablename__ = "jobs"
+    __table_args__ = (
+        # Claim queue: only pending jobs, oldest runnable first
+        Index(
+            "ix_jobs_pending_run_after",
+            "run_after", "created_at",
+            postgresql_where=text("status = 'pending'"),
+        ),
+        # Finding running jobs whose worker died
+        Index(
+            "ix_jobs_running_locked_at",
+            "locked_at",
+            postgresql_where=text("status = 'running'"),
+        ),
+    )
+    
+    # Primary key - UUID for better security
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    
+    # What to run
+    kind = Column(String(32), nullable=False)
+    target_id = Column(UUID(as_uuid=True), nullable=False)
+    payload = Column(JSONB, nullable=False, server_default=text("'{}'::jsonb"))
+    bypass_cache = Column(Boolean, nullable=False, server_default=text("false"))
+    
+    # State
+    status = Column(String(16), nullable=False, server_default=text("'pending'"))
+    attempts = Column(Integer, nullable=False, server_default=text("0"))
+    max_attempts = Column(Integer, nullable=False, server_default=text("3"))
+    result = Column(Text)
+    error = Column(Text)
+    
+    # Scheduling and claiming
+    run_after = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    locked_at = Column(DateTime(timezone=True))
+    locked_by = Column(String(100))
+    
+    # Timestamps
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    finished_at = Column(DateTime(timezone=True))
@@ -0,0 +1,57 @@
+"""
+Jobs router - enqueue background AI generation and poll for results
+"""
+
+from fastapi import APIRouter, Depends, HTTPException, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from uuid import UUID
+
+from app.database import get_async_db
+from app.jobs.config import JOB_MAX_ATTEMPTS, JOB_POLL_INTERVAL_SECONDS
+from app.jobs.models import Job
+from app.jobs.schemas import JobCreate, JobResponse
+from app.jobs.worker import JOB_TASKS
+
+# Create router
+router = APIRouter()
+
+@router.post("/", response_model=JobResponse, status_code=202)
+async def enqueue_job(job: JobCreate, db: AsyncSession = Depends(get_async_db)):
+    """
+    Enqueue an AI generation job
+    
+    Returns immediately; a worker generates the text and writes it to
+    User.bio, Project.summary or Blog.summary. Poll GET /api/jobs/{id}.
+    """
+    task = JOB_TASKS[job.kind]
+    if await db.get(task.model, job.target_id) is None:
+        raise HTTPException(status_code=404, detail=f"{task.model.__name__} not found")
+    
+    payload = job.dict(include={"current_role", "tone_preference"}, exclude_none=True)
+    db_job = Job(
+        kind=job.kind,
+        target_id=job.target_id,
+        payload=payload,
+        bypass_cache=job.bypass_cache,
+        max_attempts=JOB_MAX_ATTEMPTS
+    )
+    db.add(db_job)
+    await db.commit()
+    await db.refresh(db_job)
+    
+    return db_job
+
+@router.get("/{job_id}", response_model=JobResponse)
+async def get_job(job_id: UUID, response: Response, db: AsyncSession = Depends(get_async_db)):
+    """
+    Get a job's status and, once it has succeeded, its result
+    """
+    job = await db.get(Job, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    
+    # Hint how long to wait before polling again
+    if job.status in ("pending", "running"):
+        response.headers["Retry-After"] = str(max(1, round(JOB_POLL_INTERVAL_SECONDS)))
+    
+    return job
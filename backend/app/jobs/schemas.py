@@ -0,0 +1,37 @@
+"""
+Job schemas for request/response validation
+"""
+
+from uuid import UUID
+from pydantic import BaseModel
+from typing import Literal, Optional
+from datetime import datetime
+
+# Create schema (for POST requests)
+class JobCreate(BaseModel):
+    """Schema for enqueueing an AI generation job"""
+    kind: Literal["bio", "project_summary", "blog_summary"]
+    target_id: UUID  # User (bio), project or blog to write the result to
+    current_role: Optional[str] = None  # Bio only, e.g. "Junior Frontend Developer"
+    tone_preference: Optional[str] = None  # Bio only: professional, friendly, funny, casual
+    bypass_cache: bool = False  # True to skip cached results and get a fresh variant
+
+# Response schema (for GET requests)
+class JobResponse(BaseModel):
+    """Schema for job responses"""
+    id: UUID
+    kind: str
+    target_id: UUID
+    status: str
+    attempts: int
+    max_attempts: int
+    result: Optional[str] = None
+    error: Optional[str] = None
+    run_after: datetime
+    created_at: datetime
+    updated_at: datetime
+    finished_at: Optional[datetime] = None
+    
+    class Config:
+        from_attributes = True  # Allows conversion from SQLAlchemy model
+
@@ -0,0 +1,311 @@
+"""
+Job workers - claim queued AI jobs and write results back
+
+Workers claim jobs with `SELECT ... FOR UPDATE SKIP LOCKED`, so any number
+of workers (in the API process or started separately with
+`python -m app.jobs.worker`) can share the queue without handing out the
+same job twice. Throughput scales with the number of worker processes.
+"""
+
+import argparse
+import asyncio
+import os
+import socket
+from datetime import timedelta
+from typing import Awaitable, Callable, List, NamedTuple, Optional, Tuple
+
+from sqlalchemy import and_, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.ai.service import AIService
+from app.auth.cache import principal_cache
+from app.database import AsyncSessionLocal
+from app.jobs.config import (
+    JOB_LOCK_TIMEOUT_SECONDS,
+    JOB_POLL_INTERVAL_SECONDS,
+    JOB_RETRY_BASE_SECONDS,
+    JOB_WORKERS,
+)
+from app.jobs.models import Job
+from app.users.models import User
+from app.projects.models import Project
+from app.blogs.models import Blog
+
+jobs_table = Job.__table__
+
+class JobTask(NamedTuple):
+    """How to run one kind of job"""
+    model: type  # Model the target_id refers to
+    column: str  # Column the result is written to
+    generate: Callable[[dict, bool], Awaitable[str]]  # AIService method that raises on failure
+
+JOB_TASKS = {
+    "bio": JobTask(User, "bio", AIService.complete_bio),
+    "project_summary": JobTask(Project, "summary", AIService.complete_project_summary),
+    "blog_summary": JobTask(Blog, "summary", AIService.complete_blog_summary),
+}
+
+def claim_statement(worker_id: str):
+    """
+    Build the statement that claims the oldest runnable job
+
+    The subquery locks one pending row and skips rows other workers have
+    already locked, so concurrent claims never block or collide.
+    """
+    next_job = (
+        select(jobs_table.c.id)
+        .where(
+            jobs_table.c.status == "pending",
+            jobs_table.c.run_after <= func.now(),
+            jobs_table.c.attempts < jobs_table.c.max_attempts
+        )
+        .order_by(jobs_table.c.run_after, jobs_table.c.created_at)
+        .limit(1)
+        .with_for_update(skip_locked=True)
+        .scalar_subquery()
+    )
+    return (
+        update(jobs_table)
+        .where(jobs_table.c.id == next_job)
+        .values(
+            status="running",
+            attempts=jobs_table.c.attempts + 1,
+            locked_at=func.now(),
+            locked_by=worker_id,
+            updated_at=func.now()
+        )
+        .returning(jobs_table)
+    )
+
+async def claim_job(worker_id: str):
+    """
+    Claim the next runnable job
+
+    Returns:
+        The claimed job row, or None if the queue is empty
+    """
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(claim_statement(worker_id))
+        job = result.first()
+        await db.commit()
+        return job
+
+async def requeue_stale_jobs() -> Tuple[int, int]:
+    """
+    Recover running jobs whose worker stopped responding to the queue
+    
+    Jobs with attempts left go back to pending. Jobs that have used all
+    their attempts are failed, so a job that crashes or hangs its worker
+    is not reclaimed forever.
+    
+    Returns:
+        Tuple of (jobs requeued, jobs failed)
+    """
+    stale = and_(
+        jobs_table.c.status == "running",
+        jobs_table.c.locked_at < func.now() - timedelta(seconds=JOB_LOCK_TIMEOUT_SECONDS)
+    )
+    async with AsyncSessionLocal() as db:
+        failed = await db.execute(
+            update(jobs_table)
+            .where(stale, jobs_table.c.attempts >= jobs_table.c.max_attempts)
+            .values(
+                status="failed",
+                error="Worker stopped responding on the last attempt",
+                locked_at=None,
+                locked_by=None,
+                finished_at=func.now(),
+                updated_at=func.now()
+            )
+        )
+        requeued = await db.execute(
+            update(jobs_table)
+            .where(stale, jobs_table.c.attempts < jobs_table.c.max_attempts)
+            .values(status="pending", locked_at=None, locked_by=None, updated_at=func.now())
+        )
+        await db.commit()
+        return requeued.rowcount, failed.rowcount
+
+async def _load_prompt_info(db: AsyncSession, job) -> Optional[dict]:
+    """Read the prompt fields for a job's target, or None if it was deleted"""
+    if job.kind == "bio":
+        user = await db.get(User, job.target_id)
+        if user is None:
+            return None
+        # Skills come from the technologies used across the user's projects
+        skills = await db.execute(
+            select(func.unnest(Project.tech_stack).label("skill"))
+            .where(Project.user_id == job.target_id)
+            .distinct()
+        )
+        return {"name": user.name, "skills": sorted(skills.scalars()), **job.payload}
+
+    if job.kind == "project_summary":
+        row = (await db.execute(
+            select(Project.title, Project.description, Project.tech_stack).where(Project.id == job.target_id)
+        )).first()
+        if row is None:
+            return None
+        return {"title": row.title, "description": row.description, "tech_stack": row.tech_stack or []}
+
+    row = (await db.execute(
+        select(Blog.title, Blog.content).where(Blog.id == job.target_id)
+    )).first()
+    if row is None:
+        return None
+    return {"title": row.title, "content": row.content}
+
+def retry_delay(attempts: int) -> timedelta:
+    """Exponential backoff before the next attempt"""
+    return timedelta(seconds=JOB_RETRY_BASE_SECONDS * (2 ** (attempts - 1)))
+
+async def _finish(job, worker_id: str, **values) -> bool:
+    """
+    Update a claimed job, unless another worker has since reclaimed it
+
+    Returns:
+        True if this worker still owned the job
+    """
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            update(jobs_table)
+            .where(jobs_table.c.id == job.id, jobs_table.c.locked_by == worker_id)
+            .values(locked_at=None, locked_by=None, updated_at=func.now(), **values)
+        )
+        await db.commit()
+        return result.rowcount == 1
+
+async def _fail(job, worker_id: str, error: str, retry: bool = True):
+    """Schedule a retry with backoff, or mark the job failed after its last attempt"""
+    if retry and job.attempts < job.max_attempts:
+        await _finish(job, worker_id, status="pending", error=error, run_after=func.now() + retry_delay(job.attempts))
+    else:
+        await _finish(job, worker_id, status="failed", error=error, finished_at=func.now())
+
+async def run_job(job, worker_id: str):
+    """
+    Generate the text for a claimed job and write it back
+
+    The target column and the job row are updated in one transaction, and
+    only if this worker still owns the job.
+    """
+    task = JOB_TASKS.get(job.kind)
+    if task is None:
+        await _fail(job, worker_id, f"Unknown job kind: {job.kind}", retry=False)
+        return
+
+    async with AsyncSessionLocal() as db:
+        prompt_info = await _load_prompt_info(db, job)
+    if prompt_info is None:
+        await _fail(job, worker_id, f"{task.model.__name__} not found", retry=False)
+        return
+
+    try:
+        content = await task.generate(prompt_info, job.bypass_cache)
+    except Exception as e:
+        await _fail(job, worker_id, str(e))
+        return
+
+    async with AsyncSessionLocal() as db:
+        owned = await db.execute(
+            update(jobs_table)
+            .where(jobs_table.c.id == job.id, jobs_table.c.locked_by == worker_id)
+            .values(
+                status="succeeded",
+                result=content,
+                error=None,
+                locked_at=None,
+                locked_by=None,
+                finished_at=func.now(),
+                updated_at=func.now()
+            )
+        )
+        if owned.rowcount == 1:
+            target = task.model.__table__
+            await db.execute(
+                update(target)
+                .where(target.c.id == job.target_id)
+                .values({task.column: content, "updated_at": func.now()})
+            )
+        await db.commit()
+
+    if job.kind == "bio":
+        principal_cache.invalidate_user(job.target_id)
+
+async def worker_loop(worker_id: str, stop: asyncio.Event):
+    """Claim and run jobs until `stop` is set, sleeping while the queue is empty"""
+    while not stop.is_set():
+        try:
+            job = await claim_job(worker_id)
+            if job is not None:
+                await run_job(job, worker_id)
+                continue
+        except Exception as e:
+            print(f"⚠️ Job worker {worker_id}: {e}")
+        try:
+            await asyncio.wait_for(stop.wait(), timeout=JOB_POLL_INTERVAL_SECONDS)
+        except asyncio.TimeoutError:
+            pass
+
+async def reaper_loop(stop: asyncio.Event):
+    """Periodically requeue jobs abandoned by crashed workers"""
+    while not stop.is_set():
+        try:
+            await requeue_stale_jobs()
+        except Exception as e:
+            print(f"⚠️ Job reaper: {e}")
+        try:
+            await asyncio.wait_for(stop.wait(), timeout=JOB_LOCK_TIMEOUT_SECONDS / 2)
+        except asyncio.TimeoutError:
+            pass
+
+class WorkerPool:
+    """A set of worker loops running on the current event loop"""
+
+    def __init__(self, concurrency: int = JOB_WORKERS):
+        self.concurrency = concurrency
+        self._stop = asyncio.Event()
+        self._tasks: List[asyncio.Task] = []
+
+    def start(self):
+        """Start the worker loops and the stale job reaper"""
+        prefix = f"{socket.gethostname()}:{os.getpid()}"
+        self._tasks = [
+            asyncio.create_task(worker_loop(f"{prefix}:{i}", self._stop))
+            for i in range(self.concurrency)
+        ]
+        self._tasks.append(asyncio.create_task(reaper_loop(self._stop)))
+
+    async def stop(self):
+        """Let in-progress jobs finish, then stop all loops"""
+        self._stop.set()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+async def _run_forever(concurrency: int):
+    from app.ai.prompts import load_encoding
+    from app.ai.service import close_client
+    from app.database import async_engine
+
+    await asyncio.to_thread(load_encoding)
+    pool = WorkerPool(concurrency)
+    pool.start()
+    print(f"✅ Job worker started with {concurrency} workers")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await pool.stop()
+        await close_client()
+        await async_engine.dispose()
+
+def main():
+    parser = argparse.ArgumentParser(description="Run background AI job workers")
+    parser.add_argument("--concurrency", type=int, default=max(JOB_WORKERS, 1), help="Jobs run at once by this process")
+    args = parser.parse_args()
+    try:
+        asyncio.run(_run_forever(args.concurrency))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
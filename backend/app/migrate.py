@@ -0,0 +1,56 @@
+"""
+Schema migrations: extensions, tables, added columns, indexes and views
+
+Run once per deploy, before the API starts:
+
+    python -m app.migrate
+
+The API also runs this on startup unless DB_MIGRATE_ON_STARTUP=false. A
+Postgres advisory lock makes concurrent runs (several workers or replicas
+starting together) take turns, so only the first one does the DDL and the
+rest find everything in place.
+"""
+
+from sqlalchemy import func, select
+
+from app.database import (
+    Base,
+    engine,
+    create_extensions,
+    add_missing_columns,
+    create_missing_indexes,
+    drop_obsolete_indexes,
+)
+from app.users.models import User  # noqa: F401 - registers the tables on Base.metadata
+from app.projects.models import Project  # noqa: F401
+from app.blogs.models import Blog  # noqa: F401
+from app.jobs.models import Job  # noqa: F401
+from app.projects.facets import ensure_facets_view
+
+# Arbitrary key for the advisory lock that lets one process migrate at a time
+MIGRATION_LOCK_KEY = 724_202
+
+def migrate(bind=engine):
+    """
+    Bring the database schema up to date with the models
+
+    Blocks until any other process running migrations has finished.
+    """
+    # Autocommit, so the lock holder has no open transaction for
+    # CREATE INDEX CONCURRENTLY to wait on
+    with bind.connect().execution_options(isolation_level="AUTOCOMMIT") as lock:
+        lock.execute(select(func.pg_advisory_lock(MIGRATION_LOCK_KEY)))
+        try:
+            create_extensions(bind)
+            Base.metadata.create_all(bind=bind)
+            add_missing_columns(bind)
+            create_missing_indexes(bind)
+            drop_obsolete_indexes(bind)
+            ensure_facets_view(bind)
+        finally:
+            lock.execute(select(func.pg_advisory_unlock(MIGRATION_LOCK_KEY)))
+
+if __name__ == "__main__":
+    migrate()
+    engine.dispose()
+    print("✅ Database schema is up to date")
@@ -0,0 +1,110 @@
+"""
+Tech-stack facet counts
+
+Counts of projects per technology are kept in a materialized view that is
+refreshed in the background, so directory pages read a few hundred
+precomputed rows instead of unnesting and grouping the whole projects table.
+"""
+
+import asyncio
+import os
+from typing import Optional
+
+from dotenv import load_dotenv
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, func, select, text
+
+from app.database import AsyncSessionLocal
+from app.utils.search import LIKE_ESCAPE, escape_like
+
+# Load environment variables
+load_dotenv("env.local")
+
+TECH_FACETS_REFRESH_SECONDS = float(os.getenv("TECH_FACETS_REFRESH_SECONDS", "300"))  # 0 disables
+
+# Arbitrary key for the advisory lock that lets one process refresh at a time
+REFRESH_LOCK_KEY = 724_201
+
+# The view is created by ensure_facets_view, not by create_all
+tech_facets = Table(
+    "project_tech_facets",
+    MetaData(),
+    Column("tech", String, primary_key=True),
+    Column("project_count", Integer),
+    Column("refreshed_at", DateTime(timezone=True)),
+)
+
+VIEW_DDL = [
+    """
+    CREATE MATERIALIZED VIEW IF NOT EXISTS project_tech_facets AS
+    SELECT tech, count(DISTINCT projects.id)::integer AS project_count, now() AS refreshed_at
+    FROM projects, unnest(projects.tech_stack) AS tech
+    GROUP BY tech
+    """,
+    # Required by REFRESH ... CONCURRENTLY
+    "CREATE UNIQUE INDEX IF NOT EXISTS ix_project_tech_facets_tech ON project_tech_facets (tech)",
+]
+
+def ensure_facets_view(bind):
+    """Create the facet view and its unique index if they don't exist yet"""
+    with bind.begin() as connection:
+        for statement in VIEW_DDL:
+            connection.exec_driver_sql(statement)
+
+def facets_statement(limit: int = 50, prefix: Optional[str] = None):
+    """
+    Build the query for the most used technologies
+    
+    Args:
+        limit: Maximum number of technologies
+        prefix: Only technologies starting with this (case-insensitive)
+    """
+    query = select(tech_facets.c.tech, tech_facets.c.project_count, tech_facets.c.refreshed_at)
+    if prefix:
+        query = query.where(tech_facets.c.tech.ilike(escape_like(prefix) + "%", escape=LIKE_ESCAPE))
+    return query.order_by(tech_facets.c.project_count.desc(), tech_facets.c.tech).limit(limit)
+
+async def refresh_facets() -> bool:
+    """
+    Recompute the facet counts without blocking readers
+    
+    Returns:
+        False if another process was already refreshing
+    """
+    async with AsyncSessionLocal() as db:
+        locked = (await db.execute(select(func.pg_try_advisory_xact_lock(REFRESH_LOCK_KEY)))).scalar()
+        if not locked:
+            return False
+        await db.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY project_tech_facets"))
+        await db.commit()
+        return True
+
+async def refresh_loop(stop: asyncio.Event):
+    """Refresh the facet counts every TECH_FACETS_REFRESH_SECONDS until `stop` is set"""
+    while not stop.is_set():
+        try:
+            await asyncio.wait_for(stop.wait(), timeout=TECH_FACETS_REFRESH_SECONDS)
+        except asyncio.TimeoutError:
+            pass
+        if stop.is_set():
+            break
+        try:
+            await refresh_facets()
+        except Exception as e:
+            print(f"⚠️ Tech facet refresh: {e}")
+
+class FacetRefresher:
+    """Background task that keeps the facet view fresh"""
+
+    def __init__(self):
+        self._stop = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        if TECH_FACETS_REFRESH_SECONDS > 0:
+            self._task = asyncio.create_task(refresh_loop(self._stop))
+
+    async def stop(self):
+        self._stop.set()
+        if self._task is not None:
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
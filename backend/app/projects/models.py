@@ -2,8 +2,8 @@
 Projects model - represents the projects table
 """
 
-from sqlalchemy import Column, String, Text, DateTime, ARRAY, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.database import Base
@@ -26,6 +26,14 @@ class Project(Base):
     - updated_at: Timestamp when project was last updated
     """
     __tablename__ = "projects"
+    __table_args__ = (
+        # Stable ordering for keyset pagination
+        Index("ix_projects_created_at_id", "created_at", "id"),
+        # Per-user listings ordered by creation time
+        Index("ix_projects_user_id_created_at_id", "user_id", "created_at", "id"),
+        # Tech filters (array overlap && / containment @>)
+        Index("ix_projects_tech_stack", "tech_stack", postgresql_using="gin"),
+    )
     
     # Primary key - UUID for better security
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -2,82 +2,184 @@
 Projects router - handles project-related endpoints
 """
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Literal, Optional
 from uuid import UUID
 
-from app.database import get_db
+from app.database import get_async_db
 from app.projects.models import Project
-from app.projects.schemas import ProjectCreate, ProjectUpdate, ProjectResponse
+from app.projects.schemas import ProjectCreate, ProjectUpdate, ProjectResponse, TechFacet
+from app.projects.facets import facets_statement
+from app.schemas import ProjectBulkResponse
+from app.utils.pagination import paginate
+from app.utils.serialization import fast_list_response, serialize_rows
+from app.utils.bulk import read_bulk_items, bulk_insert
+from app.utils.etag import entity_etag, list_response, make_etag, not_modified, set_validators
+from app.utils.fieldsets import apply_fieldset
+from app.utils.mutations import FOREIGN_KEY_VIOLATION, update_returning, delete_returning
+from app.utils.export import ExportFormat, export_response
 
 # Create router
 router = APIRouter()
 
 @router.post("/", response_model=ProjectResponse)
-def create_project(project: ProjectCreate, db: Session = Depends(get_db)):
+async def create_project(project: ProjectCreate, db: AsyncSession = Depends(get_async_db)):
     """
     Create a new project
     """
     # Create new project (users can have multiple projects)
     db_project = Project(**project.dict())
     db.add(db_project)
-    db.commit()
-    db.refresh(db_project)
+    await db.commit()
+    await db.refresh(db_project)
     
     return db_project
 
+@router.post(
+    "/bulk",
+    response_model=ProjectBulkResponse,
+    openapi_extra={"requestBody": {"required": True, "content": {
+        "application/json": {"schema": {"type": "array", "items": {"$ref": "#/components/schemas/ProjectCreate"}}},
+        "application/x-ndjson": {"schema": {"type": "string", "description": "One ProjectCreate per line"}},
+    }}}
+)
+async def create_projects_bulk(request: Request, db: AsyncSession = Depends(get_async_db)):
+    """
+    Create many projects from a JSON array or an NDJSON stream
+    
+    Items are validated one by one and rejected items are reported in
+    `errors` by index. Valid items are inserted with chunked multi-row
+    INSERT ... RETURNING in a single transaction.
+    """
+    valid, errors = await read_bulk_items(request, db, ProjectCreate)
+    created = await bulk_insert(db, Project, [item for _, item in valid])
+    return ORJSONResponse({
+        "created": serialize_rows(created, ProjectResponse),
+        "errors": [error.model_dump() for error in errors],
+    })
+
+def tech_criteria(tech: Optional[List[str]], match: str = "all") -> list:
+    """WHERE clauses for a tech filter, served by the tech_stack GIN index"""
+    if not tech:
+        return []
+    if match == "any":
+        return [Project.tech_stack.overlap(tech)]
+    return [Project.tech_stack.contains(tech)]
+
 @router.get("/", response_model=List[ProjectResponse])
-def get_projects(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+async def get_projects(
+    request: Request,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+    tech: Optional[List[str]] = Query(None),
+    match: Literal["any", "all"] = "all",
+    db: AsyncSession = Depends(get_async_db)
+):
     """
     Get all projects with pagination
+    
+    Results are ordered by (created_at, id). Pass the X-Next-Cursor response
+    header back as `cursor` to fetch the next page; `skip` still works.
+    Use `fields` (e.g. `fields=title,summary`) to return only some columns.
+    Filter by technology with repeated `tech` parameters
+    (`tech=React&tech=AWS`): projects using all of them, or any of them
+    with `match=any`. Names match exactly, as stored in `tech_stack`.
     """
-    projects = db.query(Project).offset(skip).limit(limit).all()
-    return projects
+    criteria = tech_criteria(tech, match)
+    query, response_model = apply_fieldset(select(Project).where(*criteria), Project, ProjectResponse, fields)
+    query = paginate(query, Project, cursor=cursor, skip=skip, limit=limit)
+    result = await db.execute(query)
+    projects = result.scalars().all()
+    return list_response(request, Project, projects, response_model, limit)
+
+@router.get("/export")
+async def export_projects(
+    export_format: ExportFormat = Query("ndjson", alias="format"),
+    fields: Optional[str] = None,
+    user_id: Optional[UUID] = None
+):
+    """
+    Stream all projects (or one user's) as NDJSON (default) or CSV
+    
+    Rows are read with a server-side cursor and written as they arrive,
+    so this works for any table size. Use `fields` to export some columns.
+    """
+    criteria = [Project.user_id == user_id] if user_id else []
+    return export_response(Project, ProjectResponse, export_format, fields, criteria)
+
+@router.get("/tech-facets", response_model=List[TechFacet])
+async def get_tech_facets(
+    request: Request,
+    limit: int = Query(50, ge=1, le=500),
+    prefix: Optional[str] = Query(None, max_length=100),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Get the most used technologies with their project counts
+    
+    Counts come from a materialized view refreshed every
+    TECH_FACETS_REFRESH_SECONDS, so they can lag recent edits by that much.
+    Use `prefix` to narrow the list (e.g. for a typeahead). Sends ETag and
+    Last-Modified of the last refresh; a matching If-None-Match returns 304.
+    """
+    rows = (await db.execute(facets_statement(limit=limit, prefix=prefix))).all()
+    refreshed_at = rows[0].refreshed_at if rows else None
+    etag = make_etag("project_tech_facets", refreshed_at, request.url.query)
+    cached = not_modified(request, etag, refreshed_at)
+    if cached is not None:
+        return cached
+    
+    response = fast_list_response(rows, TechFacet)
+    set_validators(response, etag, refreshed_at)
+    return response
 
 @router.get("/{project_id}", response_model=ProjectResponse)
-def get_project(project_id: UUID, db: Session = Depends(get_db)):
+async def get_project(
+    project_id: UUID,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db)
+):
     """
     Get a specific project by ID
+    
+    Sends ETag and Last-Modified; a matching If-None-Match returns 304.
     """
-    project = db.query(Project).filter(Project.id == project_id).first()
+    project = await db.get(Project, project_id)
     if project is None:
         raise HTTPException(status_code=404, detail="Project not found")
+    
+    etag = entity_etag(project)
+    cached = not_modified(request, etag, project.updated_at)
+    if cached is not None:
+        return cached
+    
+    set_validators(response, etag, project.updated_at)
     return project
 
 @router.put("/{project_id}", response_model=ProjectResponse)
-def update_project(project_id: UUID, project: ProjectUpdate, db: Session = Depends(get_db)):
+async def update_project(project_id: UUID, project: ProjectUpdate, db: AsyncSession = Depends(get_async_db)):
     """
     Update a specific project by ID
     """
-    # Check if project exists
-    db_project = db.query(Project).filter(Project.id == project_id).first()
-    if db_project is None:
-        raise HTTPException(status_code=404, detail="Project not found")
-    
-    # Update project fields (only non-None values)
-    update_data = project.dict(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_project, field, value)
-    
-    # Save changes to database
-    db.commit()
-    db.refresh(db_project)
-    
-    return db_project
+    # Update only the fields that were sent, in one UPDATE ... RETURNING
+    return await update_returning(
+        db, Project, project_id, project.dict(exclude_unset=True),
+        not_found="Project not found",
+        conflicts={FOREIGN_KEY_VIOLATION: "User not found"}
+    )
 
 @router.delete("/{project_id}")
-def delete_project(project_id: UUID, db: Session = Depends(get_db)):
+async def delete_project(project_id: UUID, db: AsyncSession = Depends(get_async_db)):
     """
     Delete a specific project by ID
     """
-    # Check if project exists
-    db_project = db.query(Project).filter(Project.id == project_id).first()
-    if db_project is None:
-        raise HTTPException(status_code=404, detail="Project not found")
-    
-    # Delete project from database
-    db.delete(db_project)
-    db.commit()
+    # Delete in one DELETE ... RETURNING id
+    await delete_returning(db, Project, project_id, not_found="Project not found")
     
     return {"message": "Project deleted successfully"}
@@ -45,3 +45,9 @@ class ProjectResponse(BaseModel):
     
     class Config:
         from_attributes = True  # Allows conversion from SQLAlchemy model
+
+# Tech facet schema (for GET /tech-facets)
+class TechFacet(BaseModel):
+    """Schema for one technology and how many projects use it"""
+    tech: str
+    project_count: int
@@ -24,8 +24,27 @@ class UserProfileResponse(BaseModel):
     theme_preference: str
     created_at: datetime
     updated_at: datetime
-    projects: List[ProjectResponse] = []
-    blogs: List[BlogResponse] = []
+    projects: List[ProjectResponse] = []  # Newest first, capped (see projects_total)
+    blogs: List[BlogResponse] = []  # Newest first, capped (see blogs_total)
+    projects_total: Optional[int] = None  # Total count; page the rest via /api/users/{id}/projects
+    blogs_total: Optional[int] = None  # Total count; page the rest via /api/users/{id}/blogs
     
     class Config:
         from_attributes = True  # Allows conversion from SQLAlchemy model
+
+# Per-item error from a bulk create
+class BulkItemError(BaseModel):
+    """An input item that was rejected, by its position in the request"""
+    index: int
+    error: str
+
+# Bulk create responses
+class ProjectBulkResponse(BaseModel):
+    """Schema for bulk project creation results"""
+    created: List[ProjectResponse]  # Created projects, in input order
+    errors: List[BulkItemError] = []  # Rejected items (not created)
+
+class BlogBulkResponse(BaseModel):
+    """Schema for bulk blog creation results"""
+    created: List[BlogResponse]  # Created blogs, in input order
+    errors: List[BulkItemError] = []  # Rejected items (not created)
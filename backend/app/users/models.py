@@ -2,7 +2,7 @@
 User model - represents the users table
 """
 
-from sqlalchemy import Column, String, Text, DateTime
+from sqlalchemy import Column, String, Text, DateTime, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
@@ -26,6 +26,16 @@ class User(Base):
     - updated_at: Timestamp when user was last updated
     """
     __tablename__ = "users"
+    __table_args__ = (
+        # Stable ordering for keyset pagination
+        Index("ix_users_created_at_id", "created_at", "id"),
+        # Prefix and fuzzy directory search (ILIKE and pg_trgm word similarity)
+        Index("ix_users_name_trgm", "name", postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}),
+        Index(
+            "ix_users_github_username_trgm", "github_username",
+            postgresql_using="gin", postgresql_ops={"github_username": "gin_trgm_ops"}
+        ),
+    )
     
     # Primary key - UUID for better security
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
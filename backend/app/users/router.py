@@ -2,93 +2,235 @@
 Users router - handles user-related endpoints
 """
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Literal, Optional
 from uuid import UUID
 
-from app.database import get_db
+from app.database import get_async_db
 from app.users.models import User
-from app.users.schemas import UserCreate, UserUpdate, UserResponse
+from app.projects.models import Project
+from app.blogs.models import Blog
+from app.users.schemas import UserCreate, UserUpdate, UserResponse, UserSearchResult, UserSuggestion
+from app.users.search import search_query, search_statement
+from app.projects.schemas import ProjectResponse
+from app.blogs.schemas import BlogResponse
+from app.auth.cache import principal_cache
+from app.utils.pagination import NEXT_CURSOR_HEADER, encode_rank_cursor, paginate
+from app.utils.serialization import fast_list_response
+from app.utils.etag import entity_etag, list_response, not_modified, set_validators
+from app.utils.fieldsets import apply_fieldset
+from app.utils.mutations import update_returning, delete_returning
+from app.utils.export import ExportFormat, export_response
 
 # Create router
 router = APIRouter()
 
 @router.post("/", response_model=UserResponse)
-def create_user(user: UserCreate, db: Session = Depends(get_db)):
+async def create_user(user: UserCreate, db: AsyncSession = Depends(get_async_db)):
     """
     Create a new user
     """
     # Check if user with this email already exists
-    existing_user = db.query(User).filter(User.email == user.email).first()
+    result = await db.execute(select(User).where(User.email == user.email))
+    existing_user = result.scalars().first()
     if existing_user:
         raise HTTPException(status_code=400, detail="User with this email already exists")
     
     # Create new user
     db_user = User(**user.dict())
     db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    await db.commit()
+    await db.refresh(db_user)
     
     return db_user
 
 @router.get("/", response_model=List[UserResponse])
-def get_users(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+async def get_users(
+    request: Request,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db)
+):
     """
     Get all users with pagination
+    
+    Results are ordered by (created_at, id). Pass the X-Next-Cursor response
+    header back as `cursor` to fetch the next page; `skip` still works.
+    """
+    query = paginate(select(User), User, cursor=cursor, skip=skip, limit=limit)
+    result = await db.execute(query)
+    users = result.scalars().all()
+    return list_response(request, User, users, UserResponse, limit)
+
+@router.get("/export")
+async def export_users(
+    export_format: ExportFormat = Query("ndjson", alias="format"),
+    fields: Optional[str] = None
+):
+    """
+    Stream all users as NDJSON (default) or CSV
+    
+    Rows are read with a server-side cursor and written as they arrive,
+    so this works for any table size. Use `fields` to export some columns.
     """
-    users = db.query(User).offset(skip).limit(limit).all()
-    return users
+    return export_response(User, UserResponse, export_format, fields)
+
+@router.get("/search", response_model=List[UserSearchResult])
+async def search_users(
+    q: str = Depends(search_query),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Search users by name or GitHub username
+    
+    Matches prefixes of either field and tolerates typos (trigram word
+    similarity). Prefix matches come first, then by similarity. Pass the
+    X-Next-Cursor response header back as `cursor` for the next page.
+    """
+    result = await db.execute(search_statement(q, cursor=cursor, limit=limit))
+    users = result.all()
+    response = fast_list_response(users, UserSearchResult)
+    if len(users) == limit:
+        last = users[-1]
+        response.headers[NEXT_CURSOR_HEADER] = encode_rank_cursor(last.rank, last.id)
+    return response
+
+@router.get("/search/typeahead", response_model=List[UserSuggestion])
+async def suggest_users(
+    q: str = Depends(search_query),
+    limit: int = Query(8, ge=1, le=20),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Suggest users as someone types (id, name and avatar only)
+    
+    Same matching and ranking as /search, but reads only the columns a
+    suggestion list shows and has no pagination.
+    """
+    result = await db.execute(
+        search_statement(q, User.id, User.name, User.profile_image, limit=limit)
+    )
+    return fast_list_response(result.all(), UserSuggestion)
 
 @router.get("/{user_id}", response_model=UserResponse)
-def get_user(user_id: UUID, db: Session = Depends(get_db)):
+async def get_user(
+    user_id: UUID,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db)
+):
     """
     Get a specific user by ID
+    
+    Sends ETag and Last-Modified; a matching If-None-Match returns 304.
     """
-    user = db.query(User).filter(User.id == user_id).first()
+    user = await db.get(User, user_id)
     if user is None:
         raise HTTPException(status_code=404, detail="User not found")
+    
+    etag = entity_etag(user)
+    cached = not_modified(request, etag, user.updated_at)
+    if cached is not None:
+        return cached
+    
+    set_validators(response, etag, user.updated_at)
     return user
 
+@router.get("/{user_id}/projects", response_model=List[ProjectResponse])
+async def get_user_projects(
+    user_id: UUID,
+    request: Request,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    order: Literal["asc", "desc"] = "desc",
+    fields: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Get one user's projects, newest first by default
+    
+    Served from the (user_id, created_at, id) index. Pass the X-Next-Cursor
+    response header back as `cursor` to fetch the next page. Use `fields`
+    to return only some columns.
+    """
+    query, response_model = apply_fieldset(
+        select(Project).where(Project.user_id == user_id), Project, ProjectResponse, fields
+    )
+    query = paginate(
+        query,
+        Project,
+        cursor=cursor,
+        limit=limit,
+        descending=order == "desc"
+    )
+    result = await db.execute(query)
+    projects = result.scalars().all()
+    return list_response(request, Project, projects, response_model, limit)
+
+@router.get("/{user_id}/blogs", response_model=List[BlogResponse])
+async def get_user_blogs(
+    user_id: UUID,
+    request: Request,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    order: Literal["asc", "desc"] = "desc",
+    fields: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Get one user's blogs, newest first by default
+    
+    Served from the (user_id, created_at, id) index. Pass the X-Next-Cursor
+    response header back as `cursor` to fetch the next page. Use `fields`
+    to return only some columns.
+    """
+    query, response_model = apply_fieldset(
+        select(Blog).where(Blog.user_id == user_id), Blog, BlogResponse, fields
+    )
+    query = paginate(
+        query,
+        Blog,
+        cursor=cursor,
+        limit=limit,
+        descending=order == "desc"
+    )
+    result = await db.execute(query)
+    blogs = result.scalars().all()
+    return list_response(request, Blog, blogs, response_model, limit)
+
 @router.put("/{user_id}", response_model=UserResponse)
-def update_user(user_id: UUID, user: UserUpdate, db: Session = Depends(get_db)):
+async def update_user(user_id: UUID, user: UserUpdate, db: AsyncSession = Depends(get_async_db)):
     """
     Update a specific user by ID
     """
-    # Check if user exists
-    db_user = db.query(User).filter(User.id == user_id).first()
-    if db_user is None:
-        raise HTTPException(status_code=404, detail="User not found")
-    
-    # Check if email is being changed and if it already exists
-    if user.email != db_user.email:
-        existing_user = db.query(User).filter(User.email == user.email).first()
-        if existing_user:
-            raise HTTPException(status_code=400, detail="User with this email already exists")
+    # Update only the fields that were sent, in one UPDATE ... RETURNING
+    # (the unique index on email turns a duplicate into a 400)
+    db_user = await update_returning(
+        db, User, user_id, user.dict(exclude_unset=True),
+        not_found="User not found",
+        conflicts={
+            "users_email_key": "User with this email already exists",
+            "users_github_id_key": "User with this GitHub account already exists",
+        }
+    )
     
-    # Update user fields (only non-None values)
-    update_data = user.dict(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_user, field, value)
-    
-    # Save changes to database
-    db.commit()
-    db.refresh(db_user)
+    # Drop cached sessions so the next request sees the new profile
+    principal_cache.invalidate_user(user_id)
     
     return db_user
 
 @router.delete("/{user_id}")
-def delete_user(user_id: UUID, db: Session = Depends(get_db)):
+async def delete_user(user_id: UUID, db: AsyncSession = Depends(get_async_db)):
     """
     Delete a specific user by ID
     """
-    # Check if user exists
-    db_user = db.query(User).filter(User.id == user_id).first()
-    if db_user is None:
-        raise HTTPException(status_code=404, detail="User not found")
-    
-    # Delete user from database
-    db.delete(db_user)
-    db.commit()
+    # Delete in one DELETE ... RETURNING id (projects and blogs cascade in the database)
+    await delete_returning(db, User, user_id, not_found="User not found")
+    principal_cache.invalidate_user(user_id)
     
     return {"message": "User deleted successfully"}
@@ -46,5 +46,19 @@ class UserResponse(BaseModel):
     class Config:
         from_attributes = True  # Allows conversion from SQLAlchemy model
 
+# Search result schemas (for GET /search and /search/typeahead)
+class UserSearchResult(UserResponse):
+    """Schema for a ranked user search hit"""
+    rank: float
+
+class UserSuggestion(BaseModel):
+    """Schema for a typeahead suggestion"""
+    id: UUID
+    name: str
+    profile_image: Optional[str] = None
+    
+    class Config:
+        from_attributes = True
+
 # Import UserProfileResponse from shared schemas
 from app.schemas import UserProfileResponse
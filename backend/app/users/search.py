@@ -0,0 +1,89 @@
+"""
+User directory search
+
+Names and GitHub usernames are matched by prefix (ILIKE) and by trigram
+word similarity (pg_trgm `%>`), both served by the gin_trgm_ops indexes.
+Prefix matches rank above fuzzy ones; within each group rows are ordered
+by the best word similarity of either field. Pages are keyed on (rank, id).
+"""
+
+from typing import Optional
+
+from fastapi import HTTPException, Query
+from sqlalchemy import case, func, literal_column, or_, select, tuple_
+from sqlalchemy.sql import Select
+
+from app.database import data_columns
+from app.users.models import User
+from app.utils.pagination import decode_rank_cursor
+from app.utils.search import LIKE_ESCAPE, escape_like
+
+# Shortest query searched; shorter ones would prefix-match nearly every user
+MIN_QUERY_LENGTH = 2
+
+def search_query(q: str = Query(..., min_length=MIN_QUERY_LENGTH, max_length=100)) -> str:
+    """
+    Dependency for the `q` parameter, stripped before its length is checked
+    
+    Raises:
+        HTTPException: If fewer than MIN_QUERY_LENGTH characters remain
+    """
+    q = q.strip()
+    if len(q) < MIN_QUERY_LENGTH:
+        raise HTTPException(
+            status_code=422,
+            detail=f"Search query needs at least {MIN_QUERY_LENGTH} non-blank characters"
+        )
+    return q
+
+def rank_expression(q: str):
+    """
+    Relevance of a user for `q`
+    
+    Word similarity is at most 1, so adding 1 for a prefix match ranks
+    every prefix match above every fuzzy-only match.
+    """
+    pattern = escape_like(q) + "%"
+    is_prefix = or_(
+        User.name.ilike(pattern, escape=LIKE_ESCAPE),
+        User.github_username.ilike(pattern, escape=LIKE_ESCAPE),
+    )
+    # greatest() skips the NULL similarity of users without a username
+    similarity = func.greatest(func.word_similarity(q, User.name), func.word_similarity(q, User.github_username))
+    # Inline constants so the CASE is typed integer (and NULL counts as no match)
+    bonus = case((is_prefix, literal_column("1")), else_=literal_column("0"))
+    return similarity + bonus, is_prefix
+
+def search_statement(q: str, *columns, cursor: Optional[str] = None, limit: int = 20) -> Select:
+    """
+    Build the ranked search query for one page
+    
+    Args:
+        q: Name or username fragment (possibly misspelled)
+        columns: Columns to return (every user column when omitted);
+            a `rank` column is always added
+        cursor: Cursor from a previous page
+        limit: Page size
+    
+    Returns:
+        Select over matching users, best match first
+    
+    Raises:
+        HTTPException: If the cursor is malformed
+    """
+    q = q.strip()
+    rank, is_prefix = rank_expression(q)
+    query = (
+        select(*(columns or data_columns(User.__table__)), rank.label("rank"))
+        .where(or_(
+            is_prefix,
+            # word_similarity(q, field) >= pg_trgm.word_similarity_threshold
+            User.name.op("%>")(q),
+            User.github_username.op("%>")(q),
+        ))
+        .order_by(rank.desc(), User.id.desc())
+        .limit(limit)
+    )
+    if cursor:
+        query = query.where(tuple_(rank, User.id) < tuple_(*decode_rank_cursor(cursor)))
+    return query
@@ -0,0 +1,141 @@
+"""
+Bulk create helpers: parse JSON arrays or NDJSON, validate per item and
+insert in chunks of multi-row INSERT ... RETURNING inside one transaction
+"""
+
+import json
+import os
+import uuid
+from typing import List, Tuple, Type
+
+from fastapi import HTTPException, Request
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import insert, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from dotenv import load_dotenv
+
+from app.database import data_columns
+from app.schemas import BulkItemError
+from app.users.models import User
+
+# Load environment variables
+load_dotenv("env.local")
+
+BULK_MAX_ITEMS = int(os.getenv("BULK_MAX_ITEMS", "1000"))  # Items per request
+BULK_CHUNK_SIZE = int(os.getenv("BULK_CHUNK_SIZE", "500"))  # Rows per INSERT statement
+
+NDJSON_TYPES = ("application/x-ndjson", "application/jsonl", "application/ndjson")
+
+def _error_message(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in detail['loc']) or 'item'}: {detail['msg']}"
+        for detail in error.errors()
+    )
+
+def _too_many():
+    return HTTPException(status_code=413, detail=f"Too many items (max {BULK_MAX_ITEMS} per request)")
+
+async def _read_raw_items(request: Request) -> List[Tuple[int, object, str]]:
+    """
+    Read raw items from a JSON array or an NDJSON stream
+
+    Returns:
+        (index, parsed item or None, parse error) tuples
+    """
+    content_type = request.headers.get("content-type", "").split(";")[0].strip()
+    if content_type in NDJSON_TYPES:
+        items, buffer, index = [], b"", 0
+
+        def take(line: bytes):
+            nonlocal index
+            if not line.strip():
+                return
+            if index >= BULK_MAX_ITEMS:
+                raise _too_many()
+            try:
+                items.append((index, json.loads(line), ""))
+            except ValueError as e:
+                items.append((index, None, f"Invalid JSON: {e}"))
+            index += 1
+
+        # Parse line by line as the body arrives
+        async for chunk in request.stream():
+            buffer += chunk
+            *lines, buffer = buffer.split(b"\n")
+            for line in lines:
+                take(line)
+        take(buffer)
+        return items
+
+    try:
+        body = json.loads(await request.body())
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Body must be a JSON array or NDJSON")
+    if not isinstance(body, list):
+        raise HTTPException(status_code=400, detail="Body must be a JSON array or NDJSON")
+    if len(body) > BULK_MAX_ITEMS:
+        raise _too_many()
+    return [(index, item, "") for index, item in enumerate(body)]
+
+async def read_bulk_items(
+    request: Request,
+    db: AsyncSession,
+    schema: Type[BaseModel]
+) -> Tuple[List[Tuple[int, BaseModel]], List[BulkItemError]]:
+    """
+    Parse and validate bulk create items
+
+    Each item is validated against `schema`, and every referenced user_id
+    is checked in one query, so bad items are reported individually
+    instead of failing the whole insert.
+
+    Returns:
+        (index, validated item) pairs and per-item errors
+    """
+    valid, errors = [], []
+    for index, raw, parse_error in await _read_raw_items(request):
+        if parse_error:
+            errors.append(BulkItemError(index=index, error=parse_error))
+            continue
+        try:
+            valid.append((index, schema.model_validate(raw)))
+        except ValidationError as e:
+            errors.append(BulkItemError(index=index, error=_error_message(e)))
+
+    user_ids = {item.user_id for _, item in valid}
+    if user_ids:
+        found = set((await db.execute(select(User.id).where(User.id.in_(user_ids)))).scalars())
+        missing = [(index, item) for index, item in valid if item.user_id not in found]
+        errors += [BulkItemError(index=index, error="User not found") for index, _ in missing]
+        valid = [(index, item) for index, item in valid if item.user_id in found]
+
+    errors.sort(key=lambda error: error.index)
+    return valid, errors
+
+async def bulk_insert(db: AsyncSession, model, items: List[BaseModel]) -> list:
+    """
+    Insert items with chunked multi-row INSERT ... RETURNING in one transaction
+
+    IDs are generated here so the returned rows can be put back in input
+    order. Nothing is committed unless every chunk succeeds.
+
+    Returns:
+        Created rows, in the order of `items`
+    """
+    if not items:
+        return []
+    table = model.__table__
+    rows = [{"id": uuid.uuid4(), **item.model_dump()} for item in items]
+    created = {}
+    try:
+        for start in range(0, len(rows), BULK_CHUNK_SIZE):
+            result = await db.execute(
+                insert(table).values(rows[start:start + BULK_CHUNK_SIZE]).returning(*data_columns(table))
+            )
+            created.update((row.id, row) for row in result)
+        await db.commit()
+    except IntegrityError as e:
+        await db.rollback()
+        raise HTTPException(status_code=400, detail=f"Bulk insert failed, nothing was created: {e.orig}")
+    return [created[row["id"]] for row in rows]
@@ -0,0 +1,146 @@
+"""
+ETag / Last-Modified validators and conditional GET (304) handling
+"""
+
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Optional
+
+from fastapi import HTTPException, Request, Response
+from sqlalchemy import func, select, true
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.utils.pagination import set_next_cursor
+from app.utils.serialization import fast_list_response
+
+def make_etag(*parts) -> str:
+    """Build a strong ETag from the given parts"""
+    digest = hashlib.sha1("|".join(str(part) for part in parts).encode()).hexdigest()
+    return f'"{digest}"'
+
+def entity_etag(obj) -> str:
+    """ETag for a single row, derived from its id and updated_at"""
+    return make_etag(obj.__tablename__, obj.id, obj.updated_at.isoformat())
+
+def page_etag(request: Request, model, rows) -> str:
+    """
+    ETag for one page of a list endpoint, built from the rows already loaded
+    
+    Covers each row's id and updated_at plus the request's query string
+    (cursor, limit, fields, filters), so it costs no extra query. Lists send
+    no Last-Modified: deleting a row does not move max(updated_at), so
+    If-Modified-Since could wrongly answer 304.
+    """
+    return make_etag(
+        model.__tablename__,
+        request.url.query,
+        *(f"{row.id}:{row.updated_at.isoformat()}" for row in rows)
+    )
+
+def list_response(request: Request, model, rows, response_model, limit: int) -> Response:
+    """
+    Respond with one page of a list endpoint, or 304 if the client has it
+    
+    Validators come from the page itself (`page_etag`), so they cost no extra
+    query. The next-page cursor is set either way.
+    
+    Args:
+        request: Incoming request (for If-None-Match and the query string)
+        model: SQLAlchemy model being listed
+        rows: Rows of this page, as loaded
+        response_model: Pydantic model to serialize each row with
+        limit: Page size, to tell whether another page may follow
+    """
+    etag = page_etag(request, model, rows)
+    response = not_modified(request, etag, None)
+    if response is None:
+        response = fast_list_response(rows, response_model)
+    set_next_cursor(response, rows, limit)
+    set_validators(response, etag, None)
+    return response
+
+async def fetch_profile_validators(
+    db: AsyncSession,
+    request: Request,
+    user_id
+) -> str:
+    """
+    Compute the ETag for a user profile (user + projects + blogs) in one query
+    
+    The ETag includes the project and blog counts, so deletions change it.
+    No Last-Modified is offered for the same reason as `page_etag`.
+    
+    Returns:
+        ETag string
+    
+    Raises:
+        HTTPException: If the user no longer exists
+    """
+    from app.users.models import User
+    from app.projects.models import Project
+    from app.blogs.models import Blog
+    
+    def summary(model):
+        return (
+            select(func.count(), func.max(model.updated_at))
+            .where(model.user_id == user_id)
+            .subquery()
+        )
+    
+    projects, blogs = summary(Project), summary(Blog)
+    query = (
+        select(User.updated_at, *projects.c, *blogs.c)
+        .select_from(User)
+        .join(projects, true())
+        .join(blogs, true())
+        .where(User.id == user_id)
+    )
+    row = (await db.execute(query)).first()
+    if row is None:
+        raise HTTPException(status_code=404, detail="User not found")
+    
+    return make_etag("profile", user_id, *row, request.url.query)
+
+def _matches(header: str, etag: str) -> bool:
+    # Weak comparison, as allowed for GET (RFC 9110 section 13.1.2)
+    candidates = [tag.strip() for tag in header.split(",")]
+    return "*" in candidates or etag in {tag[2:] if tag.startswith("W/") else tag for tag in candidates}
+
+def not_modified(
+    request: Request,
+    etag: str,
+    last_modified: Optional[datetime],
+    private: bool = False
+) -> Optional[Response]:
+    """
+    Return a 304 response if the client's cached copy is still current
+    
+    If-None-Match takes precedence; If-Modified-Since is only checked when
+    the client sent no ETag.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        fresh = _matches(if_none_match, etag)
+    elif last_modified is not None and request.headers.get("if-modified-since"):
+        try:
+            since = parsedate_to_datetime(request.headers["if-modified-since"])
+            fresh = last_modified.replace(microsecond=0) <= since
+        except (TypeError, ValueError):
+            fresh = False
+    else:
+        fresh = False
+    
+    if not fresh:
+        return None
+    
+    response = Response(status_code=304)
+    set_validators(response, etag, last_modified, private=private)
+    return response
+
+def set_validators(response: Response, etag: str, last_modified: Optional[datetime], private: bool = False):
+    """Attach ETag, Last-Modified and a revalidate-every-time Cache-Control"""
+    response.headers["ETag"] = etag
+    if last_modified is not None:
+        response.headers["Last-Modified"] = format_datetime(last_modified.astimezone(timezone.utc), usegmt=True)
+    response.headers["Cache-Control"] = "private, no-cache" if private else "no-cache"
@@ -0,0 +1,78 @@
+"""
+Sparse fieldsets (`?fields=`) for list endpoints
+"""
+
+from functools import lru_cache
+from typing import Optional, Tuple, Type
+
+from fastapi import HTTPException
+from pydantic import BaseModel, ConfigDict, create_model
+from sqlalchemy.orm import load_only
+from sqlalchemy.sql import Select
+
+# Always returned so clients can address each row
+ALWAYS_INCLUDED = ("id",)
+
+# Always loaded because pagination cursors and page ETags are built from them
+ALWAYS_LOADED = ("id", "created_at", "updated_at")
+
+def parse_fields(fields: Optional[str], response_model: Type[BaseModel]) -> Optional[Tuple[str, ...]]:
+    """
+    Parse a comma-separated `fields` parameter against a response model
+    
+    Returns:
+        Sorted tuple of field names, or None when all fields are wanted
+    
+    Raises:
+        HTTPException: If an unknown field is requested
+    """
+    if not fields:
+        return None
+    
+    requested = {name.strip() for name in fields.split(",") if name.strip()}
+    unknown = requested - set(response_model.model_fields)
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown fields: {', '.join(sorted(unknown))}"
+        )
+    return tuple(sorted(requested | set(ALWAYS_INCLUDED)))
+
+@lru_cache(maxsize=256)
+def reduced_model(response_model: Type[BaseModel], fields: Tuple[str, ...]) -> Type[BaseModel]:
+    """Build (once per field set) a response model with only `fields`"""
+    return create_model(
+        f"{response_model.__name__}Fields",
+        __config__=ConfigDict(from_attributes=True),
+        **{name: (response_model.model_fields[name].annotation, response_model.model_fields[name])
+           for name in fields}
+    )
+
+def apply_fieldset(
+    query: Select,
+    model,
+    response_model: Type[BaseModel],
+    fields: Optional[str]
+) -> Tuple[Select, Type[BaseModel]]:
+    """
+    Restrict a list query and its response model to the requested fields
+    
+    Unselected columns (such as `Blog.content`) are deferred, so they are
+    never read from the database or sent over the wire.
+    
+    Args:
+        query: Select statement over `model`
+        model: SQLAlchemy model being listed
+        response_model: Full Pydantic response model
+        fields: Raw `fields` query parameter (comma-separated)
+    
+    Returns:
+        Tuple of (query, response model to serialize with)
+    """
+    selected = parse_fields(fields, response_model)
+    if selected is None:
+        return query, response_model
+    
+    columns = sorted(set(selected) | set(ALWAYS_LOADED))
+    query = query.options(load_only(*[getattr(model, name) for name in columns]))
+    return query, reduced_model(response_model, selected)
@@ -0,0 +1,135 @@
+"""
+Lightweight in-process metrics (counters and histograms)
+"""
+
+import threading
+from typing import Dict, Iterable, Optional, Sequence
+
+# Default latency buckets in seconds
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+class Counter:
+    """Monotonically increasing counter"""
+    
+    def __init__(self, name: str, description: str = ""):
+        self.name = name
+        self.description = description
+        self.value = 0
+        self._lock = threading.Lock()
+    
+    def inc(self, amount: float = 1):
+        with self._lock:
+            self.value += amount
+    
+    def snapshot(self) -> float:
+        return self.value
+
+class Histogram:
+    """
+    Bucketed histogram of observed values
+    
+    Bucket counts are cumulative (each bucket counts every observation
+    less than or equal to its upper bound), matching Prometheus semantics.
+    """
+    
+    def __init__(self, name: str, description: str = "", buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.name = name
+        self.description = description
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * len(self.buckets)
+        self.count = 0
+        self.sum = 0.0
+        self._lock = threading.Lock()
+    
+    def observe(self, value: float):
+        with self._lock:
+            self.count += 1
+            self.sum += value
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    self._counts[i] += 1
+    
+    def snapshot(self) -> Dict[str, object]:
+        with self._lock:
+            buckets = {str(bound): count for bound, count in zip(self.buckets, self._counts)}
+            buckets["+Inf"] = self.count
+            return {"count": self.count, "sum": round(self.sum, 6), "buckets": buckets}
+
+class MetricFamily:
+    """
+    A metric split by label values, e.g. latency by model and task
+    
+    Children are created on first use of a label combination.
+    """
+    
+    def __init__(self, metric_cls, name: str, description: str = "", labelnames: Sequence[str] = (), **kwargs):
+        self.metric_cls = metric_cls
+        self.name = name
+        self.description = description
+        self.labelnames = tuple(labelnames)
+        self._kwargs = kwargs
+        self._children: Dict[tuple, object] = {}
+        self._lock = threading.Lock()
+    
+    def labels(self, **labels: str):
+        """Get the child metric for a label combination"""
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        with self._lock:
+            child = self._children.get(key)
+            if child is None:
+                child = self.metric_cls(self.name, self.description, **self._kwargs)
+                self._children[key] = child
+            return child
+    
+    def children(self):
+        """Yield (labels dict, child metric) pairs"""
+        with self._lock:
+            items = list(self._children.items())
+        for key, child in items:
+            yield dict(zip(self.labelnames, key)), child
+    
+    def snapshot(self) -> list:
+        return [{"labels": labels, "value": child.snapshot()} for labels, child in self.children()]
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    def escape(value: str) -> str:
+        return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    return "{" + ",".join(f'{name}="{escape(value)}"' for name, value in labels.items()) + "}"
+
+def _render_metric(metric, labels: Dict[str, str]) -> list:
+    if isinstance(metric, Counter):
+        return [f"{metric.name}{_format_labels(labels)} {metric.snapshot()}"]
+    snapshot = metric.snapshot()
+    lines = [
+        f"{metric.name}_bucket{_format_labels({**labels, 'le': bound})} {count}"
+        for bound, count in snapshot["buckets"].items()
+    ]
+    lines.append(f"{metric.name}_sum{_format_labels(labels)} {snapshot['sum']}")
+    lines.append(f"{metric.name}_count{_format_labels(labels)} {snapshot['count']}")
+    return lines
+
+def render_prometheus(metrics: Iterable) -> str:
+    """
+    Render counters, histograms and families in the Prometheus text format
+    
+    Args:
+        metrics: Counter, Histogram or MetricFamily instances
+    
+    Returns:
+        Exposition text for a /metrics endpoint
+    """
+    lines = []
+    for metric in metrics:
+        if isinstance(metric, MetricFamily):
+            kind = "counter" if metric.metric_cls is Counter else "histogram"
+            children = list(metric.children())
+        else:
+            kind = "counter" if isinstance(metric, Counter) else "histogram"
+            children = [({}, metric)]
+        lines.append(f"# HELP {metric.name} {metric.description}")
+        lines.append(f"# TYPE {metric.name} {kind}")
+        for labels, child in children:
+            lines.extend(_render_metric(child, labels))
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,113 @@
+"""
+Single-statement UPDATE/DELETE ... RETURNING helpers for CRUD handlers
+
+Each mutation is one round trip: the row's existence is read from the
+RETURNING result instead of a SELECT before the write.
+"""
+
+from typing import Dict, Optional, Tuple
+from uuid import UUID
+
+from fastapi import HTTPException
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import data_columns
+
+# Postgres SQLSTATE codes for the violations handlers usually expect
+UNIQUE_VIOLATION = "23505"
+FOREIGN_KEY_VIOLATION = "23503"
+
+def violation(error: IntegrityError) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Get the SQLSTATE and constraint name of an integrity error
+    
+    Works for asyncpg (whose exception is the DBAPI error's cause) and
+    psycopg2 (which exposes them as `pgcode` and `diag`).
+    """
+    orig = error.orig
+    cause = getattr(orig, "__cause__", None)
+    sqlstate = getattr(orig, "sqlstate", None) or getattr(orig, "pgcode", None)
+    constraint = (
+        getattr(cause, "constraint_name", None)
+        or getattr(getattr(orig, "diag", None), "constraint_name", None)
+    )
+    return sqlstate, constraint
+
+async def update_returning(
+    db: AsyncSession,
+    model,
+    row_id: UUID,
+    values: dict,
+    not_found: str,
+    conflicts: Optional[Dict[str, str]] = None
+):
+    """
+    Apply a partial update with `UPDATE ... WHERE id = :id RETURNING *`
+    
+    Args:
+        db: Database session
+        model: SQLAlchemy model class with an `id` primary key
+        row_id: ID of the row to update
+        values: Columns to change (e.g. `schema.dict(exclude_unset=True)`)
+        not_found: 404 detail when no row has this ID
+        conflicts: 400 details for expected violations, keyed by constraint
+            name or SQLSTATE (e.g. `{FOREIGN_KEY_VIOLATION: "User not found"}`);
+            any other integrity error is re-raised
+    
+    Returns:
+        The updated row
+    
+    Raises:
+        HTTPException: 404 if the row does not exist, 400 on an expected conflict
+        IntegrityError: On any other constraint violation
+    """
+    table = model.__table__
+    if values:
+        # Bump updated_at explicitly so ETags and Last-Modified move
+        statement = (
+            update(table)
+            .where(table.c.id == row_id)
+            .values(**values, updated_at=func.now())
+            .returning(*data_columns(table))
+        )
+    else:
+        statement = select(*data_columns(table)).where(table.c.id == row_id)
+    
+    try:
+        row = (await db.execute(statement)).first()
+    except IntegrityError as e:
+        await db.rollback()
+        sqlstate, constraint = violation(e)
+        conflicts = conflicts or {}
+        detail = conflicts.get(constraint) or conflicts.get(sqlstate)
+        if detail is None:
+            raise
+        raise HTTPException(status_code=400, detail=detail)
+    
+    if row is None:
+        raise HTTPException(status_code=404, detail=not_found)
+    await db.commit()
+    return row
+
+async def delete_returning(db: AsyncSession, model, row_id: UUID, not_found: str) -> UUID:
+    """
+    Delete a row with `DELETE ... WHERE id = :id RETURNING id`
+    
+    Dependent rows are removed by the database's ON DELETE CASCADE.
+    
+    Returns:
+        The deleted row's ID
+    
+    Raises:
+        HTTPException: 404 if the row does not exist
+    """
+    table = model.__table__
+    deleted_id = (await db.execute(
+        delete(table).where(table.c.id == row_id).returning(table.c.id)
+    )).scalar()
+    if deleted_id is None:
+        raise HTTPException(status_code=404, detail=not_found)
+    await db.commit()
+    return deleted_id
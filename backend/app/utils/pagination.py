@@ -0,0 +1,125 @@
+"""
+Keyset (cursor) pagination helpers for list endpoints
+"""
+
+import base64
+import json
+from datetime import datetime
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+from fastapi import HTTPException, Response
+from sqlalchemy import tuple_
+from sqlalchemy.sql import Select
+
+# Response header carrying the cursor for the next page
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+def _encode_position(values: list) -> str:
+    raw = json.dumps(values).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+def _decode_position(cursor: str) -> list:
+    raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+    return json.loads(raw)
+
+def encode_cursor(created_at: datetime, id: UUID) -> str:
+    """
+    Encode a (created_at, id) position as an opaque cursor
+    
+    Args:
+        created_at: Creation timestamp of the last row on the page
+        id: ID of the last row on the page
+    
+    Returns:
+        URL-safe cursor string
+    """
+    return _encode_position([created_at.isoformat(), str(id)])
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """
+    Decode an opaque cursor back into a (created_at, id) position
+    
+    Raises:
+        HTTPException: If the cursor is malformed
+    """
+    try:
+        created_at, id = _decode_position(cursor)
+        return datetime.fromisoformat(created_at), UUID(id)
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor")
+
+def encode_rank_cursor(rank: float, id: UUID) -> str:
+    """
+    Encode a (rank, id) position in relevance-ordered results as a cursor
+    
+    Args:
+        rank: Relevance score of the last row on the page
+        id: ID of the last row on the page
+    """
+    return _encode_position([rank, str(id)])
+
+def decode_rank_cursor(cursor: str) -> Tuple[float, UUID]:
+    """
+    Decode a relevance cursor back into a (rank, id) position
+    
+    Raises:
+        HTTPException: If the cursor is malformed
+    """
+    try:
+        rank, id = _decode_position(cursor)
+        return float(rank), UUID(id)
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor")
+
+def paginate(
+    query: Select,
+    model,
+    cursor: Optional[str] = None,
+    skip: int = 0,
+    limit: int = 100,
+    descending: bool = False
+) -> Select:
+    """
+    Apply stable (created_at, id) ordering and keyset or offset pagination
+    
+    Args:
+        query: Select statement over `model`
+        model: SQLAlchemy model with `created_at` and `id` columns
+        cursor: Cursor from a previous page (takes precedence over `skip`)
+        skip: Offset for legacy offset pagination
+        limit: Page size
+        descending: Return newest rows first
+    
+    Returns:
+        Paginated select statement
+    """
+    key = tuple_(model.created_at, model.id)
+    
+    if descending:
+        query = query.order_by(model.created_at.desc(), model.id.desc())
+    else:
+        query = query.order_by(model.created_at, model.id)
+    
+    if cursor:
+        position = tuple_(*decode_cursor(cursor))
+        query = query.where(key < position if descending else key > position)
+    elif skip:
+        query = query.offset(skip)
+    
+    return query.limit(limit)
+
+def set_next_cursor(response: Response, items: List, limit: int) -> Optional[str]:
+    """
+    Set the next-page cursor header when the page came back full
+    
+    Returns:
+        The next cursor, or None if this was the last page
+    """
+    if not items or len(items) < limit:
+        return None
+    
+    last = items[-1]
+    cursor = encode_cursor(last.created_at, last.id)
+    response.headers[NEXT_CURSOR_HEADER] = cursor
+    return cursor
@@ -0,0 +1,10 @@
+"""
+Helpers shared by search endpoints
+"""
+
+# Escape character used in LIKE/ILIKE patterns built from user input
+LIKE_ESCAPE = "\\"
+
+def escape_like(value: str) -> str:
+    """Escape LIKE wildcards so user input only matches literally"""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
@@ -2,10 +2,17 @@
 Utility functions for clean SQLAlchemy to Pydantic serialization
 """
 
-from typing import TypeVar, Type, List
-from pydantic import BaseModel
-from sqlalchemy.orm import Session
-from sqlalchemy.orm import joinedload
+from functools import lru_cache
+from typing import TypeVar, Type, List, Iterable
+from fastapi import HTTPException
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import select, func, text
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.schemas import UserProfileResponse
+from app.users.schemas import UserResponse
 
 T = TypeVar('T', bound=BaseModel)
 
@@ -41,28 +48,90 @@ def serialize_sqlalchemy_list_to_pydantic(
     """
     return [pydantic_model.model_validate(obj) for obj in sqlalchemy_objs]
 
-def load_user_with_relationships(db: Session, user_id: str, github_id: str = None):
+@lru_cache(maxsize=None)
+def _list_adapter(pydantic_model: Type[T]) -> TypeAdapter:
+    """Build (once per model) a TypeAdapter for a list of that model"""
+    return TypeAdapter(List[pydantic_model])
+
+def serialize_rows(sqlalchemy_objs: Iterable, pydantic_model: Type[T]) -> List[dict]:
+    """
+    Validate ORM rows once and dump them to plain dicts
+    
+    Uses a cached list TypeAdapter, so the whole page is validated in a
+    single pydantic call. UUIDs and datetimes are left as Python objects
+    for orjson to encode natively.
+    
+    Args:
+        sqlalchemy_objs: SQLAlchemy model instances (or rows with attributes)
+        pydantic_model: The Pydantic model class describing each row
+    
+    Returns:
+        List of dictionaries
+    """
+    adapter = _list_adapter(pydantic_model)
+    return adapter.dump_python(adapter.validate_python(list(sqlalchemy_objs), from_attributes=True))
+
+def fast_list_response(sqlalchemy_objs: Iterable, pydantic_model: Type[T]) -> ORJSONResponse:
     """
-    Load user with all relationships using eager loading
+    Serialize ORM rows straight to an orjson response
+    
+    Returning a Response skips FastAPI's second validation pass through
+    `response_model`, which is kept on the route for the OpenAPI schema.
+    """
+    return ORJSONResponse(serialize_rows(sqlalchemy_objs, pydantic_model))
+
+def fast_model_response(pydantic_obj: BaseModel) -> ORJSONResponse:
+    """Send an already-validated Pydantic model as an orjson response"""
+    return ORJSONResponse(pydantic_obj.model_dump())
+
+async def load_user_profile(db: AsyncSession, user_id, limit: int = 100) -> UserProfileResponse:
+    """
+    Assemble a user profile with their latest projects and blogs in one query
+    
+    Each list is aggregated to JSON in its own scalar subquery, so there is
+    no projects x blogs cartesian product and each blog's content is sent
+    once. The user's own columns come from the same row rather than the
+    principal cache, which may be stale when another process wrote them.
     
     Args:
         db: Database session
-        user_id: User ID (if loading by ID)
-        github_id: GitHub ID (if loading by GitHub ID)
+        user_id: ID of the user
+        limit: Maximum number of projects and of blogs to include
     
     Returns:
-        User with loaded relationships
+        UserProfileResponse with the newest `limit` projects and blogs
+    
+    Raises:
+        HTTPException: If the user no longer exists
     """
     from app.users.models import User
+    from app.projects.models import Project
+    from app.blogs.models import Blog
+    from app.database import data_columns
+    
+    def latest_as_json(model):
+        rows = (
+            select(*data_columns(model.__table__))
+            .where(model.user_id == User.id)
+            .order_by(model.created_at.desc(), model.id.desc())
+            .limit(limit)
+            .subquery()
+        )
+        ordered = aggregate_order_by(rows.table_valued(), rows.c.created_at.desc(), rows.c.id.desc())
+        return select(func.coalesce(func.json_agg(ordered), text("'[]'::json"))).scalar_subquery()
     
-    query = db.query(User).options(
-        joinedload(User.projects),
-        joinedload(User.blogs)
-    )
+    def total(model):
+        return select(func.count()).select_from(model).where(model.user_id == User.id).scalar_subquery()
     
-    if user_id:
-        return query.filter(User.id == user_id).first()
-    elif github_id:
-        return query.filter(User.github_id == github_id).first()
+    query = select(
+        *(User.__table__.c[field] for field in UserResponse.model_fields),
+        latest_as_json(Project).label("projects"),
+        latest_as_json(Blog).label("blogs"),
+        total(Project).label("projects_total"),
+        total(Blog).label("blogs_total"),
+    ).where(User.id == user_id)
+    row = (await db.execute(query)).first()
+    if row is None:
+        raise HTTPException(status_code=404, detail="User not found")
     
-    return None
+    return UserProfileResponse.model_validate(dict(row._mapping))
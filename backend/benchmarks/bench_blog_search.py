@@ -0,0 +1,129 @@
+"""
+Benchmark: blog full-text search latency over a large table
+
+Seeds the blogs table with synthetic posts (owned by a `bench-search-user`)
+built from a fixed vocabulary, so common, rare and phrase queries have
+predictable match counts. Then times the first page and a deep page
+(via the cursor) of each query through the search endpoint's statement.
+
+Usage:
+    DATABASE_URL=postgresql://... python -m benchmarks.bench_blog_search \\
+        --seed 1000000 --limit 20 [--explain] [--cleanup]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+
+from sqlalchemy import delete, text
+from sqlalchemy.dialects import postgresql
+
+from app.database import AsyncSessionLocal, async_engine
+from app.migrate import migrate
+from app.users.models import User
+from app.projects.models import Project  # noqa: F401 - registers User relationships
+from app.blogs.models import Blog  # noqa: F401
+from app.blogs.search import search_statement
+from app.utils.pagination import encode_rank_cursor
+
+# The i-th word is appended to every i-th post, so early words are
+# common and late words are rare; titles and summaries mix in two more
+VOCABULARY = [
+    "python", "postgres", "react", "docker", "kubernetes", "testing", "performance", "async",
+    "caching", "typescript", "graphql", "observability", "rust", "webassembly", "terraform", "kafka",
+]
+
+SEED_SQL = text("""
+    INSERT INTO blogs (id, user_id, title, summary, content, created_at, updated_at)
+    SELECT gen_random_uuid(), :user_id,
+           'Notes on ' || w[1 + g % 16] || ' and ' || w[1 + (g / 16) % 16],
+           'What I learned about ' || w[1 + (g / 7) % 16] || ' this week.',
+           repeat('Some filler text about building software in production. ', 20) ||
+           (SELECT string_agg(w[i], ' ') FROM generate_series(1, 16) AS i WHERE g % i = 0),
+           now() - make_interval(secs => g), now()
+    FROM generate_series(:start, :stop) AS g, (SELECT CAST(:words AS text[]) AS w) AS vocabulary
+""")
+
+QUERIES = ["python", "kafka", '"postgres performance"', "rust -docker", "caching or observability"]
+
+async def time_query(db, statement, repeat: int):
+    """Run a statement `repeat` times; return (median ms, p95 ms, rows)"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        rows = (await db.execute(statement)).all()
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    return statistics.median(timings), timings[int(len(timings) * 0.95) - 1], rows
+
+async def seed(db, user_id, count: int, batch: int = 100_000):
+    start = time.perf_counter()
+    for first in range(1, count + 1, batch):
+        await db.execute(SEED_SQL, {
+            "user_id": user_id,
+            "start": first,
+            "stop": min(first + batch - 1, count),
+            "words": VOCABULARY,
+        })
+        await db.commit()
+        print(f"  seeded {min(first + batch - 1, count)} / {count}")
+    await db.execute(text("ANALYZE blogs"))
+    print(f"seeded {count} blogs in {time.perf_counter() - start:.1f}s")
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--seed", type=int, default=0, help="synthetic blogs to insert first")
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--pages", type=int, default=10, help="page number for the deep page timing")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--explain", action="store_true", help="print the plan of the first query")
+    parser.add_argument("--cleanup", action="store_true", help="delete the synthetic user and blogs afterwards")
+    args = parser.parse_args()
+
+    # Make sure the generated column and GIN index exist on older databases
+    migrate()
+
+    async with AsyncSessionLocal() as db:
+        user = User(name="bench-search-user", github_username=f"bench-search-{uuid.uuid4().hex[:8]}")
+        db.add(user)
+        await db.commit()
+        if args.seed:
+            await seed(db, user.id, args.seed)
+
+        if args.explain:
+            sql = search_statement(QUERIES[0], limit=args.limit).compile(
+                dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+            )
+            plan = await db.execute(text(f"EXPLAIN (ANALYZE, BUFFERS) {sql}"))
+            print("\n".join(plan.scalars()))
+        print(f"{'query':<28} {'page 1 ms':>10} {'p95':>8} {f'page {args.pages} ms':>12} {'p95':>8}")
+        for q in QUERIES:
+            first_ms, first_p95, rows = await time_query(db, search_statement(q, limit=args.limit), args.repeat)
+
+            # Walk to the deep page with cursors (not timed), then time it
+            cursor = None
+            for _ in range(args.pages - 1):
+                page = (await db.execute(search_statement(q, cursor=cursor, limit=args.limit))).all()
+                if len(page) < args.limit:
+                    cursor = None
+                    break
+                cursor = encode_rank_cursor(page[-1].rank, page[-1].id)
+            if cursor is None:
+                print(f"{q:<28} {first_ms:>10.2f} {first_p95:>8.2f} {'-':>12} {'-':>8}")
+                continue
+            deep_ms, deep_p95, _ = await time_query(
+                db, search_statement(q, cursor=cursor, limit=args.limit), args.repeat
+            )
+            print(f"{q:<28} {first_ms:>10.2f} {first_p95:>8.2f} {deep_ms:>12.2f} {deep_p95:>8.2f}")
+
+        if args.cleanup:
+            # Blogs go with their users (ON DELETE CASCADE)
+            await db.execute(delete(User).where(User.name == "bench-search-user"))
+            await db.commit()
+
+    await async_engine.dispose()
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,93 @@
+"""
+Benchmark: one POST per project vs the bulk NDJSON endpoint
+
+Imports N projects through the app in-process, first with one
+POST /api/projects/ per item (insert, commit and refresh each), then with
+a single POST /api/projects/bulk, and reports rows/sec for both.
+
+Usage:
+    DATABASE_URL=postgresql://... python -m benchmarks.bench_bulk \\
+        --items 500 --concurrency 10
+"""
+
+import argparse
+import asyncio
+import json
+import time
+import uuid
+
+import httpx
+from sqlalchemy import delete
+
+from app.database import AsyncSessionLocal, async_engine
+from app.users.models import User
+from app.projects.models import Project  # noqa: F401 - registers User relationships
+from app.blogs.models import Blog  # noqa: F401
+from main import app
+
+def make_items(user_id, count: int) -> list:
+    return [
+        {
+            "user_id": str(user_id),
+            "title": f"Imported project {i}",
+            "description": "Migrated from another portfolio platform. " * 5,
+            "tech_stack": ["Python", "FastAPI", "React"],
+            "github_link": f"https://github.com/example/project-{i}",
+        }
+        for i in range(count)
+    ]
+
+async def single_item(client: httpx.AsyncClient, items: list, concurrency: int) -> float:
+    queue = asyncio.Queue()
+    for item in items:
+        queue.put_nowait(item)
+
+    async def worker():
+        while not queue.empty():
+            response = await client.post("/api/projects/", json=queue.get_nowait())
+            response.raise_for_status()
+
+    start = time.perf_counter()
+    await asyncio.gather(*[worker() for _ in range(concurrency)])
+    return time.perf_counter() - start
+
+async def bulk(client: httpx.AsyncClient, items: list) -> float:
+    body = "\n".join(json.dumps(item) for item in items)
+    start = time.perf_counter()
+    response = await client.post(
+        "/api/projects/bulk", content=body, headers={"Content-Type": "application/x-ndjson"}
+    )
+    response.raise_for_status()
+    assert len(response.json()["created"]) == len(items)
+    return time.perf_counter() - start
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--items", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=10, help="parallel single-item requests")
+    args = parser.parse_args()
+
+    async with AsyncSessionLocal() as db:
+        user = User(name="bench-bulk-user", github_username=f"bench-{uuid.uuid4().hex[:8]}")
+        db.add(user)
+        await db.commit()
+        user_id = user.id
+
+    items = make_items(user_id, args.items)
+    try:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+            single_seconds = await single_item(client, items, args.concurrency)
+            bulk_seconds = await bulk(client, items)
+
+        print(f"{args.items} projects")
+        print(f"  single-item x{args.concurrency}: {args.items / single_seconds:9.0f} rows/s  ({args.items} requests)")
+        print(f"  bulk NDJSON:       {args.items / bulk_seconds:9.0f} rows/s  (1 request)")
+    finally:
+        async with AsyncSessionLocal() as db:
+            await db.execute(delete(User).where(User.id == user_id))
+            await db.commit()
+        await async_engine.dispose()
+
+if __name__ == "__main__":
+    asyncio.run(main())
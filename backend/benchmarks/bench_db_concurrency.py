@@ -0,0 +1,99 @@
+"""
+Benchmark: sync (threadpool) vs async database path at high concurrency
+
+Serves the same query through a sync `def` endpoint on a psycopg2 engine and
+an `async def` endpoint using `get_async_db`, with the same pool settings, then drives both in-process with
+many concurrent clients and reports requests/sec.
+
+Usage:
+    DATABASE_URL=postgresql://... python -m benchmarks.bench_db_concurrency \\
+        --concurrency 200 --requests 5000 --sleep-ms 5
+"""
+
+import argparse
+import asyncio
+import time
+
+import httpx
+from fastapi import Depends, FastAPI
+from sqlalchemy import create_engine, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.database import DATABASE_URL, POOL_OPTIONS, SYNC_CONNECT_ARGS, get_async_db, async_engine
+from app.users.models import User
+from app.projects.models import Project  # noqa: F401 - registers User relationships
+from app.blogs.models import Blog  # noqa: F401
+
+# The app's sync engine only runs startup DDL, so the sync path gets a pool like the async one
+sync_engine = create_engine(DATABASE_URL, connect_args=SYNC_CONNECT_ARGS, **POOL_OPTIONS)
+SyncSession = sessionmaker(bind=sync_engine)
+
+def get_sync_db():
+    db = SyncSession()
+    try:
+        yield db
+    finally:
+        db.close()
+
+def build_app(sleep_ms: int) -> FastAPI:
+    """Build an app exposing the same query on both paths"""
+    app = FastAPI()
+    wait = text("SELECT pg_sleep(:seconds)").bindparams(seconds=sleep_ms / 1000)
+
+    @app.get("/sync")
+    def sync_users(db: Session = Depends(get_sync_db)):
+        if sleep_ms:
+            db.execute(wait)
+        return len(db.execute(select(User.id).limit(20)).all())
+
+    @app.get("/async")
+    async def async_users(db: AsyncSession = Depends(get_async_db)):
+        if sleep_ms:
+            await db.execute(wait)
+        result = await db.execute(select(User.id).limit(20))
+        return len(result.all())
+
+    return app
+
+async def drive(app: FastAPI, path: str, concurrency: int, total: int) -> float:
+    """Send `total` requests with `concurrency` workers and return requests/sec"""
+    transport = httpx.ASGITransport(app=app)
+    remaining = iter(range(total))
+    errors = 0
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        async def worker():
+            nonlocal errors
+            for _ in remaining:
+                response = await client.get(path)
+                if response.status_code != 200:
+                    errors += 1
+
+        start = time.perf_counter()
+        await asyncio.gather(*[worker() for _ in range(concurrency)])
+        elapsed = time.perf_counter() - start
+
+    if errors:
+        print(f"  {path}: {errors} failed requests")
+    return total / elapsed
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--sleep-ms", type=int, default=5, help="simulated DB wait per request")
+    args = parser.parse_args()
+
+    app = build_app(args.sleep_ms)
+    print(f"concurrency={args.concurrency} requests={args.requests} db_wait={args.sleep_ms}ms")
+    for path in ("/sync", "/async"):
+        await drive(app, path, args.concurrency, min(args.requests, 200))  # warm up pools
+        rps = await drive(app, path, args.concurrency, args.requests)
+        print(f"  {path:<7} {rps:10.1f} req/s")
+
+    sync_engine.dispose()
+    await async_engine.dispose()
+
+if __name__ == "__main__":
+    asyncio.run(main())
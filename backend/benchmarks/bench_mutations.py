@@ -0,0 +1,111 @@
+"""
+Benchmark: select-mutate-commit-refresh vs UPDATE/DELETE ... RETURNING
+
+Seeds N projects, then updates and deletes each of them through the old
+handler path (get, setattr, commit, refresh / get, delete, commit) and
+through `update_returning` / `delete_returning`, with many concurrent
+writers. Reports writes/sec and queries per write.
+
+Usage:
+    DATABASE_URL=postgresql://... python -m benchmarks.bench_mutations \\
+        --rows 2000 --concurrency 20
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+
+from sqlalchemy import delete, event, insert, select
+
+from app.database import AsyncSessionLocal, async_engine
+from app.users.models import User
+from app.projects.models import Project
+from app.blogs.models import Blog  # noqa: F401 - registers User relationships
+from app.utils.mutations import update_returning, delete_returning
+
+statements = 0
+
+@event.listens_for(async_engine.sync_engine, "before_cursor_execute")
+def _count_statement(*args):
+    global statements
+    statements += 1
+
+async def old_update(project_id, values):
+    async with AsyncSessionLocal() as db:
+        project = await db.get(Project, project_id)
+        for field, value in values.items():
+            setattr(project, field, value)
+        await db.commit()
+        await db.refresh(project)
+
+async def new_update(project_id, values):
+    async with AsyncSessionLocal() as db:
+        await update_returning(db, Project, project_id, values, not_found="Project not found")
+
+async def old_delete(project_id):
+    async with AsyncSessionLocal() as db:
+        project = await db.get(Project, project_id)
+        await db.delete(project)
+        await db.commit()
+
+async def new_delete(project_id):
+    async with AsyncSessionLocal() as db:
+        await delete_returning(db, Project, project_id, not_found="Project not found")
+
+async def seed(user_id, rows: int) -> list:
+    async with AsyncSessionLocal() as db:
+        await db.execute(insert(Project), [
+            {"user_id": user_id, "title": f"Project {i}", "description": "d" * 200}
+            for i in range(rows)
+        ])
+        await db.commit()
+        result = await db.execute(select(Project.id).where(Project.user_id == user_id))
+        return list(result.scalars())
+
+async def run(label: str, fn, ids: list, concurrency: int, *args):
+    """Apply `fn` to every id with `concurrency` writers and print the rate"""
+    global statements
+    queue = asyncio.Queue()
+    for row_id in ids:
+        queue.put_nowait(row_id)
+
+    async def writer():
+        while not queue.empty():
+            await fn(queue.get_nowait(), *args)
+
+    statements = 0
+    start = time.perf_counter()
+    await asyncio.gather(*[writer() for _ in range(concurrency)])
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<22} {len(ids) / elapsed:9.0f} writes/s  {statements / len(ids):5.1f} queries/write")
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    args = parser.parse_args()
+
+    async with AsyncSessionLocal() as db:
+        user = User(name="bench-mutations-user", github_username=f"bench-{uuid.uuid4().hex[:8]}")
+        db.add(user)
+        await db.commit()
+        user_id = user.id
+
+    values = {"title": "Updated title", "summary": "Updated summary"}
+    try:
+        print(f"{args.rows} rows, {args.concurrency} concurrent writers")
+        ids = await seed(user_id, args.rows)
+        await run("update (select+refresh)", old_update, ids, args.concurrency, values)
+        await run("update (RETURNING)", new_update, ids, args.concurrency, values)
+        await run("delete (select)", old_delete, ids, args.concurrency)
+        ids = await seed(user_id, args.rows)
+        await run("delete (RETURNING)", new_delete, ids, args.concurrency)
+    finally:
+        async with AsyncSessionLocal() as db:
+            await db.execute(delete(User).where(User.id == user_id))
+            await db.commit()
+        await async_engine.dispose()
+
+if __name__ == "__main__":
+    asyncio.run(main())
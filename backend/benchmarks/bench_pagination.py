@@ -0,0 +1,86 @@
+"""
+Benchmark: OFFSET vs keyset pagination latency at shallow and deep pages
+
+Seeds the users table with synthetic rows (named `bench-user-*`), then times
+fetching page 1 and a deep page with both offset and cursor pagination.
+
+Usage:
+    DATABASE_URL=postgresql://... python -m benchmarks.bench_pagination \\
+        --seed 1000000 --page 10000 --limit 100 [--cleanup]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from sqlalchemy import delete, select, text
+
+from app.database import AsyncSessionLocal, async_engine
+from app.users.models import User
+from app.projects.models import Project  # noqa: F401 - registers User relationships
+from app.blogs.models import Blog  # noqa: F401
+from app.utils.pagination import encode_cursor, paginate
+
+SEED_SQL = text("""
+    INSERT INTO users (id, name, github_username, theme_preference, created_at, updated_at)
+    SELECT gen_random_uuid(), 'bench-user-' || g, 'bench-user-' || g, 'light',
+           now() - make_interval(secs => g), now()
+    FROM generate_series(1, :count) AS g
+""")
+
+async def time_query(db, query, repeat: int) -> float:
+    """Run a query `repeat` times and return the median latency in ms"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = await db.execute(query)
+        result.scalars().all()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--seed", type=int, default=0, help="synthetic users to insert first")
+    parser.add_argument("--page", type=int, default=10000, help="deep page number to compare")
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--cleanup", action="store_true", help="delete synthetic users afterwards")
+    args = parser.parse_args()
+
+    async with AsyncSessionLocal() as db:
+        if args.seed:
+            start = time.perf_counter()
+            await db.execute(SEED_SQL, {"count": args.seed})
+            await db.commit()
+            await db.execute(text("ANALYZE users"))
+            print(f"seeded {args.seed} users in {time.perf_counter() - start:.1f}s")
+
+        print(f"{'page':>8} {'offset ms':>10} {'keyset ms':>10}")
+        for page in (1, args.page):
+            skip = (page - 1) * args.limit
+            cursor = None
+            if skip:
+                # Position of the row just before the page (not timed)
+                row = (await db.execute(
+                    select(User.created_at, User.id)
+                    .order_by(User.created_at, User.id)
+                    .offset(skip - 1).limit(1)
+                )).first()
+                if row is None:
+                    print(f"{page:>8} not enough rows; seed more")
+                    continue
+                cursor = encode_cursor(row.created_at, row.id)
+
+            offset_ms = await time_query(db, paginate(select(User), User, skip=skip, limit=args.limit), args.repeat)
+            keyset_ms = await time_query(db, paginate(select(User), User, cursor=cursor, limit=args.limit), args.repeat)
+            print(f"{page:>8} {offset_ms:>10.2f} {keyset_ms:>10.2f}")
+
+        if args.cleanup:
+            await db.execute(delete(User).where(User.name.like("bench-user-%")))
+            await db.commit()
+
+    await async_engine.dispose()
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,94 @@
+"""
+Benchmark: /auth/me profile assembly, joinedload vs single aggregated query
+
+Seeds one user with N projects and N blogs, then compares the old path
+(reload the user with joinedload on both collections) against
+`load_user_profile` by rows transferred, payload size and latency.
+
+Usage:
+    DATABASE_URL=postgresql://... python -m benchmarks.bench_profile \\
+        --items 200 --content-bytes 4000
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.orm import joinedload
+
+from app.database import AsyncSessionLocal, async_engine
+from app.users.models import User
+from app.projects.models import Project
+from app.blogs.models import Blog
+from app.schemas import UserProfileResponse
+from app.utils.serialization import load_user_profile
+
+def joinedload_query(user_id):
+    """The previous /auth/me query"""
+    return (
+        select(User)
+        .options(joinedload(User.projects), joinedload(User.blogs))
+        .where(User.id == user_id)
+    )
+
+async def seed(db, items: int, content_bytes: int) -> User:
+    user = User(name="bench-profile-user", github_username=f"bench-{uuid.uuid4().hex[:8]}")
+    db.add(user)
+    await db.flush()
+    await db.execute(insert(Project), [
+        {"user_id": user.id, "title": f"Project {i}", "description": "d" * 200, "tech_stack": ["Python", "React"]}
+        for i in range(items)
+    ])
+    await db.execute(insert(Blog), [
+        {"user_id": user.id, "title": f"Blog {i}", "content": "c" * content_bytes}
+        for i in range(items)
+    ])
+    await db.commit()
+    await db.refresh(user)
+    return user
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--items", type=int, default=200, help="projects and blogs per user")
+    parser.add_argument("--content-bytes", type=int, default=4000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    async with AsyncSessionLocal() as db:
+        user = await seed(db, args.items, args.content_bytes)
+
+    try:
+        # Raw rows sent by the database for the old query
+        async with async_engine.connect() as conn:
+            old_rows = len((await conn.execute(joinedload_query(user.id))).all())
+
+        old_times, new_times = [], []
+        for _ in range(args.repeat):
+            async with AsyncSessionLocal() as db:
+                start = time.perf_counter()
+                await db.get(User, user.id)  # get_current_user's load
+                result = await db.execute(joinedload_query(user.id))
+                old = UserProfileResponse.model_validate(result.unique().scalars().first())
+                old_times.append((time.perf_counter() - start) * 1000)
+
+            async with AsyncSessionLocal() as db:
+                start = time.perf_counter()
+                new = await load_user_profile(db, user.id, limit=args.items)
+                new_times.append((time.perf_counter() - start) * 1000)
+
+        print(f"user with {args.items} projects and {args.items} blogs")
+        print(f"  joinedload: {old_rows:>7} rows  {statistics.median(old_times):8.2f} ms  "
+              f"{len(old.model_dump_json()):>9} bytes")
+        print(f"  aggregated: {1:>7} rows  {statistics.median(new_times):8.2f} ms  "
+              f"{len(new.model_dump_json()):>9} bytes")
+    finally:
+        async with AsyncSessionLocal() as db:
+            await db.execute(delete(User).where(User.id == user.id))
+            await db.commit()
+        await async_engine.dispose()
+
+if __name__ == "__main__":
+    asyncio.run(main())
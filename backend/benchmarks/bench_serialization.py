@@ -0,0 +1,70 @@
+"""
+Microbenchmark: list endpoint serialization throughput (rows/sec)
+
+Compares the previous path (validate each ORM row, then FastAPI validates
+the dumped dicts again through `response_model`, runs jsonable_encoder and
+json.dumps) with `fast_list_response` (one cached TypeAdapter validation
+per page, encoded by orjson). Needs no database.
+
+Usage:
+    DATABASE_URL=postgresql://... python -m benchmarks.bench_serialization --rows 100
+"""
+
+import argparse
+import json
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import List
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+from app.users.models import User  # noqa: F401 - registers Blog relationships
+from app.projects.models import Project  # noqa: F401
+from app.blogs.models import Blog
+from app.blogs.schemas import BlogResponse
+from app.utils.serialization import fast_list_response
+
+def make_rows(count: int) -> List[Blog]:
+    now = datetime.now(timezone.utc)
+    return [
+        Blog(id=uuid.uuid4(), user_id=uuid.uuid4(), title=f"Blog {i}", content="x" * 2000,
+             summary="A short summary", created_at=now, updated_at=now)
+        for i in range(count)
+    ]
+
+def previous_path(rows, response_adapter) -> bytes:
+    models = [BlogResponse.model_validate(row) for row in rows]
+    dumped = [model.model_dump() for model in models]
+    revalidated = response_adapter.validate_python(dumped)
+    return json.dumps(jsonable_encoder(revalidated)).encode()
+
+def fast_path(rows, _) -> bytes:
+    return fast_list_response(rows, BlogResponse).body
+
+def measure(fn, rows, adapter, seconds: float) -> float:
+    fn(rows, adapter)  # warm up caches
+    pages, start = 0, time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        fn(rows, adapter)
+        pages += 1
+    return pages * len(rows) / (time.perf_counter() - start)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=100, help="rows per page")
+    parser.add_argument("--seconds", type=float, default=2.0, help="time per path")
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    adapter = TypeAdapter(List[BlogResponse])
+    previous = measure(previous_path, rows, adapter, args.seconds)
+    fast = measure(fast_path, rows, adapter, args.seconds)
+
+    print(f"{args.rows}-row pages")
+    print(f"  previous: {previous:12,.0f} rows/s")
+    print(f"  fast:     {fast:12,.0f} rows/s  ({fast / previous:.1f}x)")
+
+if __name__ == "__main__":
+    main()
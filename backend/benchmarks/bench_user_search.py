@@ -0,0 +1,119 @@
+"""
+Benchmark: user directory search latency against latency targets
+
+Seeds the users table with synthetic developers (named from first/last
+name lists, usernames like `janedoe123`, marked with a `bench-search-`
+github_id), then times typeahead and full searches for prefixes,
+misspellings and username fragments. Exits non-zero if a median misses
+its target.
+
+Usage:
+    DATABASE_URL=postgresql://... python -m benchmarks.bench_user_search \\
+        --seed 1000000 --typeahead-target-ms 20 --search-target-ms 50 [--cleanup]
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+
+from sqlalchemy import delete, text
+
+from app.database import AsyncSessionLocal, async_engine
+from app.migrate import migrate
+from app.users.models import User
+from app.projects.models import Project  # noqa: F401 - registers User relationships
+from app.blogs.models import Blog  # noqa: F401
+from app.users.search import search_statement
+
+FIRST_NAMES = [
+    "jane", "john", "maria", "wei", "aisha", "carlos", "olga", "kenji", "fatima", "liam",
+    "noah", "emma", "sofia", "arjun", "chen", "amara", "lucas", "yuki", "omar", "ingrid",
+]
+LAST_NAMES = [
+    "doe", "smith", "garcia", "zhang", "khan", "silva", "petrov", "tanaka", "haddad", "murphy",
+    "nguyen", "kowalski", "rossi", "patel", "kim", "okafor", "muller", "sato", "ali", "larsen",
+]
+
+SEED_SQL = text("""
+    INSERT INTO users (id, name, github_id, github_username, theme_preference, created_at, updated_at)
+    SELECT gen_random_uuid(),
+           initcap(f[1 + g % 20]) || ' ' || initcap(l[1 + (g / 20) % 20]),
+           'bench-search-' || g,
+           f[1 + g % 20] || l[1 + (g / 20) % 20] || g,
+           'light', now() - make_interval(secs => g), now()
+    FROM generate_series(:start, :stop) AS g,
+         (SELECT CAST(:first AS text[]) AS f, CAST(:last AS text[]) AS l) AS names
+""")
+
+# (label, query): prefixes, a later word, misspellings and a username fragment
+QUERIES = [
+    ("prefix 2", "ja"),
+    ("prefix 4", "jane"),
+    ("full name", "jane doe"),
+    ("last name", "tanaka"),
+    ("typo", "jnae"),
+    ("typo last", "kowalsky"),
+    ("username", "kenjisato42"),
+]
+
+async def time_query(db, statement, repeat: int) -> float:
+    """Run a statement `repeat` times and return the median latency in ms"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        (await db.execute(statement)).all()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+async def seed(db, count: int, batch: int = 100_000):
+    start = time.perf_counter()
+    for first in range(1, count + 1, batch):
+        await db.execute(SEED_SQL, {
+            "start": first,
+            "stop": min(first + batch - 1, count),
+            "first": FIRST_NAMES,
+            "last": LAST_NAMES,
+        })
+        await db.commit()
+    await db.execute(text("ANALYZE users"))
+    print(f"seeded {count} users in {time.perf_counter() - start:.1f}s")
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--seed", type=int, default=0, help="synthetic users to insert first")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--typeahead-target-ms", type=float, default=20)
+    parser.add_argument("--search-target-ms", type=float, default=50)
+    parser.add_argument("--cleanup", action="store_true", help="delete synthetic users afterwards")
+    args = parser.parse_args()
+
+    # Make sure pg_trgm and the trigram indexes exist on older databases
+    migrate()
+
+    misses = 0
+    async with AsyncSessionLocal() as db:
+        if args.seed:
+            await seed(db, args.seed)
+
+        print(f"{'query':<12} {'q':<14} {'typeahead ms':>13} {'search ms':>10}")
+        for label, q in QUERIES:
+            typeahead_ms = await time_query(
+                db, search_statement(q, User.id, User.name, User.profile_image, limit=8), args.repeat
+            )
+            search_ms = await time_query(db, search_statement(q, limit=20), args.repeat)
+            over = typeahead_ms > args.typeahead_target_ms or search_ms > args.search_target_ms
+            misses += over
+            print(f"{label:<12} {q:<14} {typeahead_ms:>13.2f} {search_ms:>10.2f}{'  MISSED TARGET' if over else ''}")
+
+        if args.cleanup:
+            await db.execute(delete(User).where(User.github_id.like("bench-search-%")))
+            await db.commit()
+
+    await async_engine.dispose()
+    print(f"targets: typeahead {args.typeahead_target_ms} ms, search {args.search_target_ms} ms (medians)")
+    return 1 if misses else 0
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
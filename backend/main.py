@@ -2,15 +2,24 @@
 DevSnap FastAPI Backend - Updated via CI/CD
 """
 
+import asyncio
+
 from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 
 # Import database and models
-from app.database import engine
-from app.users.models import User
-from app.projects.models import Project
-from app.blogs.models import Blog
+from app.database import (
+    DB_MIGRATE_ON_STARTUP,
+    engine,
+    async_engine,
+    pool_status,
+    pool_wait_seconds,
+    pool_connects,
+    pool_invalidations,
+)
+from app.migrate import migrate
 
 # Import routers
 from app.users.router import router as users_router
@@ -18,18 +27,48 @@ from app.projects.router import router as projects_router
 from app.blogs.router import router as blogs_router
 from app.ai.router import router as ai_router
 from app.auth.router import router as auth_router
+from app.jobs.router import router as jobs_router
+
+# Import shared clients and caches
+from app.auth.cache import principal_cache
+from app.auth import github
+from app.ai.service import close_client as close_ai_client, get_cache as get_ai_cache
+from app.ai import telemetry as ai_telemetry
+from app.ai.prompts import load_encoding
+from app.jobs.config import JOB_WORKERS
+from app.jobs.worker import WorkerPool
+from app.projects.facets import FacetRefresher
+from app.utils.metrics import render_prometheus
 
 # Create database tables on startup
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
-    User.metadata.create_all(bind=engine)
-    Project.metadata.create_all(bind=engine)
-    Blog.metadata.create_all(bind=engine)
-    print("✅ Database tables created successfully!")
+    if DB_MIGRATE_ON_STARTUP:
+        # Workers starting together take turns on an advisory lock; only the first does any DDL
+        migrate()
+        # The sync engine is only needed for migrations
+        engine.dispose()
+        print("✅ Database tables created successfully!")
+    # Tokenizer for prompt budgets (may download its BPE file; kept off the event loop)
+    await asyncio.to_thread(load_encoding)
+    # Shared pooled HTTP client for GitHub OAuth
+    github.get_client()
+    # In-process job workers (more can run separately: python -m app.jobs.worker)
+    job_workers = WorkerPool(JOB_WORKERS)
+    if JOB_WORKERS > 0:
+        job_workers.start()
+    # Periodic refresh of the tech facet counts
+    facet_refresher = FacetRefresher()
+    facet_refresher.start()
     yield
     # Shutdown
     print("🔄 Shutting down DevSnap API...")
+    await job_workers.stop()
+    await facet_refresher.stop()
+    await close_ai_client()
+    await github.close_client()
+    await async_engine.dispose()
 
 # Create FastAPI app
 app = FastAPI(
@@ -54,6 +93,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],  # Keyset pagination cursor
 )
 
 # Include routers
@@ -62,6 +102,7 @@ app.include_router(users_router, prefix="/api/users", tags=["Users"])
 app.include_router(projects_router, prefix="/api/projects", tags=["Projects"])
 app.include_router(blogs_router, prefix="/api/blogs", tags=["Blogs"])
 app.include_router(ai_router, prefix="/api/ai", tags=["AI"])
+app.include_router(jobs_router, prefix="/api/jobs", tags=["Jobs"])
 
 # Simple test endpoint
 @app.get("/")
@@ -83,3 +124,42 @@ async def health_check():
     Health check endpoint
     """
     return {"status": "healthy", "message": "API is running!"}
+
+# Connection pool statistics endpoint
+@app.get("/health/pool")
+async def pool_health():
+    """
+    Connection pool statistics (checked out, overflow, wait time histogram)
+    
+    Use these to size workers against Postgres max_connections.
+    """
+    return pool_status()
+
+# Cache statistics endpoint
+@app.get("/health/cache")
+async def cache_health():
+    """
+    Cache sizes and hit rates for this worker
+    """
+    return {"auth": principal_cache.stats(), "ai": await get_ai_cache().stats()}
+
+# Prometheus metrics endpoint
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """
+    Metrics for this worker in the Prometheus text format
+    
+    Includes AI latency, tokens, cost, cache hits and errors by model and
+    task, plus database pool and cache counters.
+    """
+    ai_cache = get_ai_cache()
+    return render_prometheus([
+        *ai_telemetry.ALL_METRICS,
+        ai_cache.hits,
+        ai_cache.misses,
+        principal_cache.hits,
+        principal_cache.misses,
+        pool_wait_seconds,
+        pool_connects,
+        pool_invalidations,
+    ])
@@ -0,0 +1,316 @@
+"""
+Local fake upstream servers and a recording database session used by the tests
+"""
+
+import asyncio
+import re
+import socket
+import threading
+import time
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+import uvicorn
+import json
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+from sqlalchemy.dialects import postgresql
+
+def run_ai(coro):
+    """Run a coroutine on a fresh event loop, then close the shared AI client"""
+    from app.ai import service
+
+    async def wrapper():
+        try:
+            return await coro
+        finally:
+            await service.close_client()
+    return asyncio.run(wrapper())
+
+def sql(statement) -> str:
+    """Compile a statement to Postgres SQL"""
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+class Row(SimpleNamespace):
+    """A result row with attribute and mapping access, like SQLAlchemy's Row"""
+
+    @property
+    def _mapping(self) -> dict:
+        return vars(self)
+
+class FakeResult:
+    """The parts of a SQLAlchemy Result the app uses"""
+
+    def __init__(self, rows=(), rowcount=None):
+        self.rows = list(rows)
+        self.rowcount = len(self.rows) if rowcount is None else rowcount
+
+    def __iter__(self):
+        return iter(self.rows)
+
+    def all(self):
+        return self.rows
+
+    def first(self):
+        return self.rows[0] if self.rows else None
+
+    def one(self):
+        assert len(self.rows) == 1, f"expected one row, got {len(self.rows)}"
+        return self.rows[0]
+
+    def scalar(self):
+        return self.first()
+
+    def scalars(self):
+        return FakeResult(self.rows)
+
+class RecordingSession:
+    """
+    Stands in for an AsyncSession without a database
+
+    Every statement is recorded. `respond(statement)` decides the answer
+    (a FakeResult or a list of rows; empty by default), and `error` is
+    raised from every execute when set. Also works as
+    `async with AsyncSessionLocal()` when patched in for the session factory.
+    """
+
+    def __init__(self, respond=None, error=None):
+        self.respond = respond
+        self.error = error
+        self.statements = []
+        self.commits = 0
+        self.rollbacks = 0
+
+    async def execute(self, statement, params=None):
+        self.statements.append(statement)
+        if self.error is not None:
+            raise self.error
+        result = self.respond(statement) if self.respond else FakeResult()
+        return result if isinstance(result, FakeResult) else FakeResult(result)
+
+    async def get(self, model, ident):
+        return None
+
+    async def commit(self):
+        self.commits += 1
+
+    async def rollback(self):
+        self.rollbacks += 1
+
+    async def close(self):
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def __call__(self):
+        return self
+
+    @property
+    def sql(self) -> list:
+        return [sql(statement) for statement in self.statements]
+
+@contextmanager
+def override_db(app, session: RecordingSession):
+    """Serve `get_async_db` from a recording session for the duration of the block"""
+    from app.database import get_async_db
+
+    async def recording_db():
+        yield session
+
+    app.dependency_overrides[get_async_db] = recording_db
+    try:
+        yield session
+    finally:
+        app.dependency_overrides.pop(get_async_db, None)
+
+def _estimate_tokens(text: str) -> int:
+    """Rough BPE-like count: words, punctuation and whitespace runs"""
+    return len(re.findall(r"\w+|[^\w\s]|\s+", text))
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+class LocalServer:
+    """Run an ASGI app with uvicorn on a background thread"""
+
+    def __init__(self, app: FastAPI):
+        self.port = _free_port()
+        self.url = f"http://127.0.0.1:{self.port}"
+        config = uvicorn.Config(app, host="127.0.0.1", port=self.port, log_level="warning")
+        self._server = uvicorn.Server(config)
+        self._thread = threading.Thread(target=self._server.run, daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        deadline = time.time() + 10
+        while not self._server.started:
+            if time.time() > deadline:
+                raise RuntimeError("Fake server did not start")
+            time.sleep(0.01)
+        return self
+
+    def __exit__(self, *exc):
+        self._server.should_exit = True
+        self._thread.join(timeout=5)
+
+class FakeOpenAIServer(LocalServer):
+    """
+    Minimal OpenAI-compatible chat completions server
+
+    Every call sleeps for `delay` seconds and records the request body, so
+    tests can count upstream calls and observe in-flight concurrency.
+    Streaming calls send one word every `token_delay` seconds and record
+    whether the client read the whole stream or went away early.
+    The first `rate_limited` calls are answered with 429 and Retry-After.
+    Prompt tokens are estimated independently of the app's tokenizer, and
+    `prompt_token_delay` adds prefill time per prompt token.
+    """
+
+    def __init__(self, delay: float = 0.5, content: str = "Fake completion.", token_delay: float = 0.1):
+        self.delay = delay
+        self.rate_limited = 0
+        self.prompt_token_delay = 0.0
+        self.prompt_tokens = []
+        self.retry_after = "0.05"
+        self.content = content
+        self.token_delay = token_delay
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.streams_completed = 0
+        self.streams_aborted = 0
+        app = FastAPI()
+
+        @app.post("/v1/chat/completions")
+        async def chat_completions(request: Request):
+            body = await request.json()
+            self.requests.append(body)
+            if self.rate_limited > 0:
+                self.rate_limited -= 1
+                return JSONResponse(
+                    {"error": {"message": "Rate limit reached", "type": "rate_limit_error"}},
+                    status_code=429,
+                    headers={"Retry-After": self.retry_after},
+                )
+            prompt_tokens = sum(_estimate_tokens(message["content"]) for message in body["messages"])
+            self.prompt_tokens.append(prompt_tokens)
+            if body.get("stream"):
+                return StreamingResponse(self._stream(body), media_type="text/event-stream")
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            try:
+                await asyncio.sleep(self.delay + self.prompt_token_delay * prompt_tokens)
+            finally:
+                self.in_flight -= 1
+            return {
+                "id": f"chatcmpl-{len(self.requests)}",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": body.get("model", "fake-model"),
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": self.content},
+                    "finish_reason": "stop",
+                }],
+                "usage": {"prompt_tokens": prompt_tokens, "completion_tokens": 5, "total_tokens": prompt_tokens + 5},
+            }
+
+        super().__init__(app)
+
+    async def _stream(self, body):
+        completed = False
+        try:
+            for i, word in enumerate(self.content.split(" ")):
+                await asyncio.sleep(self.token_delay)
+                chunk = {
+                    "id": "chatcmpl-stream",
+                    "object": "chat.completion.chunk",
+                    "created": int(time.time()),
+                    "model": body.get("model", "fake-model"),
+                    "choices": [{"index": 0, "delta": {"content": word if i == 0 else f" {word}"}, "finish_reason": None}],
+                }
+                yield f"data: {json.dumps(chunk)}\n\n"
+            if (body.get("stream_options") or {}).get("include_usage"):
+                prompt_tokens = sum(_estimate_tokens(message["content"]) for message in body["messages"])
+                completion_tokens = len(self.content.split(" "))
+                usage = {
+                    "prompt_tokens": prompt_tokens,
+                    "completion_tokens": completion_tokens,
+                    "total_tokens": prompt_tokens + completion_tokens,
+                }
+                chunk = {
+                    "id": "chatcmpl-stream",
+                    "object": "chat.completion.chunk",
+                    "created": int(time.time()),
+                    "model": body.get("model", "fake-model"),
+                    "choices": [],
+                    "usage": usage,
+                }
+                yield f"data: {json.dumps(chunk)}\n\n"
+            yield "data: [DONE]\n\n"
+            completed = True
+        finally:
+            if completed:
+                self.streams_completed += 1
+            else:
+                self.streams_aborted += 1
+
+    @property
+    def base_url(self) -> str:
+        return f"{self.url}/v1"
+
+class FakeGitHubServer(LocalServer):
+    """
+    Minimal GitHub OAuth token exchange and user API
+
+    Every call sleeps for `delay` seconds. The first `unavailable` user
+    lookups answer 503 so retries can be observed.
+    """
+
+    def __init__(self, delay: float = 0.5):
+        self.delay = delay
+        self.unavailable = 0
+        self.token_requests = 0
+        self.user_requests = 0
+        self.peers = set()
+        app = FastAPI()
+
+        @app.post("/login/oauth/access_token")
+        async def access_token(request: Request):
+            form = await request.form()
+            self.token_requests += 1
+            self.peers.add(request.client.port)
+            await asyncio.sleep(self.delay)
+            if form.get("code") == "bad-code":
+                return {"error": "bad_verification_code"}
+            return {"access_token": f"gho_{form['code']}", "token_type": "bearer", "scope": "user:email"}
+
+        @app.get("/user")
+        async def user(request: Request):
+            self.user_requests += 1
+            self.peers.add(request.client.port)
+            await asyncio.sleep(self.delay)
+            if self.unavailable > 0:
+                self.unavailable -= 1
+                return JSONResponse({"message": "Service Unavailable"}, status_code=503)
+            token = request.headers["authorization"].split("gho_", 1)[1]
+            return {
+                "id": abs(hash(token)) % 10_000_000,
+                "login": f"dev-{token}",
+                "name": None,
+                "email": f"{token}@example.com",
+                "avatar_url": f"https://avatars.example.com/{token}.png",
+            }
+
+        super().__init__(app)
+
+    @property
+    def base_url(self) -> str:
+        return self.url
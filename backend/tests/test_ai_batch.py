@@ -0,0 +1,139 @@
+"""
+Tests for batch project summary generation
+"""
+
+import json
+import time
+import uuid
+
+import httpx
+from sqlalchemy.dialects import postgresql
+
+from app.ai import batch, service
+from main import app
+from tests.fakes import FakeResult, RecordingSession, Row, run_ai, sql
+
+def _post(path, payload):
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.post(path, json=payload)
+    return run_ai(scenario())
+
+def test_batch_retries_rate_limits_and_returns_every_item(fake_openai, monkeypatch):
+    """429s are retried after Retry-After and each item gets its own result"""
+    monkeypatch.setattr(service, "OPENAI_MAX_RETRIES", 0)
+    monkeypatch.setattr(batch, "AI_BATCH_CONCURRENCY", 2)
+    fake_openai.delay = 0.05
+    fake_openai.rate_limited = 3
+
+    items = [{"title": f"Project {i}"} for i in range(6)]
+    response = _post("/api/ai/generate-project-summaries", {"items": items})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["succeeded"] == 6 and body["failed"] == 0
+    assert [r["index"] for r in body["results"]] == list(range(6))
+    assert all(r["content"] == "Fake completion." for r in body["results"])
+    assert len(fake_openai.requests) == 9
+    assert fake_openai.max_in_flight <= 2
+
+def test_batch_reports_failures_per_item(fake_openai, monkeypatch):
+    """An item that exhausts its retries fails without sinking the batch"""
+    monkeypatch.setattr(service, "OPENAI_MAX_RETRIES", 0)
+    monkeypatch.setattr(batch, "AI_BATCH_MAX_RETRIES", 1)
+    monkeypatch.setattr(batch, "AI_BATCH_CONCURRENCY", 1)
+    fake_openai.delay = 0.01
+    fake_openai.rate_limited = 2
+
+    items = [{"title": "First"}, {"title": "Second"}]
+    response = _post("/api/ai/generate-project-summaries", {"items": items})
+
+    body = response.json()
+    assert body["succeeded"] == 1 and body["failed"] == 1
+    assert body["results"][0]["success"] is False
+    assert body["results"][1]["content"] == "Fake completion."
+
+def test_batch_streams_ndjson(fake_openai):
+    """stream=true sends one line per item plus a totals line"""
+    fake_openai.delay = 0.01
+    items = [{"title": f"Project {i}"} for i in range(3)]
+    response = _post("/api/ai/generate-project-summaries?stream=true", {"items": items})
+
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert sorted(line["index"] for line in lines[:-1]) == [0, 1, 2]
+    assert lines[-1] == {"succeeded": 3, "failed": 0, "written": 0}
+
+def test_batch_size_is_validated(fake_openai, monkeypatch):
+    monkeypatch.setattr("app.ai.router.AI_BATCH_MAX_ITEMS", 2)
+    assert _post("/api/ai/generate-project-summaries", {"items": []}).status_code == 400
+    too_many = {"items": [{"title": "x"}] * 3}
+    assert _post("/api/ai/generate-project-summaries", too_many).status_code == 400
+
+def test_retry_after_is_capped(fake_openai, monkeypatch):
+    """A huge Retry-After waits at most AI_BATCH_MAX_RETRY_DELAY_SECONDS"""
+    monkeypatch.setattr(batch, "AI_BATCH_MAX_RETRY_DELAY_SECONDS", 0.05)
+    fake_openai.delay = 0.01
+    fake_openai.rate_limited = 1
+    fake_openai.retry_after = "3600"
+
+    start = time.perf_counter()
+    response = _post("/api/ai/generate-project-summaries", {"items": [{"title": "Slow down"}]})
+
+    assert response.json()["succeeded"] == 1
+    assert time.perf_counter() - start < 2
+
+def test_client_retries_are_off_for_batch_items(fake_openai, monkeypatch):
+    """Each item makes at most AI_BATCH_MAX_RETRIES + 1 upstream calls, whatever OPENAI_MAX_RETRIES is"""
+    monkeypatch.setattr(service, "OPENAI_MAX_RETRIES", 2)
+    monkeypatch.setattr(batch, "AI_BATCH_MAX_RETRIES", 1)
+    fake_openai.delay = 0.01
+    fake_openai.rate_limited = 100
+    fake_openai.retry_after = "0"
+
+    response = _post("/api/ai/generate-project-summaries", {"items": [{"title": "Limited"}]})
+
+    assert response.json()["failed"] == 1
+    assert len(fake_openai.requests) == 2
+
+def test_item_bypass_cache_is_honoured(fake_openai):
+    fake_openai.delay = 0.01
+    path = "/api/ai/generate-project-summaries"
+    _post(path, {"items": [{"title": "Cached"}, {"title": "Fresh"}]})
+
+    response = _post(path, {"items": [{"title": "Cached"}, {"title": "Fresh", "bypass_cache": True}]})
+
+    assert response.json()["succeeded"] == 2
+    # Only the item that asked to skip the cache went upstream again
+    assert len(fake_openai.requests) == 3
+
+def test_write_back_saves_found_projects_in_one_update(fake_openai, monkeypatch):
+    fake_openai.delay = 0.01
+    found = [uuid.uuid4(), uuid.uuid4()]
+    missing = uuid.uuid4()
+
+    def respond(statement):
+        if statement.is_update:
+            return FakeResult(rowcount=2)
+        return [Row(id=project_id, title="DevSnap", description=None, tech_stack=None) for project_id in found]
+
+    db = RecordingSession(respond)
+    monkeypatch.setattr(batch, "AsyncSessionLocal", db)
+
+    response = _post(
+        "/api/ai/generate-project-summaries",
+        {"project_ids": [str(project_id) for project_id in found + [missing]], "write_back": True},
+    )
+
+    body = response.json()
+    assert response.status_code == 200
+    assert body["succeeded"] == 2 and body["failed"] == 1 and body["written"] == 2
+    assert body["results"][2]["error"] == "Project not found"
+    load, save = db.statements
+    assert save.is_update and "FROM (VALUES" in sql(save)
+    # One VALUES row per project that got a summary
+    params = list(save.compile(dialect=postgresql.dialect()).params.values())
+    assert set(params[0::2]) == set(found)
+    assert params[1::2] == ["Fake completion."] * 2
+    assert db.commits == 1
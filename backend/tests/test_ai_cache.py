@@ -0,0 +1,93 @@
+"""
+Tests for the AI generation cache
+"""
+
+import asyncio
+import time
+
+from app.ai import service
+from app.ai.cache import MemoryAICache, SQLiteAICache, cache_key
+from tests.fakes import run_ai
+
+MESSAGES = [{"role": "user", "content": "Write a bio for Ada"}]
+
+def test_cache_key_ignores_whitespace_but_not_settings():
+    base = cache_key("gpt", 0.7, 500, MESSAGES)
+    reformatted = cache_key("gpt", 0.7, 500, [{"role": "user", "content": "  Write a bio\n\n   for Ada "}])
+
+    assert base == reformatted
+    assert base != cache_key("gpt", 0.2, 500, MESSAGES)
+    assert base != cache_key("other", 0.7, 500, MESSAGES)
+
+def test_memory_cache_evicts_least_recently_used_and_expired():
+    async def scenario():
+        cache = MemoryAICache(max_entries=2, ttl_seconds=60)
+        await cache.set("a", "A")
+        await cache.set("b", "B")
+        await cache.get("a")
+        await cache.set("c", "C")
+        evicted = await cache.get("b")
+
+        expiring = MemoryAICache(max_entries=2, ttl_seconds=0)
+        await expiring.set("a", "A")
+        return evicted, await cache.get("a"), await expiring.get("a")
+
+    assert asyncio.run(scenario()) == (None, "A", None)
+
+def test_sqlite_cache_is_shared_between_instances(tmp_path):
+    path = str(tmp_path / "ai_cache.sqlite3")
+
+    async def scenario():
+        worker_one = SQLiteAICache(path=path, max_entries=2, ttl_seconds=60)
+        worker_two = SQLiteAICache(path=path, max_entries=2, ttl_seconds=60)
+        await worker_one.set("a", "A")
+        shared = await worker_two.get("a")
+
+        time.sleep(0.01)
+        await worker_two.set("b", "B")
+        await worker_two.set("c", "C")  # evicts "a", the least recently used
+        return shared, await worker_one.get("a"), await worker_one.size()
+
+    assert asyncio.run(scenario()) == ("A", None, 2)
+
+def test_identical_requests_hit_cache_and_bypass_refreshes(fake_openai):
+    fake_openai.delay = 0
+    info = {"title": "DevSnap", "description": "Portfolio builder", "tech_stack": ["FastAPI"]}
+
+    async def scenario():
+        first = await service.AIService.generate_project_summary(info)
+        second = await service.AIService.generate_project_summary(dict(info))
+        fresh = await service.AIService.generate_project_summary(info, bypass_cache=True)
+        return first, second, fresh
+
+    results = run_ai(scenario())
+
+    assert results == ("Fake completion.",) * 3
+    assert len(fake_openai.requests) == 2
+    assert asyncio.run(service.get_cache().stats())["hits"] == 1
+
+def test_cache_health_counts_sqlite_entries_off_the_event_loop(tmp_path, monkeypatch):
+    import main
+    from fastapi.testclient import TestClient
+
+    cache = SQLiteAICache(path=str(tmp_path / "ai_cache.sqlite3"), max_entries=10, ttl_seconds=60)
+    asyncio.run(cache.set("a", "A"))
+    loops = []
+    count = cache._size_sync
+
+    def size_sync():
+        try:
+            loops.append(asyncio.get_running_loop())
+        except RuntimeError:
+            loops.append(None)
+        return count()
+
+    monkeypatch.setattr(cache, "_size_sync", size_sync)
+    monkeypatch.setattr(main, "get_ai_cache", lambda: cache)
+
+    response = TestClient(main.app).get("/health/cache")
+
+    assert response.status_code == 200
+    assert response.json()["ai"]["backend"] == "sqlite"
+    assert response.json()["ai"]["entries"] == 1
+    assert loops == [None]  # counted in a worker thread, not on the event loop
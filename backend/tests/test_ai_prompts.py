@@ -0,0 +1,164 @@
+"""
+Tests for the compact prompt builder and per-task token budgets
+"""
+
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from app.ai import prompts, service
+from tests.fakes import run_ai
+
+# A project with a pasted README as its description
+LONG_PROJECT = {
+    "title": "DevSnap",
+    "description": " ".join(
+        f"Section {i}: the backend serves portfolios with FastAPI, caches AI output and paginates with keysets."
+        for i in range(150)
+    ),
+    "tech_stack": ["FastAPI", "PostgreSQL", "React", "OpenAI"],
+}
+
+def legacy_project_summary_prompt(project_info: dict) -> str:
+    """The f-string prompt used before the prompt builder, kept as a baseline"""
+    prompt = f"""
+        Generate a compelling project summary for: {project_info.get('title', 'Project')}
+        
+        Project Information:
+        - Title: {project_info.get('title', 'Project')}
+        - Description: {project_info.get('description', 'No description provided')}
+        - Tech Stack: {project_info.get('tech_stack', [])}
+       
+        
+        Requirements:
+        - Highlight key features and technologies
+        - Explain the problem it solves
+        - Mention the impact or results
+        - Keep it concise (2-3 sentences)
+        - Professional and engaging tone
+        - Suitable for a portfolio
+        
+        Generate the project summary:
+        """
+    return prompt
+
+def test_templates_are_compact_and_lists_are_joined():
+    prompt = prompts.project_summary_prompt({"title": "DevSnap", "tech_stack": ["FastAPI", "React"]})
+
+    assert "Tech stack: FastAPI, React" in prompt.user
+    assert "['" not in prompt.user
+    assert all(line == line.strip() and line for line in prompt.user.splitlines())
+
+def test_missing_optional_fields_do_not_render_none():
+    prompt = prompts.bio_prompt({"name": "Dev", "current_role": None, "skills": None, "tone_preference": None})
+
+    assert "None" not in prompt.user
+    assert "professional" in prompt.user
+
+def test_long_inputs_are_truncated_to_budget(monkeypatch):
+    monkeypatch.setattr(prompts, "AI_DESCRIPTION_TOKEN_BUDGET", 50)
+    prompt = prompts.project_summary_prompt(LONG_PROJECT)
+    description = prompt.user.split("Description: ", 1)[1].split("\n", 1)[0]
+
+    assert description.endswith("…")
+    assert prompts.count_tokens(description) <= 51
+    assert prompts.truncate_to_tokens("short text", 50) == "short text"
+
+def test_max_tokens_is_per_task_and_capped(monkeypatch):
+    assert prompts.blog_summary_prompt({"title": "t", "content": "c"}).max_tokens < 500
+    monkeypatch.setattr(prompts, "MAX_TOKENS", 60)
+    assert prompts.bio_prompt({"name": "Dev"}).max_tokens == 60
+
+def test_prompt_tokens_and_latency_drop_against_legacy_prompt(fake_openai):
+    """Regression: the builder sends far fewer prompt tokens, so prefill is faster"""
+    fake_openai.delay = 0.01
+    fake_openai.prompt_token_delay = 0.0002  # Prefill time per prompt token
+
+    async def legacy_call():
+        start = time.perf_counter()
+        await service.get_client().chat.completions.create(
+            model=service.OPENAI_MODEL,
+            messages=[
+                {"role": "system", "content": prompts.PROJECT_SUMMARY_SYSTEM_PROMPT},
+                {"role": "user", "content": legacy_project_summary_prompt(LONG_PROJECT)},
+            ],
+            max_tokens=500,
+            temperature=service.TEMPERATURE,
+        )
+        return time.perf_counter() - start
+
+    async def builder_call():
+        start = time.perf_counter()
+        await service.AIService.complete_project_summary(LONG_PROJECT, bypass_cache=True)
+        return time.perf_counter() - start
+
+    legacy_latency = run_ai(legacy_call())
+    builder_latency = run_ai(builder_call())
+    legacy_tokens, builder_tokens = fake_openai.prompt_tokens
+    legacy_request, builder_request = fake_openai.requests
+
+    assert builder_tokens < legacy_tokens * 0.5
+    assert builder_latency < legacy_latency
+    assert legacy_request["max_tokens"] == 500
+    assert builder_request["max_tokens"] == prompts.AI_MAX_TOKENS_PROJECT_SUMMARY
+
+def test_short_prompt_still_shrinks():
+    """Even without truncation, compaction removes the indentation tokens"""
+    project = {"title": "DevSnap", "description": "Portfolio builder", "tech_stack": ["FastAPI"]}
+    legacy = legacy_project_summary_prompt(project)
+    compact = prompts.project_summary_prompt(project).user
+
+    assert prompts.count_tokens(compact) < prompts.count_tokens(legacy) * 0.7
+
+class FakeEncoding:
+    """One token per word, so counts differ from the character estimate"""
+
+    def encode(self, text):
+        return text.split(" ")
+
+    def decode(self, tokens):
+        return " ".join(tokens)
+
+@pytest.fixture
+def reset_encoding(monkeypatch):
+    monkeypatch.setattr(prompts, "_encoding", None)
+    monkeypatch.setattr(prompts, "_encoding_loaded", False)
+
+def test_tiktoken_encoding_is_used_and_loaded_once(monkeypatch, reset_encoding):
+    loads = []
+
+    def encoding_for_model(model):
+        loads.append(model)
+        return FakeEncoding()
+
+    monkeypatch.setattr(prompts, "tiktoken", SimpleNamespace(encoding_for_model=encoding_for_model))
+
+    assert prompts.count_tokens("one two three") == 3
+    assert prompts.truncate_to_tokens("one two three four five", 3) == "one two…"
+    prompts.count_tokens("again")
+    assert loads == [prompts.OPENAI_MODEL]
+
+def test_unknown_model_uses_default_encoding(monkeypatch, reset_encoding):
+    def encoding_for_model(model):
+        raise KeyError(model)
+
+    monkeypatch.setattr(prompts, "tiktoken", SimpleNamespace(
+        encoding_for_model=encoding_for_model,
+        get_encoding=lambda name: FakeEncoding(),
+    ))
+    assert prompts.count_tokens("one two") == 2
+
+def test_failed_encoding_download_falls_back_to_estimate(monkeypatch, reset_encoding):
+    calls = []
+
+    def encoding_for_model(model):
+        calls.append(model)
+        raise ConnectionError("BPE download failed")
+
+    monkeypatch.setattr(prompts, "tiktoken", SimpleNamespace(encoding_for_model=encoding_for_model))
+
+    prompt = prompts.project_summary_prompt(LONG_PROJECT)
+    assert prompt.user.startswith("Write a compelling")
+    assert prompts.count_tokens("x" * 40) == 40 // prompts.CHARS_PER_TOKEN
+    assert len(calls) == 1  # Not retried on every prompt
@@ -0,0 +1,56 @@
+"""
+Tests for the async AI service against a local fake OpenAI server
+"""
+
+import asyncio
+import time
+
+import httpx
+
+from app.ai import service
+from main import app
+from tests.fakes import run_ai
+
+def test_health_stays_fast_while_generations_in_flight(fake_openai):
+    """Unrelated endpoints must not wait behind slow model calls"""
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            generations = [
+                asyncio.create_task(client.post("/api/ai/generate-bio", json={"name": f"Dev {i}"}))
+                for i in range(20)
+            ]
+            await asyncio.sleep(0.1)  # let the generations reach the fake server
+
+            latencies = []
+            for _ in range(5):
+                start = time.perf_counter()
+                response = await client.get("/health")
+                latencies.append(time.perf_counter() - start)
+                assert response.status_code == 200
+
+            results = await asyncio.gather(*generations)
+        return latencies, results
+
+    latencies, results = run_ai(scenario())
+
+    assert max(latencies) < 0.1
+    assert all(r.status_code == 200 for r in results)
+    assert all(r.json()["content"] == "Fake completion." for r in results)
+    assert fake_openai.max_in_flight > 1
+
+def test_concurrency_is_bounded_by_semaphore(fake_openai, monkeypatch):
+    """No more than AI_MAX_CONCURRENCY calls reach the upstream at once"""
+    monkeypatch.setattr(service, "AI_MAX_CONCURRENCY", 3)
+    fake_openai.delay = 0.1
+
+    async def scenario():
+        return await asyncio.gather(*[
+            service.AIService.generate_project_summary({"title": f"Project {i}"})
+            for i in range(9)
+        ])
+
+    results = run_ai(scenario())
+
+    assert results == ["Fake completion."] * 9
+    assert fake_openai.max_in_flight == 3
@@ -0,0 +1,65 @@
+"""
+Tests for request coalescing of identical AI prompts
+"""
+
+import asyncio
+
+from app.ai import service
+from app.ai.cache import SQLiteAICache
+from app.ai.singleflight import SingleFlight, SQLiteLockStore
+from tests.fakes import run_ai
+
+def test_concurrent_identical_prompts_make_one_upstream_call(fake_openai):
+    """Every unique prompt reaches the slow model server exactly once"""
+    fake_openai.delay = 0.3
+    titles = ["Alpha", "Beta", "Gamma"]
+
+    async def scenario():
+        return await asyncio.gather(*[
+            service.AIService.generate_project_summary({"title": title, "tech_stack": ["Go"]})
+            for title in titles
+            for _ in range(10)
+        ])
+
+    results = run_ai(scenario())
+
+    assert results == ["Fake completion."] * 30
+    prompts = [body["messages"][1]["content"] for body in fake_openai.requests]
+    assert len(prompts) == len(titles)
+    assert all(sum(title in prompt for prompt in prompts) == 1 for title in titles)
+
+def test_bypass_cache_is_not_coalesced(fake_openai):
+    fake_openai.delay = 0.1
+
+    async def scenario():
+        return await asyncio.gather(*[
+            service.AIService.generate_bio({"name": "Ada"}, bypass_cache=True)
+            for _ in range(3)
+        ])
+
+    run_ai(scenario())
+
+    assert len(fake_openai.requests) == 3
+
+def test_workers_sharing_a_lock_store_make_one_upstream_call(tmp_path):
+    """Two workers (separate instances on one SQLite file) share one call"""
+    path = str(tmp_path / "ai_cache.sqlite3")
+    calls = []
+
+    def worker():
+        cache = SQLiteAICache(path=path)
+        flight = SingleFlight(cache, SQLiteLockStore(path), poll_interval=0.01)
+
+        async def generate():
+            calls.append(1)
+            await asyncio.sleep(0.2)
+            await cache.set("prompt-key", "shared result")
+            return "shared result"
+
+        return flight.do("prompt-key", generate)
+
+    async def scenario():
+        return await asyncio.gather(worker(), worker(), worker())
+
+    assert asyncio.run(scenario()) == ["shared result"] * 3
+    assert len(calls) == 1
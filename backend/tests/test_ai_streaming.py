@@ -0,0 +1,97 @@
+"""
+Tests for token-by-token AI streaming
+"""
+
+import asyncio
+import json
+import time
+
+import httpx
+
+from app.ai import service
+from main import app
+from tests.fakes import run_ai
+
+CONTENT = "A builder of fast and friendly developer tools."
+
+def test_first_chunk_arrives_before_completion_finishes(fake_openai):
+    fake_openai.content = CONTENT
+
+    async def scenario():
+        # The first call imports the client's lazily loaded resources; keep that out of the timing
+        fake_openai.token_delay = 0
+        async for _ in service.AIService.stream_bio({"name": "Warm"}):
+            pass
+        fake_openai.token_delay = 0.05
+        start = time.perf_counter()
+        first_chunk_at, chunks = None, []
+        async for chunk in service.AIService.stream_bio({"name": "Ada"}):
+            first_chunk_at = first_chunk_at or time.perf_counter() - start
+            chunks.append(chunk)
+        return first_chunk_at, time.perf_counter() - start, chunks
+
+    first_chunk_at, total, chunks = run_ai(scenario())
+
+    assert "".join(chunks) == CONTENT
+    assert len(chunks) == len(CONTENT.split(" "))
+    assert first_chunk_at < total / 3
+
+def test_stopping_early_aborts_the_upstream_stream(fake_openai):
+    fake_openai.content = CONTENT
+    fake_openai.token_delay = 0.05
+
+    async def scenario():
+        chunks = service.AIService.stream_project_summary({"title": "DevSnap"})
+        first = await chunks.__anext__()
+        await chunks.aclose()  # what a client disconnect does to the SSE generator
+        for _ in range(50):
+            if fake_openai.streams_aborted:
+                break
+            await asyncio.sleep(0.02)
+        return first
+
+    assert run_ai(scenario()) == "A"
+    assert fake_openai.streams_aborted == 1
+    assert fake_openai.streams_completed == 0
+    assert asyncio.run(service.get_cache().size()) == 0  # partial output is never cached
+
+def test_slow_reader_frees_the_concurrency_slot_once_upstream_finishes(fake_openai):
+    fake_openai.content = CONTENT
+    fake_openai.token_delay = 0
+
+    async def scenario():
+        service._semaphore = asyncio.Semaphore(1)
+        chunks = service.AIService.stream_bio({"name": "Ada"})
+        received = [await chunks.__anext__()]
+        for _ in range(50):
+            if fake_openai.streams_completed:
+                break
+            await asyncio.sleep(0.02)
+        await asyncio.sleep(0.02)
+        # The client has read one chunk, but the model is done and the slot is free
+        released = not service.get_semaphore().locked()
+        received += [chunk async for chunk in chunks]
+        return released, received
+
+    released, received = run_ai(scenario())
+
+    assert released
+    assert "".join(received) == CONTENT
+    assert asyncio.run(service.get_cache().size()) == 1  # the complete generation is cached
+
+def test_stream_endpoint_sends_server_sent_events(fake_openai):
+    fake_openai.content = CONTENT
+    fake_openai.token_delay = 0
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.post("/api/ai/generate-bio/stream", json={"name": "Ada"})
+
+    response = run_ai(scenario())
+    events = [block for block in response.text.split("\n\n") if block]
+
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert events[-1] == "event: done\ndata: {}"
+    text = "".join(json.loads(event[len("data: "):])["content"] for event in events[:-1])
+    assert text == CONTENT
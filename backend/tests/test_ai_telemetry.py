@@ -0,0 +1,75 @@
+"""
+Tests for AI latency, token, cost and cache telemetry
+"""
+
+import httpx
+
+from app.ai import service, telemetry
+from main import app
+from tests.fakes import run_ai
+
+def _value(family, **labels):
+    return family.labels(model=service.OPENAI_MODEL, **labels).snapshot()
+
+def test_completion_records_latency_tokens_cost_and_cache(fake_openai, monkeypatch):
+    monkeypatch.setattr(service, "OPENAI_MODEL", "gpt-4o-mini")
+    fake_openai.delay = 0.05
+    latency_before = _value(telemetry.request_seconds, task="blog_summary")["count"]
+    tokens_before = _value(telemetry.prompt_tokens, task="blog_summary")
+    hits_before = _value(telemetry.cache_lookups, task="blog_summary", result="hit")
+
+    async def scenario():
+        for _ in range(2):
+            await service.AIService.complete_blog_summary({"title": "Telemetry", "content": "Count tokens."})
+
+    run_ai(scenario())
+
+    assert _value(telemetry.request_seconds, task="blog_summary")["count"] == latency_before + 1
+    assert _value(telemetry.request_seconds, task="blog_summary")["sum"] >= 0.05
+    assert _value(telemetry.prompt_tokens, task="blog_summary") == tokens_before + fake_openai.prompt_tokens[0]
+    assert _value(telemetry.cache_lookups, task="blog_summary", result="hit") == hits_before + 1
+    assert _value(telemetry.cost_usd, task="blog_summary") > 0
+
+def test_errors_are_counted_by_type(fake_openai, monkeypatch):
+    monkeypatch.setattr(service, "OPENAI_MAX_RETRIES", 0)
+    fake_openai.rate_limited = 1
+    before = _value(telemetry.errors, task="project_summary", error="RateLimitError")
+
+    result = run_ai(service.AIService.generate_project_summary({"title": "Limited"}))
+
+    assert result.startswith("Error generating project summary")
+    assert _value(telemetry.errors, task="project_summary", error="RateLimitError") == before + 1
+
+def test_streaming_records_usage_and_first_token(fake_openai):
+    fake_openai.content = "one two three"
+    fake_openai.token_delay = 0.01
+    tokens_before = _value(telemetry.completion_tokens, task="bio")
+    ttft_before = _value(telemetry.first_token_seconds, task="bio")["count"]
+
+    async def scenario():
+        return [chunk async for chunk in service.AIService.stream_bio({"name": "Streamer"})]
+
+    assert "".join(run_ai(scenario())) == "one two three"
+    assert _value(telemetry.completion_tokens, task="bio") == tokens_before + 3
+    assert _value(telemetry.first_token_seconds, task="bio")["count"] == ttft_before + 1
+
+def test_metrics_endpoint_renders_prometheus_text(fake_openai):
+    fake_openai.delay = 0.01
+    run_ai(service.AIService.generate_bio({"name": "Metrics"}))
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.get("/metrics")
+
+    response = run_ai(scenario())
+    assert response.status_code == 200
+    assert "# TYPE ai_request_seconds histogram" in response.text
+    assert f'ai_request_seconds_count{{model="{service.OPENAI_MODEL}",task="bio"}}' in response.text
+    assert 'ai_request_seconds_bucket{model="' in response.text and 'le="+Inf"}' in response.text
+    assert "# TYPE db_pool_connects_total counter" in response.text
+
+def test_estimate_cost_uses_longest_model_prefix():
+    assert telemetry.estimate_cost("gpt-4o-mini-2024-07-18", 1_000_000, 0) == 0.15
+    assert telemetry.estimate_cost("gpt-4o", 0, 1_000_000) == 10.0
+    assert telemetry.estimate_cost("unknown-model", 1000, 1000) == 0.0
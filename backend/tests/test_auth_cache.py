@@ -0,0 +1,90 @@
+"""
+Tests for the principal cache used by get_current_user
+"""
+
+import time
+import uuid
+from datetime import datetime
+
+from app.auth.cache import PrincipalCache, UserSnapshot
+
+def _snapshot(user_id=None):
+    now = datetime.utcnow()
+    return UserSnapshot(
+        id=user_id or uuid.uuid4(), name="Dev", email=None, github_id="1",
+        github_username="dev", bio=None, profile_image=None,
+        theme_preference="light", created_at=now, updated_at=now,
+    )
+
+def test_hit_and_miss_counters():
+    cache = PrincipalCache(max_entries=10, ttl_seconds=60)
+    user = _snapshot()
+
+    assert cache.get("token") is None
+    cache.set("token", {"sub": str(user.id)}, user)
+    assert cache.get("token")[1] == user
+
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+    assert cache.stats()["hit_rate"] == 0.5
+
+def test_entries_never_outlive_token_expiry():
+    cache = PrincipalCache(max_entries=10, ttl_seconds=60)
+    cache.set("token", {"exp": time.time() - 1}, _snapshot())
+
+    assert cache.get("token") is None
+    assert cache.stats()["entries"] == 0
+
+def test_least_recently_used_entry_is_evicted():
+    cache = PrincipalCache(max_entries=2, ttl_seconds=60)
+    cache.set("a", {}, _snapshot())
+    cache.set("b", {}, _snapshot())
+    cache.get("a")
+    cache.set("c", {}, _snapshot())
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+
+def test_invalidate_user_drops_all_their_tokens():
+    cache = PrincipalCache(max_entries=10, ttl_seconds=60)
+    user, other = _snapshot(), _snapshot()
+    cache.set("laptop", {}, user)
+    cache.set("phone", {}, user)
+    cache.set("other", {}, other)
+
+    cache.invalidate_user(user.id)
+
+    assert cache.get("laptop") is None
+    assert cache.get("phone") is None
+    assert cache.get("other") is not None
+
+def test_profile_body_comes_from_the_database_not_the_cached_principal():
+    from dataclasses import replace
+
+    from fastapi.testclient import TestClient
+
+    from app.auth.dependencies import get_current_user
+    from main import app
+    from tests.fakes import RecordingSession, Row, override_db
+
+    stale = _snapshot()
+    fresh = replace(stale, bio="Written by the job worker", updated_at=datetime.utcnow())
+
+    def respond(statement):
+        if len(db.statements) == 1:
+            return [(fresh.updated_at, 0, None, 0, None)]  # the ETag aggregates
+        return [Row(**vars(fresh), projects=[], blogs=[], projects_total=0, blogs_total=0)]
+
+    db = RecordingSession(respond)
+    app.dependency_overrides[get_current_user] = lambda: stale
+    try:
+        with override_db(app, db):
+            response = TestClient(app).get("/api/auth/me")
+    finally:
+        app.dependency_overrides.pop(get_current_user)
+
+    assert response.status_code == 200
+    assert response.json()["bio"] == "Written by the job worker"
+    assert len(db.statements) == 2
+    assert "FROM users" in db.sql[1] and "json_agg" in db.sql[1]
@@ -0,0 +1,61 @@
+"""
+Tests for blog full-text search
+"""
+
+import uuid
+from datetime import datetime, timezone
+
+from fastapi.testclient import TestClient
+
+from app.blogs.models import Blog
+from app.database import data_columns
+from app.utils.pagination import decode_rank_cursor
+from main import app
+from tests.fakes import RecordingSession, Row, override_db
+
+def _hit(rank: float, **values) -> Row:
+    now = datetime.now(timezone.utc)
+    return Row(**{
+        "id": uuid.uuid4(), "user_id": uuid.uuid4(), "title": "Tuning Postgres", "summary": None,
+        "created_at": now, "updated_at": now, "rank": rank,
+        "title_highlight": "Tuning \x02Postgres\x03", "snippet": "… \x02postgres\x03 <3 …", **values,
+    })
+
+def _search(session: RecordingSession, **params):
+    with override_db(app, session):
+        return TestClient(app).get("/api/blogs/search", params=params)
+
+def test_full_page_returns_escaped_highlights_and_next_cursor():
+    rows = [_hit(0.5), _hit(0.25)]
+
+    response = _search(RecordingSession(lambda statement: rows), q="postgres", limit=2)
+
+    assert response.status_code == 200
+    hits = response.json()
+    assert [hit["rank"] for hit in hits] == [0.5, 0.25]
+    assert hits[0]["title_highlight"] == "Tuning <mark>Postgres</mark>"
+    # Post text is escaped before matches are marked
+    assert hits[0]["snippet"] == "… <mark>postgres</mark> &lt;3 …"
+    assert decode_rank_cursor(response.headers["X-Next-Cursor"]) == (0.25, rows[-1].id)
+
+def test_cursor_is_sent_back_as_the_keyset_position():
+    first = _search(RecordingSession(lambda statement: [_hit(0.5), _hit(0.25)]), q="postgres", limit=2)
+    db = RecordingSession(lambda statement: [_hit(0.1)])
+
+    second = _search(db, q="postgres", limit=2, cursor=first.headers["X-Next-Cursor"])
+
+    assert second.status_code == 200 and len(second.json()) == 1
+    # A short page is the last one
+    assert "X-Next-Cursor" not in second.headers
+    rank, blog_id = decode_rank_cursor(first.headers["X-Next-Cursor"])
+    assert {rank, blog_id} <= set(db.statements[0].compile().params.values())
+
+def test_invalid_requests_are_rejected():
+    assert _search(RecordingSession(), q="postgres", cursor="not-a-cursor").status_code == 400
+    assert _search(RecordingSession(), q="").status_code == 422
+    assert _search(RecordingSession(), q="postgres", limit=500).status_code == 422
+
+def test_search_vector_is_generated_and_never_returned():
+    column = Blog.__table__.c.search_vector
+    assert column.computed is not None and column.computed.persisted
+    assert column not in data_columns(Blog.__table__)
@@ -0,0 +1,118 @@
+"""
+Tests for bulk create parsing, validation and chunked inserts
+"""
+
+import asyncio
+import json
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+from fastapi import HTTPException, Request
+from fastapi.testclient import TestClient
+
+from app.projects.models import Project
+from app.projects.schemas import ProjectCreate
+from app.utils import bulk
+from main import app
+from tests.fakes import RecordingSession, Row, override_db
+
+def _request(body: bytes, content_type: str, chunk_size: int = 7) -> Request:
+    """A request whose body arrives in small chunks"""
+    chunks = [body[i:i + chunk_size] for i in range(0, len(body), chunk_size)] or [b""]
+
+    async def receive():
+        chunk = chunks.pop(0)
+        return {"type": "http.request", "body": chunk, "more_body": bool(chunks)}
+
+    scope = {"type": "http", "method": "POST", "headers": [(b"content-type", content_type.encode())]}
+    return Request(scope, receive)
+
+def _inserted_ids(statement) -> list:
+    return [value for key, value in statement.compile().params.items() if key.startswith("id_m")]
+
+def bulk_session(user_ids=()) -> RecordingSession:
+    """Knows which users exist; answers inserts with their rows in reverse order"""
+    def respond(statement):
+        if statement.is_insert:
+            return [Row(id=row_id) for row_id in reversed(_inserted_ids(statement))]
+        return list(user_ids)
+    return RecordingSession(respond)
+
+def test_ndjson_items_are_validated_individually():
+    user_id = uuid.uuid4()
+    lines = [
+        json.dumps({"user_id": str(user_id), "title": "Good"}),
+        "{not json",
+        json.dumps({"user_id": str(user_id)}),
+        "",
+        json.dumps({"user_id": str(uuid.uuid4()), "title": "Orphan"}),
+        json.dumps({"user_id": str(user_id), "title": "Also good", "tech_stack": ["Go"]}),
+    ]
+    request = _request("\n".join(lines).encode(), "application/x-ndjson")
+
+    valid, errors = asyncio.run(bulk.read_bulk_items(request, bulk_session([user_id]), ProjectCreate))
+
+    assert [index for index, _ in valid] == [0, 4]
+    assert [item.title for _, item in valid] == ["Good", "Also good"]
+    assert [(e.index, e.error.split(":")[0]) for e in errors] == [(1, "Invalid JSON"), (2, "title"), (3, "User not found")]
+
+def test_json_array_and_limits(monkeypatch):
+    user_id = uuid.uuid4()
+    body = json.dumps([{"user_id": str(user_id), "title": f"P{i}"} for i in range(3)]).encode()
+
+    valid, errors = asyncio.run(
+        bulk.read_bulk_items(_request(body, "application/json"), bulk_session([user_id]), ProjectCreate)
+    )
+    assert len(valid) == 3 and errors == []
+
+    monkeypatch.setattr(bulk, "BULK_MAX_ITEMS", 2)
+    with pytest.raises(HTTPException) as error:
+        asyncio.run(bulk.read_bulk_items(_request(body, "application/json"), bulk_session(), ProjectCreate))
+    assert error.value.status_code == 413
+
+    with pytest.raises(HTTPException) as error:
+        asyncio.run(bulk.read_bulk_items(_request(b'{"title": "x"}', "application/json"), bulk_session(), ProjectCreate))
+    assert error.value.status_code == 400
+
+def test_insert_is_chunked_in_one_transaction_and_keeps_input_order(monkeypatch):
+    monkeypatch.setattr(bulk, "BULK_CHUNK_SIZE", 2)
+    user_id = uuid.uuid4()
+    items = [ProjectCreate(user_id=user_id, title=f"P{i}") for i in range(5)]
+    db = bulk_session()
+
+    created = asyncio.run(bulk.bulk_insert(db, Project, items))
+
+    assert len(db.statements) == 3 and db.commits == 1
+    assert [row.id for row in created] == [row_id for statement in db.statements for row_id in _inserted_ids(statement)]
+
+def test_bulk_endpoint_reports_created_rows_and_errors():
+    user_id = uuid.uuid4()
+    now = datetime.now(timezone.utc)
+
+    def respond(statement):
+        if not statement.is_insert:
+            return [user_id]
+        params = statement.compile().params
+        return [
+            Row(
+                id=params[f"id_m{i}"], user_id=params[f"user_id_m{i}"], title=params[f"title_m{i}"],
+                content=params[f"content_m{i}"], summary=None, created_at=now, updated_at=now,
+            )
+            for i in range(len(_inserted_ids(statement)))
+        ]
+
+    body = "\n".join([
+        json.dumps({"user_id": str(user_id), "title": "First", "content": "a"}),
+        json.dumps({"user_id": str(user_id), "title": "No content"}),
+        json.dumps({"user_id": str(user_id), "title": "Second", "content": "b"}),
+    ])
+    with override_db(app, RecordingSession(respond)) as db:
+        response = TestClient(app).post(
+            "/api/blogs/bulk", content=body, headers={"Content-Type": "application/x-ndjson"}
+        )
+
+    assert response.status_code == 200
+    assert [blog["title"] for blog in response.json()["created"]] == ["First", "Second"]
+    assert [(error["index"], error["error"].split(":")[0]) for error in response.json()["errors"]] == [(1, "content")]
+    assert db.commits == 1
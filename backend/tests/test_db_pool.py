@@ -0,0 +1,28 @@
+"""
+Tests for connection pool wait metrics
+"""
+
+import asyncio
+import sqlite3
+
+from sqlalchemy.util import greenlet_spawn
+
+from app.database import TimedQueuePool, pool_wait_seconds
+
+def test_pool_records_time_spent_waiting_for_a_connection():
+    pool = TimedQueuePool(lambda: sqlite3.connect(":memory:", check_same_thread=False), pool_size=1, max_overflow=0)
+    before = pool_wait_seconds.snapshot()
+
+    async def main():
+        held = await greenlet_spawn(pool.connect)
+        waiter = asyncio.create_task(greenlet_spawn(pool.connect))
+        await asyncio.sleep(0.05)
+        held.close()
+        (await waiter).close()
+
+    asyncio.run(main())
+    after = pool_wait_seconds.snapshot()
+
+    # Every checkout is timed, not only those made through get_async_db
+    assert after["count"] - before["count"] == 2
+    assert after["sum"] - before["sum"] >= 0.04
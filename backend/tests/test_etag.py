@@ -0,0 +1,89 @@
+"""
+Tests for ETag / Last-Modified validators and conditional GET
+"""
+
+import uuid
+from datetime import datetime, timezone
+
+from fastapi import Request, Response
+from fastapi.testclient import TestClient
+
+from app.utils.etag import not_modified, set_validators
+from main import app
+from tests.fakes import FakeResult, RecordingSession, Row, override_db
+
+ETAG = '"abc123"'
+LAST_MODIFIED = datetime(2024, 5, 1, 12, 0, 30, 500, tzinfo=timezone.utc)
+
+def _request(**headers) -> Request:
+    return Request({
+        "type": "http",
+        "method": "GET",
+        "path": "/",
+        "query_string": b"",
+        "headers": [(name.replace("_", "-").encode(), value.encode()) for name, value in headers.items()],
+    })
+
+def test_if_none_match_accepts_weak_lists_and_star():
+    assert not_modified(_request(if_none_match=ETAG), ETAG, None).status_code == 304
+    assert not_modified(_request(if_none_match=f'"other", W/{ETAG}'), ETAG, None) is not None
+    assert not_modified(_request(if_none_match="*"), ETAG, None) is not None
+    assert not_modified(_request(if_none_match='"other"'), ETAG, None) is None
+
+def test_if_modified_since_only_without_if_none_match():
+    since = "Wed, 01 May 2024 12:00:30 GMT"
+
+    # Sub-second precision is dropped before comparing with the HTTP date
+    assert not_modified(_request(if_modified_since=since), ETAG, LAST_MODIFIED) is not None
+    assert not_modified(_request(if_modified_since="Wed, 01 May 2024 12:00:29 GMT"), ETAG, LAST_MODIFIED) is None
+    assert not_modified(_request(if_modified_since="not a date"), ETAG, LAST_MODIFIED) is None
+    # A stale ETag wins over a fresh date
+    assert not_modified(_request(if_none_match='"other"', if_modified_since=since), ETAG, LAST_MODIFIED) is None
+    # Aggregates pass no Last-Modified, so dates alone never produce a 304
+    assert not_modified(_request(if_modified_since=since), ETAG, None) is None
+
+def test_set_validators_headers():
+    public, private, undated = Response(), Response(), Response()
+
+    set_validators(public, ETAG, LAST_MODIFIED)
+    set_validators(private, ETAG, LAST_MODIFIED, private=True)
+    set_validators(undated, ETAG, None)
+
+    assert public.headers["ETag"] == ETAG
+    assert public.headers["Last-Modified"] == "Wed, 01 May 2024 12:00:30 GMT"
+    assert public.headers["Cache-Control"] == "no-cache"
+    assert private.headers["Cache-Control"] == "private, no-cache"
+    assert "Last-Modified" not in undated.headers
+
+def _blog() -> Row:
+    now = datetime.now(timezone.utc)
+    return Row(
+        id=uuid.uuid4(), user_id=uuid.uuid4(), title="Tuning Postgres", content="...",
+        summary=None, created_at=now, updated_at=now,
+    )
+
+def _list(blogs, **headers):
+    db = RecordingSession(lambda statement: FakeResult(blogs))
+    with override_db(app, db):
+        return db, TestClient(app).get("/api/blogs/", params={"limit": 10}, headers=headers)
+
+def test_list_revalidates_with_a_single_query():
+    blogs = [_blog(), _blog()]
+    _, response = _list(blogs)
+
+    db, cached = _list(blogs, **{"If-None-Match": response.headers["ETag"]})
+
+    assert response.status_code == 200 and "Last-Modified" not in response.headers
+    assert cached.status_code == 304 and cached.content == b""
+    assert cached.headers["ETag"] == response.headers["ETag"]
+    # The page query doubles as the validator: no count/max(updated_at) round trip
+    assert len(db.statements) == 1
+
+def test_list_etag_changes_when_a_row_is_deleted():
+    blogs = [_blog(), _blog()]
+    _, response = _list(blogs)
+
+    _, after_delete = _list(blogs[:1], **{"If-None-Match": response.headers["ETag"]})
+
+    assert after_delete.status_code == 200
+    assert after_delete.headers["ETag"] != response.headers["ETag"]
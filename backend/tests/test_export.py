@@ -0,0 +1,81 @@
+"""
+Tests for streaming NDJSON/CSV exports
+"""
+
+import asyncio
+import csv
+import io
+import json
+import tracemalloc
+import uuid
+from datetime import datetime, timezone
+
+import httpx
+
+from app.utils.export import encode_csv, encode_ndjson, encode_partitions
+from main import app
+
+ROW = {
+    "id": uuid.UUID("00000000-0000-0000-0000-000000000001"),
+    "title": 'Quotes "and", commas',
+    "tech_stack": ["Python", "React"],
+    "summary": None,
+    "created_at": datetime(2024, 5, 1, 12, 30, tzinfo=timezone.utc),
+}
+COLUMNS = list(ROW)
+
+def test_ndjson_encodes_native_types():
+    line = json.loads(encode_ndjson([ROW]))
+
+    assert line["id"] == "00000000-0000-0000-0000-000000000001"
+    assert line["tech_stack"] == ["Python", "React"]
+    assert line["summary"] is None
+    assert line["created_at"] == "2024-05-01T12:30:00+00:00"
+
+def test_csv_quotes_text_and_serializes_lists():
+    text = encode_csv([ROW], COLUMNS, header=True).decode()
+    header, row = list(csv.reader(io.StringIO(text)))
+
+    assert header == COLUMNS
+    assert row[1] == 'Quotes "and", commas'
+    assert json.loads(row[2]) == ["Python", "React"]
+    assert row[3] == ""
+    assert row[4] == "2024-05-01T12:30:00+00:00"
+
+def _peak_memory(total_rows: int, export_format: str) -> int:
+    """Peak traced memory while encoding `total_rows` rows in partitions of 1000"""
+    async def partitions():
+        for start in range(0, total_rows, 1000):
+            yield [dict(ROW, title=f"Row {i}") for i in range(start, min(start + 1000, total_rows))]
+
+    async def consume():
+        size = 0
+        async for chunk in encode_partitions(partitions(), export_format, COLUMNS):
+            size += len(chunk)
+        return size
+
+    tracemalloc.start()
+    try:
+        asyncio.run(consume())
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def test_memory_stays_flat_as_row_count_grows():
+    for export_format in ("ndjson", "csv"):
+        small = _peak_memory(5_000, export_format)
+        large = _peak_memory(50_000, export_format)
+        assert large < small * 1.5, (export_format, small, large)
+
+def _get(path):
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.get(path)
+    return asyncio.run(scenario())
+
+def test_export_validates_format_and_fields_before_streaming():
+    assert _get("/api/projects/export?format=xml").status_code == 422
+    response = _get("/api/blogs/export?fields=title,bogus")
+    assert response.status_code == 400
+    assert "bogus" in response.json()["detail"]
@@ -0,0 +1,70 @@
+"""
+Tests for sparse fieldsets (`?fields=`) on list endpoints
+"""
+
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+
+from app.blogs.models import Blog
+from app.blogs.schemas import BlogResponse
+from app.utils.fieldsets import apply_fieldset, parse_fields, reduced_model
+from main import app
+from tests.fakes import FakeResult, RecordingSession, Row, override_db, sql
+
+def _blog() -> Row:
+    now = datetime.now(timezone.utc)
+    return Row(
+        id=uuid.uuid4(), user_id=uuid.uuid4(), title="Tuning Postgres", content="x" * 10_000,
+        summary="Indexes", created_at=now, updated_at=now,
+    )
+
+def _get(blogs, **params):
+    db = RecordingSession(lambda statement: FakeResult(blogs))
+    with override_db(app, db):
+        return db, TestClient(app).get("/api/blogs/", params=params)
+
+def test_parse_fields_adds_id_and_rejects_unknown_fields():
+    assert parse_fields(None, BlogResponse) is None
+    assert parse_fields(" title, summary ,", BlogResponse) == ("id", "summary", "title")
+
+    with pytest.raises(HTTPException) as error:
+        parse_fields("title,password,secret", BlogResponse)
+    assert error.value.status_code == 400
+    assert error.value.detail == "Unknown fields: password, secret"
+
+def test_reduced_model_is_cached_and_keeps_only_requested_fields():
+    model = reduced_model(BlogResponse, ("id", "title"))
+
+    assert reduced_model(BlogResponse, ("id", "title")) is model
+    assert set(model.model_fields) == {"id", "title"}
+    assert set(model.model_validate(_blog()).model_dump()) == {"id", "title"}
+
+def test_apply_fieldset_defers_unrequested_columns():
+    query, _ = apply_fieldset(select(Blog), Blog, BlogResponse, "title")
+    full_query, full_model = apply_fieldset(select(Blog), Blog, BlogResponse, None)
+
+    text = sql(query)
+    # Only the requested columns plus those cursors and page ETags need
+    for column in ("id", "title", "created_at", "updated_at"):
+        assert f"blogs.{column}" in text
+    assert "blogs.content" not in text and "blogs.summary" not in text
+    assert "blogs.content" in sql(full_query) and full_model is BlogResponse
+
+def test_list_returns_only_requested_keys():
+    db, response = _get([_blog()], fields="title,summary")
+
+    assert response.status_code == 200
+    assert set(response.json()[0]) == {"id", "title", "summary"}
+    assert "blogs.content" not in db.sql[0]
+
+def test_list_rejects_unknown_fields_before_querying():
+    db, response = _get([_blog()], fields="title,content_html")
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Unknown fields: content_html"
+    assert db.statements == []
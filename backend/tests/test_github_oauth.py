@@ -0,0 +1,144 @@
+"""
+Tests for the GitHub OAuth callback against a local fake GitHub server
+"""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from app.auth import github, jwt_utils, router as auth_router
+from main import app
+from tests.fakes import FakeGitHubServer, RecordingSession, Row, override_db, sql
+
+def _upsert_row(statement):
+    """Answer the login upsert with the row it would return"""
+    params = statement.compile().params
+    return [Row(id=params["id"], email=params["email"], github_id=params["github_id"])]
+
+@pytest.fixture
+def fake_github(monkeypatch):
+    """Point the OAuth callback at a slow local fake GitHub"""
+    with FakeGitHubServer(delay=0.3) as server, override_db(app, RecordingSession(_upsert_row)) as session:
+        monkeypatch.setattr(github, "GITHUB_OAUTH_URL", server.base_url)
+        monkeypatch.setattr(github, "GITHUB_API_URL", server.base_url)
+        monkeypatch.setattr(github, "GITHUB_RETRY_BASE_SECONDS", 0.01)
+        monkeypatch.setattr(github, "_client", None)
+        monkeypatch.setattr(jwt_utils, "SECRET_KEY", "test-secret")
+        monkeypatch.setattr(auth_router, "FRONTEND_URL", "http://frontend.test")
+        server.session = session
+        yield server
+
+def _run(coro):
+    async def wrapper():
+        try:
+            return await coro
+        finally:
+            await github.close_client()
+    return asyncio.run(wrapper())
+
+def test_login_burst_does_not_block_other_endpoints(fake_github):
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            logins = [
+                asyncio.create_task(client.get(f"/api/auth/github/callback?code=c{i}&state=devsnap_oauth"))
+                for i in range(20)
+            ]
+            await asyncio.sleep(0.1)  # let the logins reach the fake GitHub
+
+            latencies = []
+            for _ in range(5):
+                start = time.perf_counter()
+                response = await client.get("/health")
+                latencies.append(time.perf_counter() - start)
+                assert response.status_code == 200
+
+            return latencies, await asyncio.gather(*logins)
+
+    start = time.perf_counter()
+    latencies, responses = _run(scenario())
+    elapsed = time.perf_counter() - start
+
+    assert max(latencies) < 0.1
+    assert all(r.status_code == 307 for r in responses)
+    assert all(r.headers["location"].startswith("http://frontend.test/auth/callback?token=") for r in responses)
+    # One upsert and one commit per login
+    assert len(fake_github.session.statements) == 20
+    assert fake_github.session.commits == 20
+    # Logins overlap: 20 x (token + user) at 0.3s each would take 12s serially
+    assert elapsed < 3
+    # Keep-alive: the user lookup reuses the token exchange's connection
+    assert len(fake_github.peers) <= 20
+
+def test_user_lookup_is_retried_on_503(fake_github):
+    fake_github.delay = 0.01
+    fake_github.unavailable = 2
+
+    user = _run(github.fetch_user("gho_retry"))
+
+    assert user["login"] == "dev-retry"
+    assert fake_github.user_requests == 3
+
+def test_rejected_code_returns_400(fake_github):
+    fake_github.delay = 0.01
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.get("/api/auth/github/callback?code=bad-code&state=devsnap_oauth")
+
+    response = _run(scenario())
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Access token not received"
+
+def test_github_timeout_returns_502(fake_github, monkeypatch):
+    monkeypatch.setattr(github, "GITHUB_TIMEOUT_SECONDS", 0.05)
+    monkeypatch.setattr(github, "GITHUB_MAX_RETRIES", 0)
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.get("/api/auth/github/callback?code=slow&state=devsnap_oauth")
+
+    response = _run(scenario())
+
+    assert response.status_code == 502
+
+def test_login_is_a_single_upsert(fake_github):
+    """Provisioning is one INSERT ... ON CONFLICT ... RETURNING, with no prior SELECT"""
+    fake_github.delay = 0.01
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.get("/api/auth/github/callback?code=octo&state=devsnap_oauth")
+
+    response = _run(scenario())
+
+    assert response.status_code == 307
+    token = response.headers["location"].split("token=", 1)[1].split("&", 1)[0]
+    claims = jwt_utils.verify_token(token)
+    assert claims["email"] == "octo@example.com"
+
+    session = fake_github.session
+    assert len(session.statements) == 1 and session.commits == 1
+    (statement,) = session.statements
+    assert statement.is_insert and "ON CONFLICT (github_id) DO UPDATE" in sql(statement)
+    # updated_at (and so profile ETags) only moves when the profile changed
+    assert "IS DISTINCT FROM excluded.name" in sql(statement)
+    params = statement.compile().params
+    assert claims["sub"] == str(params["id"]) and claims["github_id"] == params["github_id"]
+    assert params["github_username"] == "dev-octo"
+
+def test_client_pool_uses_the_configured_connection_limit(monkeypatch):
+    monkeypatch.setattr(github, "_client", None)
+    monkeypatch.setattr(github, "GITHUB_MAX_CONNECTIONS", 7)
+
+    pool = github.get_client()._transport._pool
+
+    assert pool._max_connections == 7
+    assert pool._max_keepalive_connections == 7
+    asyncio.run(github.close_client())
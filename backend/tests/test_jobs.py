@@ -0,0 +1,55 @@
+"""
+Tests for the background job queue
+"""
+
+import asyncio
+
+from app.jobs import worker
+from tests.fakes import FakeResult, RecordingSession, run_ai, sql
+
+def test_claim_skips_rows_locked_by_other_workers():
+    """Claims lock one pending row with SKIP LOCKED and mark it running"""
+    text = sql(worker.claim_statement("host:1:0"))
+
+    assert "FOR UPDATE SKIP LOCKED" in text
+    assert "LIMIT" in text
+    assert "RETURNING" in text
+    assert "status=%(status)s" in text.replace(" ", "")
+    # Jobs that used up their attempts are never claimed again
+    assert "jobs.attempts < jobs.max_attempts" in text
+
+def test_retry_delay_doubles(monkeypatch):
+    monkeypatch.setattr(worker, "JOB_RETRY_BASE_SECONDS", 5)
+    assert [worker.retry_delay(n).total_seconds() for n in (1, 2, 3)] == [5, 10, 20]
+
+def test_every_job_kind_generates_text(fake_openai):
+    """Each job kind maps to an AIService call that returns the completion"""
+    fake_openai.delay = 0.01
+    prompt_info = {
+        "bio": {"name": "Dev", "skills": ["Python"]},
+        "project_summary": {"title": "DevSnap", "tech_stack": ["FastAPI"]},
+        "blog_summary": {"title": "Async SQL", "content": "Use SKIP LOCKED for queues."},
+    }
+
+    async def scenario():
+        return await asyncio.gather(*[
+            worker.JOB_TASKS[kind].generate(info, False) for kind, info in prompt_info.items()
+        ])
+
+    assert run_ai(scenario()) == ["Fake completion."] * 3
+    prompts = [r["messages"][1]["content"] for r in fake_openai.requests]
+    assert any("Use SKIP LOCKED for queues." in p for p in prompts)
+
+def test_reaper_fails_exhausted_jobs_and_requeues_the_rest(monkeypatch):
+    rowcounts = iter([1, 2])
+    db = RecordingSession(lambda statement: FakeResult(rowcount=next(rowcounts)))
+    monkeypatch.setattr(worker, "AsyncSessionLocal", db)
+
+    assert asyncio.run(worker.requeue_stale_jobs()) == (2, 1)
+
+    failed, requeued = [statement.compile().params for statement in db.statements]
+    assert failed["status"] == "failed" and failed["error"]
+    assert requeued["status"] == "pending"
+    assert "jobs.attempts >= jobs.max_attempts" in sql(db.statements[0])
+    assert "jobs.attempts < jobs.max_attempts" in sql(db.statements[1])
+    assert db.commits == 1
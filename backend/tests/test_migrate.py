@@ -0,0 +1,85 @@
+"""
+Tests for schema migrations run at startup or with `python -m app.migrate`
+"""
+
+from sqlalchemy.dialects import postgresql
+
+from app import migrate as migrations
+from app.database import create_missing_indexes, drop_obsolete_indexes
+from tests.fakes import FakeResult, sql
+
+class FakeConnection:
+    """Records statements from both SQLAlchemy and raw-SQL calls"""
+
+    def __init__(self, log: list, invalid=()):
+        self.log = log
+        self.invalid = invalid
+        self.options = {}
+
+    def execution_options(self, **options):
+        self.options.update(options)
+        return self
+
+    def execute(self, statement):
+        self.log.append(sql(statement))
+
+    def exec_driver_sql(self, statement):
+        self.log.append(statement)
+        return FakeResult(self.invalid if "indisvalid" in statement else ())
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+class FakeBind:
+    dialect = postgresql.dialect()
+
+    def __init__(self, invalid=()):
+        self.log = []
+        self.connections = []
+        self.invalid = invalid
+
+    def connect(self):
+        connection = FakeConnection(self.log, self.invalid)
+        self.connections.append(connection)
+        return connection
+
+def test_indexes_are_built_concurrently_and_invalid_ones_rebuilt():
+    bind = FakeBind(invalid=["ix_blogs_search_vector"])
+
+    create_missing_indexes(bind)
+
+    assert bind.connections[0].options == {"isolation_level": "AUTOCOMMIT"}
+    statements = bind.log[1:]
+    assert "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_blogs_search_vector ON blogs USING gin (search_vector)" in statements
+    assert all(text.startswith(("CREATE INDEX CONCURRENTLY IF NOT EXISTS ", "DROP INDEX CONCURRENTLY")) for text in statements)
+    drop = statements.index("DROP INDEX CONCURRENTLY IF EXISTS ix_blogs_search_vector")
+    assert statements[drop + 1].startswith("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_blogs_search_vector ")
+
+def test_migrations_run_inside_the_advisory_lock(monkeypatch):
+    bind = FakeBind()
+    steps = ("create_extensions", "add_missing_columns", "create_missing_indexes", "drop_obsolete_indexes", "ensure_facets_view")
+    for step in steps:
+        monkeypatch.setattr(migrations, step, lambda bind, step=step: bind.log.append(step))
+    monkeypatch.setattr(migrations.Base.metadata, "create_all", lambda bind: bind.log.append("create_all"))
+
+    migrations.migrate(bind)
+
+    assert bind.connections[0].options == {"isolation_level": "AUTOCOMMIT"}
+    assert "pg_advisory_lock" in bind.log[0] and "pg_advisory_unlock" in bind.log[-1]
+    assert bind.log[1:-1] == [
+        "create_extensions", "create_all", "add_missing_columns", "create_missing_indexes",
+        "drop_obsolete_indexes", "ensure_facets_view",
+    ]
+
+def test_obsolete_updated_at_indexes_are_dropped_concurrently():
+    bind = FakeBind()
+
+    drop_obsolete_indexes(bind)
+
+    assert bind.connections[0].options == {"isolation_level": "AUTOCOMMIT"}
+    assert bind.log == [
+        f"DROP INDEX CONCURRENTLY IF EXISTS ix_{table}_updated_at" for table in ("users", "projects", "blogs")
+    ]
@@ -0,0 +1,97 @@
+"""
+Tests for the UPDATE/DELETE ... RETURNING mutation helpers
+"""
+
+import uuid
+from datetime import datetime, timezone
+
+from fastapi.testclient import TestClient
+from sqlalchemy.exc import IntegrityError
+
+from app.utils.mutations import FOREIGN_KEY_VIOLATION, UNIQUE_VIOLATION
+from main import app
+from tests.fakes import RecordingSession, Row, override_db, sql
+
+def _project(**values) -> Row:
+    now = datetime.now(timezone.utc)
+    return Row(**{
+        "id": uuid.uuid4(), "user_id": uuid.uuid4(), "title": "DevSnap", "description": None,
+        "tech_stack": ["FastAPI"], "github_link": None, "demo_link": None, "summary": None,
+        "created_at": now, "updated_at": now, **values,
+    })
+
+class _PgError(Exception):
+    """Stand-in for asyncpg's exception, which carries the constraint name"""
+
+    def __init__(self, constraint_name):
+        super().__init__(constraint_name)
+        self.constraint_name = constraint_name
+
+def _integrity_error(sqlstate: str, constraint: str = None) -> IntegrityError:
+    orig = Exception("violation")
+    orig.sqlstate = sqlstate
+    orig.__cause__ = _PgError(constraint)
+    return IntegrityError("UPDATE ...", {}, orig)
+
+def _request(session: RecordingSession, method: str, path: str, **kwargs):
+    with override_db(app, session):
+        return TestClient(app, raise_server_exceptions=False).request(method, path, **kwargs)
+
+def test_update_is_one_returning_statement():
+    project = _project(title="New")
+    db = RecordingSession(lambda statement: [project])
+
+    response = _request(db, "PUT", f"/api/projects/{project.id}", json={"title": "New"})
+
+    assert response.status_code == 200
+    assert response.json()["id"] == str(project.id) and response.json()["title"] == "New"
+    assert len(db.statements) == 1 and db.commits == 1
+    assert db.statements[0].is_update
+    # updated_at is bumped so ETags and Last-Modified move
+    assert "updated_at=now()" in sql(db.statements[0])
+
+def test_missing_row_is_404_without_commit():
+    db = RecordingSession()
+
+    response = _request(db, "PUT", f"/api/projects/{uuid.uuid4()}", json={"title": "New"})
+
+    assert response.status_code == 404 and response.json()["detail"] == "Project not found"
+    assert db.commits == 0
+
+def test_delete_returns_id_or_404():
+    blog_id = uuid.uuid4()
+
+    deleted = _request(RecordingSession(lambda statement: [blog_id]), "DELETE", f"/api/blogs/{blog_id}")
+    missing = _request(RecordingSession(), "DELETE", f"/api/blogs/{blog_id}")
+
+    assert deleted.status_code == 200 and deleted.json() == {"message": "Blog deleted successfully"}
+    assert missing.status_code == 404 and missing.json()["detail"] == "Blog not found"
+
+def test_expected_violation_is_400():
+    db = RecordingSession(error=_integrity_error(FOREIGN_KEY_VIOLATION, "projects_user_id_fkey"))
+
+    response = _request(db, "PUT", f"/api/projects/{uuid.uuid4()}", json={"user_id": str(uuid.uuid4())})
+
+    assert response.status_code == 400 and response.json()["detail"] == "User not found"
+    assert db.rollbacks == 1 and db.commits == 0
+
+def test_constraint_name_picks_the_message():
+    email = RecordingSession(error=_integrity_error(UNIQUE_VIOLATION, "users_email_key"))
+    github = RecordingSession(error=_integrity_error(UNIQUE_VIOLATION, "users_github_id_key"))
+
+    email_response = _request(email, "PUT", f"/api/users/{uuid.uuid4()}", json={"email": "taken@example.com"})
+    github_response = _request(github, "PUT", f"/api/users/{uuid.uuid4()}", json={"github_id": "42"})
+
+    assert email_response.status_code == 400
+    assert email_response.json()["detail"] == "User with this email already exists"
+    assert github_response.status_code == 400
+    assert github_response.json()["detail"] == "User with this GitHub account already exists"
+
+def test_unexpected_violation_is_not_reported_as_a_conflict():
+    # e.g. a NOT NULL violation on PUT /projects is not "User not found"
+    db = RecordingSession(error=_integrity_error("23502"))
+
+    response = _request(db, "PUT", f"/api/projects/{uuid.uuid4()}", json={"title": None})
+
+    assert response.status_code == 500
+    assert db.rollbacks == 1 and db.commits == 0
@@ -0,0 +1,83 @@
+"""
+Tests for keyset (cursor) pagination on list endpoints
+"""
+
+import base64
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from fastapi.testclient import TestClient
+
+from app.utils.pagination import NEXT_CURSOR_HEADER, decode_cursor, encode_cursor
+from main import app
+from tests.fakes import FakeResult, RecordingSession, Row, override_db
+
+START = datetime(2024, 5, 1, 12, 0, tzinfo=timezone.utc)
+
+def _project(minutes: int) -> Row:
+    created_at = START + timedelta(minutes=minutes)
+    return Row(
+        id=uuid.uuid4(), user_id=uuid.uuid4(), title="DevSnap", description=None, tech_stack=None,
+        github_link=None, demo_link=None, summary=None, created_at=created_at, updated_at=created_at,
+    )
+
+def _get(projects, path: str = "/api/projects/", **params):
+    db = RecordingSession(lambda statement: FakeResult(projects))
+    with override_db(app, db):
+        return db, TestClient(app).get(path, params=params)
+
+def test_cursor_round_trip():
+    row_id = uuid.uuid4()
+
+    assert decode_cursor(encode_cursor(START, row_id)) == (START, row_id)
+
+def test_full_page_cursor_seeks_past_the_last_row():
+    page = [_project(0), _project(1)]
+    _, first = _get(page, limit=2)
+    cursor = first.headers[NEXT_CURSOR_HEADER]
+
+    db, second = _get([_project(2)], cursor=cursor, limit=2)
+
+    assert decode_cursor(cursor) == (page[-1].created_at, page[-1].id)
+    assert second.status_code == 200
+    text = db.sql[0]
+    assert "(projects.created_at, projects.id) > (" in text
+    assert "ORDER BY projects.created_at, projects.id" in text
+    assert "OFFSET" not in text
+
+def test_next_cursor_only_on_a_full_page():
+    _, full = _get([_project(0), _project(1)], limit=2)
+    _, short = _get([_project(0)], limit=2)
+    _, empty = _get([], limit=2)
+
+    assert NEXT_CURSOR_HEADER in full.headers
+    assert NEXT_CURSOR_HEADER not in short.headers
+    assert NEXT_CURSOR_HEADER not in empty.headers
+
+def test_tampered_cursor_is_rejected():
+    cursor = encode_cursor(START, uuid.uuid4())
+    tampered = base64.urlsafe_b64encode(b'["2024-05-01", "not-a-uuid"]').decode().rstrip("=")
+
+    for bad in (cursor[:-3], tampered, "%%%", "W10"):
+        db, response = _get([], cursor=bad)
+        assert response.status_code == 400, bad
+        assert response.json()["detail"] == "Invalid pagination cursor"
+        assert db.statements == []
+
+def test_user_listing_round_trips_in_both_orders():
+    user_id = uuid.uuid4()
+    path = f"/api/users/{user_id}/projects"
+    newest_first = [_project(1), _project(0)]
+
+    _, desc = _get(newest_first, path, limit=2)
+    desc_db, _ = _get([], path, limit=2, cursor=desc.headers[NEXT_CURSOR_HEADER])
+    _, asc = _get(newest_first[::-1], path, limit=2, order="asc")
+    asc_db, _ = _get([], path, limit=2, order="asc", cursor=asc.headers[NEXT_CURSOR_HEADER])
+
+    # Newest first by default: the next page seeks to older rows
+    assert decode_cursor(desc.headers[NEXT_CURSOR_HEADER]) == (START, newest_first[-1].id)
+    assert "(projects.created_at, projects.id) < (" in desc_db.sql[0]
+    assert "ORDER BY projects.created_at DESC, projects.id DESC" in desc_db.sql[0]
+    assert decode_cursor(asc.headers[NEXT_CURSOR_HEADER]) == (START + timedelta(minutes=1), newest_first[0].id)
+    assert "(projects.created_at, projects.id) > (" in asc_db.sql[0]
+    assert all("projects.user_id = " in text for text in desc_db.sql + asc_db.sql)
@@ -0,0 +1,109 @@
+"""
+Tests for tech-stack filtering and facet counts
+"""
+
+import asyncio
+import uuid
+from datetime import datetime, timezone
+
+from fastapi.testclient import TestClient
+
+from app.projects import facets
+from app.projects.facets import FacetRefresher
+from main import app
+from tests.fakes import FakeResult, RecordingSession, Row, override_db, sql
+
+def _project(tech_stack) -> Row:
+    now = datetime.now(timezone.utc)
+    return Row(
+        id=uuid.uuid4(), user_id=uuid.uuid4(), title="DevSnap", description=None, tech_stack=tech_stack,
+        github_link=None, demo_link=None, summary=None, created_at=now, updated_at=now,
+    )
+
+def _get(session: RecordingSession, path: str, **kwargs):
+    with override_db(app, session):
+        return TestClient(app).get(path, **kwargs)
+
+def _projects_session(projects) -> RecordingSession:
+    """Answers the page query with the given projects"""
+    return RecordingSession(lambda statement: FakeResult(projects))
+
+def test_tech_filter_all_and_any():
+    projects = [_project(["React", "AWS"])]
+    all_of = _projects_session(projects)
+    any_of = _projects_session(projects)
+
+    response = _get(all_of, "/api/projects/", params={"tech": ["React", "AWS"]})
+    any_response = _get(any_of, "/api/projects/", params={"tech": ["React", "AWS"], "match": "any"})
+
+    assert response.status_code == 200 and response.json()[0]["tech_stack"] == ["React", "AWS"]
+    assert any_response.status_code == 200
+    # The page is filtered with the GIN-indexable operators
+    assert len(all_of.statements) == 1
+    assert all("projects.tech_stack @> " in text for text in all_of.sql)
+    assert all("projects.tech_stack && " in text for text in any_of.sql)
+    assert _get(_projects_session([]), "/api/projects/", params={"tech": "Go", "match": "some"}).status_code == 422
+
+def test_filtered_and_unfiltered_lists_have_different_etags():
+    projects = [_project(["React"])]
+    unfiltered = _get(_projects_session(projects), "/api/projects/")
+    filtered = _get(_projects_session(projects), "/api/projects/", params={"tech": "React"})
+
+    assert unfiltered.headers["ETag"] != filtered.headers["ETag"]
+
+def _facet_session() -> RecordingSession:
+    refreshed_at = datetime(2024, 5, 1, 12, 0, tzinfo=timezone.utc)
+    return RecordingSession(lambda statement: [
+        Row(tech="Python", project_count=40, refreshed_at=refreshed_at),
+        Row(tech="React", project_count=25, refreshed_at=refreshed_at),
+    ])
+
+def test_facet_endpoint_supports_conditional_get():
+    response = _get(_facet_session(), "/api/projects/tech-facets")
+    cached = _get(_facet_session(), "/api/projects/tech-facets", headers={"If-None-Match": response.headers["ETag"]})
+
+    assert response.status_code == 200
+    assert response.json() == [{"tech": "Python", "project_count": 40}, {"tech": "React", "project_count": 25}]
+    assert response.headers["Last-Modified"] == "Wed, 01 May 2024 12:00:00 GMT"
+    assert cached.status_code == 304
+
+def test_facets_read_the_view_and_escape_the_prefix():
+    db = _facet_session()
+
+    response = _get(db, "/api/projects/tech-facets", params={"prefix": "c_", "limit": 10})
+
+    assert response.status_code == 200
+    assert "FROM project_tech_facets" in sql(db.statements[0])
+    assert "c\\_%" in db.statements[0].compile().params.values()
+    assert _get(_facet_session(), "/api/projects/tech-facets", params={"limit": 0}).status_code == 422
+
+def test_refresher_runs_periodically_and_stops(monkeypatch):
+    refreshes = []
+
+    async def fake_refresh():
+        refreshes.append(True)
+        return True
+
+    monkeypatch.setattr(facets, "TECH_FACETS_REFRESH_SECONDS", 0.05)
+    monkeypatch.setattr(facets, "refresh_facets", fake_refresh)
+
+    async def run():
+        refresher = FacetRefresher()
+        refresher.start()
+        await asyncio.sleep(0.18)
+        await refresher.stop()
+
+    asyncio.run(run())
+    assert 2 <= len(refreshes) <= 4
+
+def test_refresh_skips_when_another_process_holds_the_lock(monkeypatch):
+    locked = RecordingSession(lambda statement: [False])
+    free = RecordingSession(lambda statement: [True])
+
+    monkeypatch.setattr(facets, "AsyncSessionLocal", locked)
+    assert asyncio.run(facets.refresh_facets()) is False
+    assert len(locked.statements) == 1 and locked.commits == 0
+
+    monkeypatch.setattr(facets, "AsyncSessionLocal", free)
+    assert asyncio.run(facets.refresh_facets()) is True
+    assert "REFRESH MATERIALIZED VIEW CONCURRENTLY" in str(free.statements[1]) and free.commits == 1
@@ -0,0 +1,84 @@
+"""
+Tests for the trigram user directory search
+"""
+
+import uuid
+from datetime import datetime, timezone
+
+from fastapi.testclient import TestClient
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateIndex
+
+from app.users.models import User
+from app.utils.pagination import decode_rank_cursor
+from main import app
+from tests.fakes import RecordingSession, Row, override_db
+
+def _users(*ranks):
+    now = datetime.now(timezone.utc)
+    return [
+        Row(
+            id=uuid.uuid4(), name=f"Jane {i}", email=None, github_id=None, github_username=f"jane{i}",
+            bio="Long bio " * 50, profile_image=f"https://avatars.example/{i}.png", theme_preference="light",
+            created_at=now, updated_at=now, rank=rank,
+        )
+        for i, rank in enumerate(ranks)
+    ]
+
+def _get(session: RecordingSession, path: str, **params):
+    with override_db(app, session):
+        return TestClient(app).get(path, params=params)
+
+def test_trigram_indexes_on_name_and_username():
+    ddl = {
+        index.name: str(CreateIndex(index).compile(dialect=postgresql.dialect()))
+        for index in User.__table__.indexes
+    }
+
+    assert ddl["ix_users_name_trgm"] == "CREATE INDEX ix_users_name_trgm ON users USING gin (name gin_trgm_ops)"
+    assert ddl["ix_users_github_username_trgm"].endswith("USING gin (github_username gin_trgm_ops)")
+
+def test_full_search_pages_by_rank():
+    rows = _users(1.9, 1.5)
+
+    response = _get(RecordingSession(lambda statement: rows), "/api/users/search", q="jan", limit=2)
+
+    assert response.status_code == 200
+    assert [hit["rank"] for hit in response.json()] == [1.9, 1.5]
+    assert response.json()[0]["github_username"] == "jane0"
+    assert decode_rank_cursor(response.headers["X-Next-Cursor"]) == (1.5, rows[-1].id)
+
+def test_cursor_and_wildcards_reach_the_query():
+    first = _get(RecordingSession(lambda statement: _users(1.9, 1.5)), "/api/users/search", q="jan", limit=2)
+    db = RecordingSession(lambda statement: _users(1.2))
+
+    second = _get(db, "/api/users/search", q="ja_n", limit=2, cursor=first.headers["X-Next-Cursor"])
+
+    assert second.status_code == 200 and "X-Next-Cursor" not in second.headers
+    params = set(db.statements[0].compile().params.values())
+    # The keyset position, and the user's "_" matched literally in the prefix pattern
+    assert set(decode_rank_cursor(first.headers["X-Next-Cursor"])) <= params
+    assert "ja\\_n%" in params
+
+def test_typeahead_returns_only_id_name_and_avatar():
+    db = RecordingSession(lambda statement: _users(1.9))
+
+    response = _get(db, "/api/users/search/typeahead", q="jan")
+
+    assert response.status_code == 200
+    assert set(response.json()[0]) == {"id", "name", "profile_image"}
+    assert "X-Next-Cursor" not in response.headers
+    # Only the shown columns (plus the rank) are read
+    assert [column.name for column in db.statements[0].selected_columns] == ["id", "name", "profile_image", "rank"]
+
+def test_invalid_requests_are_rejected():
+    assert _get(RecordingSession(), "/api/users/search/typeahead", q="j").status_code == 422
+    assert _get(RecordingSession(), "/api/users/search/typeahead", q="jan", limit=50).status_code == 422
+    assert _get(RecordingSession(), "/api/users/search", q="jan", cursor="bogus").status_code == 400
+
+def test_blank_padded_queries_are_rejected_before_querying():
+    for path in ("/api/users/search", "/api/users/search/typeahead"):
+        for q in ("   ", " j "):
+            db = RecordingSession()
+            assert _get(db, path, q=q).status_code == 422, (path, q)
+            assert db.statements == []